@@ -1,4 +1,60 @@
-from cronkite.config import CronkiteConfig
-from cronkite.cronkite import Cronkite
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = ["Cronkite", "CronkiteConfig"]
+if TYPE_CHECKING:
+    from cronkite.cache import MemoryCache, ResponseCache, SQLiteCache
+    from cronkite.cascade import Cascade
+    from cronkite.config import CronkiteConfig
+    from cronkite.cronkite import AsyncCronkite, Cronkite
+    from cronkite.env import load_env
+    from cronkite.metrics import CallEvent, MetricsHook, MetricsRecorder, PrometheusExporter
+    from cronkite.models import Article, Location, Quote, Story, SubStory
+    from cronkite.scheduler import Priority, RateLimits, Scheduler
+    from cronkite.transport import HTTPPool
+    from cronkite.actions import StoryResult
+    from cronkite.worker import SQLiteQueue, SQLiteResultStore, Worker
+
+# Public names and the modules defining them. Each is imported on first
+# access, so `import cronkite` doesn't pay for openai and every action.
+_EXPORTS = {
+    "Article": "cronkite.models",
+    "AsyncCronkite": "cronkite.cronkite",
+    "Cronkite": "cronkite.cronkite",
+    "CallEvent": "cronkite.metrics",
+    "Cascade": "cronkite.cascade",
+    "CronkiteConfig": "cronkite.config",
+    "HTTPPool": "cronkite.transport",
+    "Location": "cronkite.models",
+    "MemoryCache": "cronkite.cache",
+    "MetricsHook": "cronkite.metrics",
+    "MetricsRecorder": "cronkite.metrics",
+    "Priority": "cronkite.scheduler",
+    "PrometheusExporter": "cronkite.metrics",
+    "Quote": "cronkite.models",
+    "RateLimits": "cronkite.scheduler",
+    "ResponseCache": "cronkite.cache",
+    "SQLiteCache": "cronkite.cache",
+    "SQLiteQueue": "cronkite.worker",
+    "SQLiteResultStore": "cronkite.worker",
+    "Scheduler": "cronkite.scheduler",
+    "Story": "cronkite.models",
+    "StoryResult": "cronkite.actions",
+    "SubStory": "cronkite.models",
+    "Worker": "cronkite.worker",
+    "load_env": "cronkite.env",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
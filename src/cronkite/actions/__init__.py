@@ -1,5 +1,56 @@
-from cronkite.actions.generate_story import generate_story
-from cronkite.actions.classify_stories import classify_stories
-from cronkite.actions.group_stories import group_stories
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = ["generate_story", "classify_stories", "group_stories"]
+if TYPE_CHECKING:
+    from cronkite.actions.generate_story import generate_story, generate_story_async
+    from cronkite.actions.generate_story_cascade import (
+        generate_story_cascade,
+        generate_story_cascade_async,
+    )
+    from cronkite.actions.generate_story_stream import (
+        generate_story_stream,
+        generate_story_stream_async,
+    )
+    from cronkite.actions.generate_stories import (
+        StoryResult,
+        generate_stories,
+        generate_stories_async,
+    )
+    from cronkite.actions.update_story import update_story, update_story_async
+    from cronkite.actions.classify_stories import classify_stories, classify_stories_async
+    from cronkite.actions.group_stories import group_stories, group_stories_async
+
+# Actions are imported on first access, so a worker that only classifies
+# never loads the story generation modules
+_EXPORTS = {
+    "generate_story": "cronkite.actions.generate_story",
+    "generate_story_async": "cronkite.actions.generate_story",
+    "generate_story_cascade": "cronkite.actions.generate_story_cascade",
+    "generate_story_cascade_async": "cronkite.actions.generate_story_cascade",
+    "generate_story_stream": "cronkite.actions.generate_story_stream",
+    "generate_story_stream_async": "cronkite.actions.generate_story_stream",
+    "StoryResult": "cronkite.actions.generate_stories",
+    "generate_stories": "cronkite.actions.generate_stories",
+    "generate_stories_async": "cronkite.actions.generate_stories",
+    "update_story": "cronkite.actions.update_story",
+    "update_story_async": "cronkite.actions.update_story",
+    "classify_stories": "cronkite.actions.classify_stories",
+    "classify_stories_async": "cronkite.actions.classify_stories",
+    "group_stories": "cronkite.actions.group_stories",
+    "group_stories_async": "cronkite.actions.group_stories",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
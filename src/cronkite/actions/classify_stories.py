@@ -1,22 +1,101 @@
+import asyncio
+import contextvars
 import json
-
-from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
 
 from cronkite.instructions.classify_stories import CLASSIFY_STORIES_COMPONENT
+from cronkite.instruction_builder import JSON_OBJECT_FORMAT, json_schema_format
+from cronkite.llm import AsyncLLMClient, LLMClient
+from cronkite.models import Story
+from cronkite.token_budget import count_tokens
+
+
+# Each call carries at most this many input tokens and stories, which keeps
+# the classifications list well within output-length limits
+CHUNK_TOKENS = 8000
+CHUNK_STORIES = 50
+
+# Extra rounds spent re-requesting stories missing from a response
+MISSING_RETRIES = 1
+
+# Per-story allowance for JSON keys and the index
+STORY_OVERHEAD_TOKENS = 16
+
+# Strict response schema used when structured outputs are enabled
+_SCHEMA_FORMAT = json_schema_format("classifications", [CLASSIFY_STORIES_COMPONENT])
 
 
 def classify_stories(
-    client: OpenAI,
+    llm: LLMClient,
     model: str,
     stories: list[dict],
+    max_concurrency: int = 8,
+    structured_outputs: bool = False,
 ) -> list[dict]:
     """
     Classify stories by topic.
 
+    Stories are split into chunks by token budget and classified in
+    parallel; stories missing from a response are re-requested.
+
+    Args:
+        llm: LLMClient used for model calls
+        model: Model identifier (e.g., "gpt-4o")
+        stories: List of story dicts with title, summary, key_points, etc.
+        max_concurrency: Maximum number of chunk calls in flight at once
+        structured_outputs: Constrain responses to a strict JSON Schema
+
+    Returns:
+        List of story dicts with 'topics' field added to each
+    """
+    if not stories:
+        return []
+
+    instruction = _build_instruction(structured_outputs)
+    response_format = _response_format(structured_outputs)
+    topics = {}
+    pending = list(range(len(stories)))
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        for attempt in range(1 + MISSING_RETRIES):
+            if attempt:
+                llm.stats.add(classifications_rerequested=len(pending))
+            chunks = _chunk_stories(stories, pending, model)
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    _classify_chunk, llm, model, instruction, response_format, stories, chunk,
+                )
+                for chunk in chunks
+            ]
+            for future in futures:
+                topics.update(future.result())
+
+            pending = [i for i in pending if i not in topics]
+            if not pending:
+                break
+
+    return _apply_topics(llm, stories, topics, pending)
+
+
+async def classify_stories_async(
+    llm: AsyncLLMClient,
+    model: str,
+    stories: list[dict],
+    max_concurrency: int = 8,
+    structured_outputs: bool = False,
+) -> list[dict]:
+    """
+    Async variant of classify_stories.
+
     Args:
-        client: OpenAI client instance
+        llm: AsyncLLMClient used for model calls
         model: Model identifier (e.g., "gpt-4o")
         stories: List of story dicts with title, summary, key_points, etc.
+        max_concurrency: Maximum number of chunk calls in flight at once
+        structured_outputs: Constrain responses to a strict JSON Schema
 
     Returns:
         List of story dicts with 'topics' field added to each
@@ -24,44 +103,135 @@ def classify_stories(
     if not stories:
         return []
 
-    instruction = _build_instruction(CLASSIFY_STORIES_COMPONENT)
+    instruction = _build_instruction(structured_outputs)
+    response_format = _response_format(structured_outputs)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(chunk: list[int]) -> dict[int, list[str]]:
+        async with semaphore:
+            payload = _stories_payload(stories, chunk)
+            result = await llm.complete_json(model, instruction, payload, response_format, "classify_stories")
+            return _chunk_topics(result, chunk)
+
+    topics = {}
+    pending = list(range(len(stories)))
+    for attempt in range(1 + MISSING_RETRIES):
+        if attempt:
+            llm.stats.add(classifications_rerequested=len(pending))
+        chunks = _chunk_stories(stories, pending, model)
+        for chunk_topics in await asyncio.gather(*(bounded(chunk) for chunk in chunks)):
+            topics.update(chunk_topics)
+
+        pending = [i for i in pending if i not in topics]
+        if not pending:
+            break
+
+    return _apply_topics(llm, stories, topics, pending)
+
+
+def _chunk_stories(stories: list[dict], indices: list[int], model: str) -> list[list[int]]:
+    """Split story indices into chunks bounded by token count and size."""
+    chunks = []
+    current = []
+    current_tokens = 0
+
+    for i in indices:
+        tokens = _story_tokens(stories[i], model)
+        if current and (current_tokens + tokens > CHUNK_TOKENS or len(current) >= CHUNK_STORIES):
+            chunks.append(current)
+            current, current_tokens = [], 0
+        current.append(i)
+        current_tokens += tokens
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _story_tokens(story: dict, model: str) -> int:
+    """Estimate the tokens a story contributes to a classification payload."""
+    text = " ".join([story.get("title", ""), story.get("summary", ""), *story.get("key_points", [])])
+    return count_tokens(text, model) + STORY_OVERHEAD_TOKENS
+
+
+def _classify_chunk(
+    llm: LLMClient,
+    model: str,
+    instruction: str,
+    response_format: dict,
+    stories: list[dict],
+    chunk: list[int],
+) -> dict[int, list[str]]:
+    """Classify one chunk of stories."""
+    payload = _stories_payload(stories, chunk)
+    result = llm.complete_json(model, instruction, payload, response_format, "classify_stories")
+    return _chunk_topics(result, chunk)
+
+
+def _stories_payload(stories: list[dict], chunk: list[int]) -> str:
+    """Serialize a chunk of stories, indexed from zero, for a classification call."""
     stories_for_llm = [
         {
-            "index": i,
-            "title": story.get("title", ""),
-            "summary": story.get("summary", ""),
-            "key_points": story.get("key_points", []),
+            "index": local,
+            "title": stories[i].get("title", ""),
+            "summary": stories[i].get("summary", ""),
+            "key_points": stories[i].get("key_points", []),
         }
-        for i, story in enumerate(stories)
+        for local, i in enumerate(chunk)
     ]
 
-    response = client.chat.completions.create(
-        model=model,
-        messages=[
-            {"role": "system", "content": instruction},
-            {"role": "user", "content": json.dumps(stories_for_llm)},
-        ],
-        response_format={"type": "json_object"},
-    )
-
-    result = json.loads(response.choices[0].message.content)
-    classifications = {
-        c["story_index"]: c["topics"]
-        for c in result.get("classifications", [])
-    }
+    return json.dumps(stories_for_llm)
+
 
+def _chunk_topics(result: dict, chunk: list[int]) -> dict[int, list[str]]:
+    """Map a chunk's classifications back to story indices."""
+    topics = {}
+    for c in result.get("classifications", []):
+        local = c.get("story_index")
+        if isinstance(local, int) and 0 <= local < len(chunk) and "topics" in c:
+            topics[chunk[local]] = c["topics"]
+    return topics
+
+
+def _apply_topics(
+    llm: LLMClient | AsyncLLMClient,
+    stories: list[dict],
+    topics: dict[int, list[str]],
+    unresolved: list[int],
+) -> list[dict]:
+    """
+    Attach topics to each story, defaulting unresolved stories to [].
+
+    Story records get a new Story with topics set; dicts get a copy.
+    """
+    if unresolved:
+        llm.stats.add(classifications_unresolved=len(unresolved))
     return [
-        {**story, "topics": classifications.get(i, [])}
+        replace(story, topics=tuple(topics.get(i, [])))
+        if isinstance(story, Story)
+        else {**story, "topics": topics.get(i, [])}
         for i, story in enumerate(stories)
     ]
 
 
-def _build_instruction(component: dict) -> str:
-    """Build instruction for classification from a component."""
+@lru_cache(maxsize=2)
+def _build_instruction(structured_outputs: bool = False) -> str:
+    """
+    Build instruction for classification, compiled once.
+
+    With structured outputs the schema travels in the response_format, so
+    the prose schema section is left out.
+    """
+    component = CLASSIFY_STORIES_COMPONENT
     parts = [
         "You are a news classification system. Analyze the provided stories and classify them by topic.",
         "",
         component["task"],
+    ]
+    if structured_outputs:
+        return "\n".join(parts)
+
+    parts += [
         "",
         "## Expected Output",
         "",
@@ -74,3 +244,11 @@ def _build_instruction(component: dict) -> str:
         f'- {component["output_field"]} ({component["output_type"]}): e.g., {component["output_example"]}',
     ]
     return "\n".join(parts)
+
+
+def _response_format(structured_outputs: bool) -> dict:
+    """Return the strict schema response_format, or plain JSON mode."""
+    if not structured_outputs:
+        return JSON_OBJECT_FORMAT
+    return _SCHEMA_FORMAT
+
@@ -0,0 +1,137 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+
+from cronkite.cascade import Cascade
+from cronkite.config import CronkiteConfig
+from cronkite.actions.generate_story import generate_story, generate_story_async
+from cronkite.actions.generate_story_cascade import (
+    generate_story_cascade,
+    generate_story_cascade_async,
+)
+from cronkite.llm import AsyncLLMClient, LLMClient
+from cronkite.scheduler import Priority, scheduling_priority
+
+
+@dataclass
+class StoryResult:
+    """Outcome of generating a story for one cluster in a batch."""
+
+    index: int
+    story: dict | None
+    error: Exception | None
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        """Whether the story was generated successfully."""
+        return self.error is None
+
+
+def generate_stories(
+    llm: LLMClient,
+    model: str,
+    clusters: Iterable[list[dict]],
+    config: CronkiteConfig,
+    max_concurrency: int = 8,
+    cascade: Cascade | None = None,
+) -> Iterator[StoryResult]:
+    """
+    Generate stories for many clusters in parallel on a shared client.
+
+    Args:
+        llm: LLMClient shared by all clusters
+        model: Model identifier (e.g., "gpt-4o")
+        clusters: Iterable of article lists, one per cluster
+        config: Pipeline configuration
+        max_concurrency: Maximum number of clusters processed at once
+        cascade: Try cascade.model first, escalating to model per cluster
+
+    Yields:
+        StoryResult for each cluster in completion order. A failing cluster
+        yields a result with its error set instead of aborting the batch.
+        Calls are made at batch priority so interactive requests sharing
+        the scheduler go first.
+    """
+    executor = ThreadPoolExecutor(max_workers=max_concurrency)
+    try:
+        futures = [
+            executor.submit(_timed_generate_story, llm, model, index, articles, config, cascade)
+            for index, articles in enumerate(clusters)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+async def generate_stories_async(
+    llm: AsyncLLMClient,
+    model: str,
+    clusters: Iterable[list[dict]],
+    config: CronkiteConfig,
+    max_concurrency: int = 8,
+    cascade: Cascade | None = None,
+) -> AsyncIterator[StoryResult]:
+    """
+    Async variant of generate_stories.
+
+    Args:
+        llm: AsyncLLMClient shared by all clusters
+        model: Model identifier (e.g., "gpt-4o")
+        clusters: Iterable of article lists, one per cluster
+        config: Pipeline configuration
+        max_concurrency: Maximum number of clusters processed at once
+        cascade: Try cascade.model first, escalating to model per cluster
+
+    Yields:
+        StoryResult for each cluster in completion order.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(index: int, articles: list[dict]) -> StoryResult:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                with scheduling_priority(Priority.BATCH):
+                    if cascade is not None:
+                        story = await generate_story_cascade_async(llm, model, articles, config, cascade)
+                    else:
+                        story = await generate_story_async(llm, model, articles, config)
+            except Exception as e:
+                return StoryResult(index, None, e, time.perf_counter() - start)
+            return StoryResult(index, story, None, time.perf_counter() - start)
+
+    tasks = [
+        asyncio.ensure_future(bounded(index, articles))
+        for index, articles in enumerate(clusters)
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def _timed_generate_story(
+    llm: LLMClient,
+    model: str,
+    index: int,
+    articles: list[dict],
+    config: CronkiteConfig,
+    cascade: Cascade | None = None,
+) -> StoryResult:
+    """Generate one story, capturing its duration and any error."""
+    start = time.perf_counter()
+    try:
+        with scheduling_priority(Priority.BATCH):
+            if cascade is not None:
+                story = generate_story_cascade(llm, model, articles, config, cascade)
+            else:
+                story = generate_story(llm, model, articles, config)
+    except Exception as e:
+        return StoryResult(index, None, e, time.perf_counter() - start)
+    return StoryResult(index, story, None, time.perf_counter() - start)
@@ -1,18 +1,48 @@
+import asyncio
+import contextvars
 import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 
-from openai import OpenAI
+import openai
 
+from cronkite.article_index import ArticleIndex
 from cronkite.config import CronkiteConfig
-from cronkite.instruction_builder import build_instruction
+from cronkite.dedup import collapse_duplicates, expand_story
+from cronkite.gazetteer import load_gazetteer
+from cronkite.instruction_builder import (
+    JSON_OBJECT_FORMAT,
+    build_instruction,
+    build_response_format,
+    StoryCall,
+    get_enabled_fields,
+    plan_story_calls,
+)
+from cronkite.llm import AsyncLLMClient, LLMClient
+from cronkite.locate import locate, validate_location
+from cronkite.metrics import story_meta
+from cronkite.prefilter import merge_noise, prefilter_noise
+from cronkite.token_budget import count_tokens, fit_to_budget
 from cronkite.response_parser import (
     parse_response,
     get_subgroups,
-    get_filtered_articles,
+    filter_noise,
+)
+
+
+SUBSTORY_CONFIG = CronkiteConfig(
+    filter_noise=False,
+    group_articles=False,
+    generate_title=True,
+    generate_summary=True,
+    generate_key_points=False,
+    extract_quotes=False,
+    generate_substories=False,
 )
 
 
 def generate_story(
-    client: OpenAI,
+    llm: LLMClient,
     model: str,
     articles: list[dict],
     config: CronkiteConfig,
@@ -21,50 +51,263 @@ def generate_story(
     Process articles through unified pipeline and return a story.
 
     Args:
-        client: OpenAI client instance
+        llm: LLMClient used for model calls
+        model: Model identifier (e.g., "gpt-4o")
+        articles: List of article dicts with id, title, summary, text,
+                  published_at, source
+        config: Pipeline configuration
+
+    Returns:
+        Story dict with title, summary, key_points, quotes, sub_stories,
+        article_ids, noise_article_ids, plus _meta when config.include_meta
+    """
+    with story_meta(config.include_meta) as meta:
+        story, index = _generate_story(llm, model, articles, config)
+    if meta:
+        story["_meta"] = _with_hallucinated(meta, index)
+    return story
+
+
+async def generate_story_async(
+    llm: AsyncLLMClient,
+    model: str,
+    articles: list[dict],
+    config: CronkiteConfig,
+    max_concurrency: int = 8,
+) -> dict:
+    """
+    Async variant of generate_story that fans sub-stories out concurrently.
+
+    Args:
+        llm: AsyncLLMClient used for model calls
         model: Model identifier (e.g., "gpt-4o")
         articles: List of article dicts with id, title, summary, text,
                   published_at, source
         config: Pipeline configuration
+        max_concurrency: Maximum number of sub-story calls in flight at once
 
     Returns:
         Story dict with title, summary, key_points, quotes, sub_stories,
-        article_ids, noise_article_ids
+        article_ids, noise_article_ids, plus _meta when config.include_meta
     """
+    with story_meta(config.include_meta) as meta:
+        story, index = await _generate_story_async(llm, model, articles, config, max_concurrency)
+    if meta:
+        story["_meta"] = _with_hallucinated(meta, index)
+    return story
+
+
+def _substory_config(config: CronkiteConfig) -> CronkiteConfig:
+    """SUBSTORY_CONFIG with the caller's structured_outputs setting."""
+    if config.structured_outputs == SUBSTORY_CONFIG.structured_outputs:
+        return SUBSTORY_CONFIG
+    return replace(SUBSTORY_CONFIG, structured_outputs=config.structured_outputs)
+
+
+def _generate_story(
+    llm: LLMClient,
+    model: str,
+    articles: list[dict],
+    config: CronkiteConfig,
+) -> tuple[dict, ArticleIndex]:
+    """
+    Run the unified pipeline for generate_story.
+
+    Returns:
+        Tuple of (story, the ArticleIndex every step resolved IDs against)
+    """
+    members = None
+    if config.collapse_duplicates and articles:
+        articles, members = _collapse_duplicates(llm, articles, config)
+
+    cluster, prefiltered = articles, []
+    if config.prefilter_noise and config.filter_noise and articles:
+        articles, prefiltered = _prefilter_noise(llm, model, articles, config)
+
+    index = ArticleIndex(articles)
     if not articles:
-        return _empty_story()
+        return _empty_story(), index
+
+    response = _call_story(llm, model, index, config)
+
+    story, subgroups, filtered = _assemble_story(llm, response, index, config)
+    if subgroups:
+        story["sub_stories"] = [
+            _generate_substory(llm, model, subgroup, filtered, config)
+            for subgroup in subgroups
+        ]
 
-    instruction = build_instruction(config)
-    response = _call_llm(client, model, instruction, articles)
+    _record_hallucinated(llm, index)
+    if prefiltered:
+        story = merge_noise(story, prefiltered, cluster)
+    if members:
+        story = expand_story(story, members)
+    return story, index
 
-    filtered_articles = get_filtered_articles(articles, response, config)
-    if not filtered_articles:
-        return {
+
+async def _generate_story_async(
+    llm: AsyncLLMClient,
+    model: str,
+    articles: list[dict],
+    config: CronkiteConfig,
+    max_concurrency: int,
+) -> tuple[dict, ArticleIndex]:
+    """Async variant of _generate_story."""
+    members = None
+    if config.collapse_duplicates and articles:
+        articles, members = _collapse_duplicates(llm, articles, config)
+
+    cluster, prefiltered = articles, []
+    if config.prefilter_noise and config.filter_noise and articles:
+        articles, prefiltered = _prefilter_noise(llm, model, articles, config)
+
+    index = ArticleIndex(articles)
+    if not articles:
+        return _empty_story(), index
+
+    response = await _call_story_async(llm, model, index, config)
+
+    story, subgroups, filtered = _assemble_story(llm, response, index, config)
+    if subgroups:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(subgroup: dict) -> dict:
+            async with semaphore:
+                return await _generate_substory_async(
+                    llm, model, subgroup, filtered, config
+                )
+
+        story["sub_stories"] = list(
+            await asyncio.gather(*(bounded(subgroup) for subgroup in subgroups))
+        )
+
+    _record_hallucinated(llm, index)
+    if prefiltered:
+        story = merge_noise(story, prefiltered, cluster)
+    if members:
+        story = expand_story(story, members)
+    return story, index
+
+
+def _collapse_duplicates(
+    llm: LLMClient | AsyncLLMClient,
+    articles: list[dict],
+    config: CronkiteConfig,
+) -> tuple[list[dict], dict[str, list[str]]]:
+    """Collapse near-duplicate articles and record how many were folded away."""
+    representatives, members = collapse_duplicates(articles, config.duplicate_threshold)
+    llm.stats.add(articles_collapsed=len(articles) - len(representatives))
+    return representatives, members
+
+
+def _prefilter_noise(
+    llm: LLMClient | AsyncLLMClient,
+    model: str,
+    articles: list[dict],
+    config: CronkiteConfig,
+) -> tuple[list[dict], list[str]]:
+    """Drop clear noise locally and record the articles and tokens it saved."""
+    kept, noise_ids = prefilter_noise(articles, config.prefilter_threshold)
+    if noise_ids:
+        noise = set(noise_ids)
+        dropped = [a for a in articles if a["id"] in noise]
+        llm.stats.add(
+            articles_prefiltered=len(noise_ids),
+            prefilter_tokens_saved=count_tokens(json.dumps(_articles_for_llm(dropped)), model),
+        )
+    return kept, noise_ids
+
+
+def _assemble_story(
+    llm: LLMClient | AsyncLLMClient,
+    response: dict,
+    index: ArticleIndex,
+    config: CronkiteConfig,
+) -> tuple[dict, list[dict], ArticleIndex]:
+    """
+    Turn the main LLM response into a story.
+
+    Returns:
+        Tuple of (story, subgroups needing sub-stories, ArticleIndex over
+        the articles that are not noise)
+    """
+    filtered = filter_noise(index, response, config)
+    if not filtered:
+        story = {
             **_empty_story(),
-            "noise_article_ids": [a["id"] for a in articles],
+            "noise_article_ids": index.ids,
         }
+        return story, [], filtered
 
-    story = parse_response(response, config, articles)
+    story = parse_response(response, config, index)
+    if config.gazetteer_location:
+        story["location"] = _gazetteer_location(llm, story["location"], filtered.articles, config)
+    subgroups = get_subgroups(response, config) if config.generate_substories else []
 
-    if config.generate_substories:
-        subgroups = get_subgroups(response, config)
-        if subgroups:
-            story["sub_stories"] = [
-                _generate_substory(client, model, subgroup, filtered_articles)
-                for subgroup in subgroups
-            ]
+    return story, subgroups, filtered
 
-    return story
 
+def _gazetteer_location(
+    llm: LLMClient | AsyncLLMClient,
+    location: dict | None,
+    articles: list[dict],
+    config: CronkiteConfig,
+) -> dict | None:
+    """Validate the model's location, or resolve one locally without resolve_location."""
+    gazetteer = load_gazetteer(config.gazetteer_path)
+    if not config.resolve_location:
+        resolved = locate(articles, gazetteer)
+        if resolved is not None:
+            llm.stats.add(locations_resolved=1)
+        return resolved
 
-def _call_llm(
-    client: OpenAI,
+    validated = validate_location(location, articles, gazetteer)
+    if validated != location:
+        llm.stats.add(locations_corrected=1)
+    return validated
+
+
+def _record_hallucinated(llm: LLMClient | AsyncLLMClient, index: ArticleIndex) -> None:
+    """Count article IDs the model returned that match no article."""
+    if index.hallucinated_ids:
+        llm.stats.add(hallucinated_article_ids=len(index.hallucinated_ids))
+
+
+def _with_hallucinated(meta: dict, index: ArticleIndex) -> dict:
+    """Add the story's hallucinated article IDs to its _meta block."""
+    return {**meta, "hallucinated_article_ids": sorted(index.hallucinated_ids)}
+
+
+def _articles_payload(
+    llm: LLMClient | AsyncLLMClient,
     model: str,
-    instruction: str,
     articles: list[dict],
-) -> dict:
-    """Make a single LLM call with the given instruction and articles."""
-    articles_for_llm = [
+    token_budget: int | None,
+) -> str:
+    """Serialize articles into the user payload, fitting them to the token budget."""
+    return json.dumps(_budgeted_articles(llm, model, articles, token_budget))
+
+
+def _budgeted_articles(
+    llm: LLMClient | AsyncLLMClient,
+    model: str,
+    articles: list[dict],
+    token_budget: int | None,
+) -> list[dict]:
+    """Project articles for the model, fitted to the token budget if there is one."""
+    if token_budget is not None:
+        articles, budget_stats = fit_to_budget(articles, token_budget, model)
+        llm.stats.add(
+            budget_tokens_before=budget_stats.tokens_before,
+            budget_tokens_after=budget_stats.tokens_after,
+            tokens_saved=budget_stats.tokens_saved,
+        )
+    return _articles_for_llm(articles)
+
+
+def _articles_for_llm(articles: list[dict]) -> list[dict]:
+    """Project articles onto the fields sent to the model."""
+    return [
         {
             "id": article["id"],
             "title": article["title"],
@@ -76,52 +319,214 @@ def _call_llm(
         for article in articles
     ]
 
-    response = client.chat.completions.create(
-        model=model,
-        messages=[
-            {"role": "system", "content": instruction},
-            {"role": "user", "content": json.dumps(articles_for_llm)},
-        ],
-        response_format={"type": "json_object"},
+
+def _call_llm(
+    llm: LLMClient,
+    model: str,
+    instruction: str,
+    articles: list[dict],
+    token_budget: int | None = None,
+    action: str = "generate_story",
+    response_format: dict = JSON_OBJECT_FORMAT,
+) -> dict:
+    """Make a single LLM call with the given instruction and articles."""
+    payload = _articles_payload(llm, model, articles, token_budget)
+    return llm.complete_json(model, instruction, payload, response_format, action)
+
+
+async def _call_llm_async(
+    llm: AsyncLLMClient,
+    model: str,
+    instruction: str,
+    articles: list[dict],
+    token_budget: int | None = None,
+    action: str = "generate_story",
+    response_format: dict = JSON_OBJECT_FORMAT,
+) -> dict:
+    """Async variant of _call_llm."""
+    payload = _articles_payload(llm, model, articles, token_budget)
+    return await llm.complete_json(model, instruction, payload, response_format, action)
+
+
+def _call_story(
+    llm: LLMClient,
+    model: str,
+    index: ArticleIndex,
+    config: CronkiteConfig,
+) -> dict:
+    """
+    Make the calls planned by plan_story_calls and merge their responses.
+
+    Usually this is one unified call. With per-component models or split
+    execution, the call holding filter_noise runs first, so the concurrent
+    calls after it only read the articles that belong. Their fields are
+    merged into one response in the shape of the unified call's.
+    """
+    first, rest = plan_story_calls(config, model)
+    response, articles = {}, index.articles
+    if first is not None:
+        response = _call_planned(llm, first, articles, config)
+        if rest:
+            articles = filter_noise(index, response, first.config).articles
+    if not rest or not articles:
+        # Nothing left to call: everything was planned first, no component
+        # is enabled, or every article is noise
+        return response
+
+    with ThreadPoolExecutor(max_workers=len(rest)) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, _call_planned, llm, call, articles, config)
+            for call in rest
+        ]
+        for future in futures:
+            response.update(future.result())
+    return response
+
+
+async def _call_story_async(
+    llm: AsyncLLMClient,
+    model: str,
+    index: ArticleIndex,
+    config: CronkiteConfig,
+) -> dict:
+    """Async variant of _call_story."""
+    first, rest = plan_story_calls(config, model)
+    response, articles = {}, index.articles
+    if first is not None:
+        response = await _call_planned_async(llm, first, articles, config)
+        if rest:
+            articles = filter_noise(index, response, first.config).articles
+    if not rest or not articles:
+        # Nothing left to call: everything was planned first, no component
+        # is enabled, or every article is noise
+        return response
+
+    for result in await asyncio.gather(*(_call_planned_async(llm, call, articles, config) for call in rest)):
+        response.update(result)
+    return response
+
+
+def _call_planned(llm: LLMClient, call: StoryCall, articles: list[dict], config: CronkiteConfig) -> dict:
+    """Make one planned call, keeping only the fields it was asked for."""
+    response = _call_llm(
+        llm, call.model, build_instruction(call.config), articles, config.article_token_budget,
+        call.action, build_response_format(call.config),
+    )
+    return _call_fields(response, call)
+
+
+async def _call_planned_async(
+    llm: AsyncLLMClient,
+    call: StoryCall,
+    articles: list[dict],
+    config: CronkiteConfig,
+) -> dict:
+    """Async variant of _call_planned."""
+    response = await _call_llm_async(
+        llm, call.model, build_instruction(call.config), articles, config.article_token_budget,
+        call.action, build_response_format(call.config),
     )
+    return _call_fields(response, call)
+
 
-    return json.loads(response.choices[0].message.content)
+def _call_fields(response: dict, call: StoryCall) -> dict:
+    """The fields of response produced by call's components."""
+    return {field: response[field] for field in get_enabled_fields(call.config) if field in response}
 
 
 def _generate_substory(
-    client: OpenAI,
+    llm: LLMClient,
     model: str,
     subgroup: dict,
-    all_articles: list[dict],
+    index: ArticleIndex,
+    config: CronkiteConfig,
 ) -> dict:
-    """Generate a substory for a sub-group of articles."""
-    article_ids = set(subgroup.get("article_ids", []))
-    subgroup_articles = [a for a in all_articles if a["id"] in article_ids]
+    """
+    Generate a substory for a sub-group of articles.
 
+    If the call fails after the scheduler's retries, the sub-story falls back
+    to the subgroup theme with an empty summary.
+    """
+    article_ids, subgroup_articles = _select_subgroup(subgroup, index)
     if not subgroup_articles:
-        return {
-            "title": subgroup.get("theme", ""),
-            "summary": "",
-            "article_ids": [],
-        }
+        return _empty_substory(subgroup)
 
-    substory_config = CronkiteConfig(
-        filter_noise=False,
-        group_articles=False,
-        generate_title=True,
-        generate_summary=True,
-        generate_key_points=False,
-        extract_quotes=False,
-        generate_substories=False,
-    )
+    try:
+        with story_meta(config.include_meta) as meta:
+            substory_config = _substory_config(config)
+            instruction = build_instruction(substory_config)
+            response = _call_llm(
+                llm, config.model_for("generate_substory", model), instruction, subgroup_articles,
+                config.article_token_budget, "generate_substory",
+                build_response_format(substory_config),
+            )
+    except openai.OpenAIError:
+        # A sub-story that still fails after retries keeps its theme rather
+        # than failing the whole story
+        llm.stats.add(substories_failed=1)
+        return {**_empty_substory(subgroup), "article_ids": article_ids}
 
-    instruction = build_instruction(substory_config)
-    response = _call_llm(client, model, instruction, subgroup_articles)
+    return _build_substory(response, subgroup, article_ids, meta)
 
-    return {
+
+async def _generate_substory_async(
+    llm: AsyncLLMClient,
+    model: str,
+    subgroup: dict,
+    index: ArticleIndex,
+    config: CronkiteConfig,
+) -> dict:
+    """Async variant of _generate_substory."""
+    article_ids, subgroup_articles = _select_subgroup(subgroup, index)
+    if not subgroup_articles:
+        return _empty_substory(subgroup)
+
+    try:
+        with story_meta(config.include_meta) as meta:
+            substory_config = _substory_config(config)
+            instruction = build_instruction(substory_config)
+            response = await _call_llm_async(
+                llm, config.model_for("generate_substory", model), instruction, subgroup_articles,
+                config.article_token_budget, "generate_substory",
+                build_response_format(substory_config),
+            )
+    except openai.OpenAIError:
+        # A sub-story that still fails after retries keeps its theme rather
+        # than failing the whole story
+        llm.stats.add(substories_failed=1)
+        return {**_empty_substory(subgroup), "article_ids": article_ids}
+
+    return _build_substory(response, subgroup, article_ids, meta)
+
+
+def _select_subgroup(subgroup: dict, index: ArticleIndex) -> tuple[list[str], list[dict]]:
+    """
+    Return the subgroup's article IDs and the matching articles.
+
+    IDs of noise articles and IDs matching no article are dropped.
+    """
+    subgroup_articles = index.select(subgroup.get("article_ids", []))
+    return [a["id"] for a in subgroup_articles], subgroup_articles
+
+
+def _build_substory(response: dict, subgroup: dict, article_ids: list[str], meta: dict | None = None) -> dict:
+    """Build a substory dict from the substory LLM response."""
+    substory = {
         "title": response.get("title", subgroup.get("theme", "")),
         "summary": response.get("summary", ""),
-        "article_ids": list(article_ids),
+        "article_ids": article_ids,
+    }
+    if meta:
+        substory["_meta"] = meta
+    return substory
+
+
+def _empty_substory(subgroup: dict) -> dict:
+    """Return a substory for a subgroup with no matching articles."""
+    return {
+        "title": subgroup.get("theme", ""),
+        "summary": "",
+        "article_ids": [],
     }
 
 
@@ -0,0 +1,104 @@
+import json
+
+import openai
+
+from cronkite.cascade import Cascade, check_story
+from cronkite.config import CronkiteConfig
+from cronkite.llm import AsyncLLMClient, LLMClient
+from cronkite.metrics import story_meta
+from cronkite.actions.generate_story import generate_story, generate_story_async
+
+
+def generate_story_cascade(
+    llm: LLMClient,
+    model: str,
+    articles: list[dict],
+    config: CronkiteConfig,
+    cascade: Cascade,
+) -> dict:
+    """
+    Generate a story with cascade.model, escalating to model on weak results.
+
+    An empty cluster, or one the cheap model marks as all noise, is
+    returned without escalating (see check_story).
+
+    Args:
+        llm: LLMClient used for model calls
+        model: Model escalated to when the cheap story fails a check
+        articles: List of article dicts with id, title, summary, text,
+                  published_at, source
+        config: Pipeline configuration
+        cascade: Cheap model and check thresholds
+
+    Returns:
+        Story dict as for generate_story. With config.include_meta, _meta
+        covers both attempts and adds a "cascade" entry with the model
+        used, whether the story escalated and the checks that failed.
+    """
+    with story_meta(config.include_meta) as meta:
+        llm.stats.add(cascade_stories=1)
+        try:
+            story = generate_story(llm, cascade.model, articles, config)
+            failed = check_story(story, articles, config, cascade)
+        except (openai.OpenAIError, json.JSONDecodeError):
+            # Refusals and unparseable output escalate like a failed check
+            story, failed = None, ["error"]
+        if failed:
+            _record_escalation(llm, failed)
+            story = generate_story(llm, model, articles, config)
+    return _finish(story, meta, model, cascade, failed)
+
+
+async def generate_story_cascade_async(
+    llm: AsyncLLMClient,
+    model: str,
+    articles: list[dict],
+    config: CronkiteConfig,
+    cascade: Cascade,
+    max_concurrency: int = 8,
+) -> dict:
+    """
+    Async variant of generate_story_cascade.
+
+    Args:
+        llm: AsyncLLMClient used for model calls
+        model: Model escalated to when the cheap story fails a check
+        articles: List of article dicts
+        config: Pipeline configuration
+        cascade: Cheap model and check thresholds
+        max_concurrency: Maximum number of sub-story calls in flight at once
+
+    Returns:
+        Story dict as for generate_story_cascade
+    """
+    with story_meta(config.include_meta) as meta:
+        llm.stats.add(cascade_stories=1)
+        try:
+            story = await generate_story_async(llm, cascade.model, articles, config, max_concurrency)
+            failed = check_story(story, articles, config, cascade)
+        except (openai.OpenAIError, json.JSONDecodeError):
+            story, failed = None, ["error"]
+        if failed:
+            _record_escalation(llm, failed)
+            story = await generate_story_async(llm, model, articles, config, max_concurrency)
+    return _finish(story, meta, model, cascade, failed)
+
+
+def _record_escalation(llm: LLMClient | AsyncLLMClient, failed: list[str]) -> None:
+    """Count an escalation and the checks that caused it."""
+    llm.stats.add(cascade_escalations=1, **{f"cascade_failed_{check}": 1 for check in failed})
+
+
+def _finish(story: dict, meta: dict, model: str, cascade: Cascade, failed: list[str]) -> dict:
+    """Replace the story's _meta with one covering every attempt."""
+    if meta:
+        story["_meta"] = {
+            **story["_meta"],
+            **meta,
+            "cascade": {
+                "model": model if failed else cascade.model,
+                "escalated": bool(failed),
+                "failed_checks": failed,
+            },
+        }
+    return story
@@ -0,0 +1,270 @@
+import asyncio
+import contextvars
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from typing import Any
+
+from cronkite.article_index import ArticleIndex
+from cronkite.config import CronkiteConfig
+from cronkite.dedup import expand_story, expand_sub_story
+from cronkite.instruction_builder import build_instruction, build_response_format, plan_story_calls
+from cronkite.llm import AsyncLLMClient, LLMClient
+from cronkite.metrics import story_meta
+from cronkite.prefilter import merge_noise
+from cronkite.response_parser import filter_noise
+from cronkite.actions.generate_story import (
+    _articles_payload,
+    _assemble_story,
+    _call_story,
+    _call_story_async,
+    _collapse_duplicates,
+    _empty_story,
+    _generate_substory,
+    _generate_substory_async,
+    _prefilter_noise,
+    _record_hallucinated,
+    _with_hallucinated,
+)
+
+
+# Story fields yielded as soon as they are parsed, and the config flag that
+# enables each
+STREAMED_FIELDS = {
+    "title": "generate_title",
+    "summary": "generate_summary",
+    "key_points": "generate_key_points",
+    "quotes": "extract_quotes",
+    "location": "resolve_location",
+}
+
+
+def generate_story_stream(
+    llm: LLMClient,
+    model: str,
+    articles: list[dict],
+    config: CronkiteConfig,
+    max_concurrency: int = 8,
+) -> Iterator[tuple[str, Any]]:
+    """
+    Generate a story, yielding each field as soon as the model produces it.
+
+    The main call is streamed and parsed incrementally. Sub-stories start
+    as soon as the subgroups field is parsed, while the rest of the main
+    response is still streaming, provided the noise IDs are already known;
+    otherwise they start once the main response is complete.
+
+    Args:
+        llm: LLMClient used for model calls
+        model: Model identifier (e.g., "gpt-4o")
+        articles: List of article dicts with id, title, summary, text,
+                  published_at, source
+        config: Pipeline configuration
+        max_concurrency: Maximum number of sub-story calls in flight at once
+
+    Yields:
+        ("title", ...), ("summary", ...), ("key_points", ...), ("quotes", ...)
+        and ("location", ...) as each enabled field completes, then
+        ("sub_story", dict) for each sub-story in completion order, and
+        finally ("story", dict) with the complete story in generate_story's
+        shape. The final story is authoritative: if every article turns
+        out to be noise, it is empty even though fields were yielded.
+    """
+    if not articles:
+        yield "story", _empty_story()
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_concurrency)
+    try:
+        with story_meta(config.include_meta) as meta:
+            members = None
+            if config.collapse_duplicates:
+                articles, members = _collapse_duplicates(llm, articles, config)
+
+            cluster, prefiltered = articles, []
+            if config.prefilter_noise and config.filter_noise:
+                articles, prefiltered = _prefilter_noise(llm, model, articles, config)
+
+            def start(subgroups: list[dict], available: ArticleIndex) -> dict[Future, int]:
+                return {
+                    executor.submit(
+                        contextvars.copy_context().run,
+                        _generate_substory, llm, model, subgroup, available, config,
+                    ): position
+                    for position, subgroup in enumerate(subgroups)
+                }
+
+            index = ArticleIndex(articles)
+            response, futures = {}, {}
+            for field, value in _story_events(llm, model, index, config):
+                response[field] = value
+                if field in STREAMED_FIELDS and getattr(config, STREAMED_FIELDS[field]):
+                    yield field, value
+                elif field == "subgroups" and _substories_can_start(response, config):
+                    futures = start(value, filter_noise(index, response, config))
+
+            story, subgroups, filtered = _assemble_story(llm, response, index, config)
+            sub_stories = {}
+            if subgroups:
+                if not futures:
+                    futures = start(subgroups, filtered)
+                for future in as_completed(futures):
+                    sub_stories[futures[future]] = future.result()
+                    yield "sub_story", _streamed_sub_story(sub_stories[futures[future]], members)
+            story["sub_stories"] = [sub_stories[i] for i in sorted(sub_stories)]
+            _record_hallucinated(llm, index)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+    if prefiltered:
+        story = merge_noise(story, prefiltered, cluster)
+    if members:
+        story = expand_story(story, members)
+    if meta:
+        story["_meta"] = _with_hallucinated(meta, index)
+    yield "story", story
+
+
+async def generate_story_stream_async(
+    llm: AsyncLLMClient,
+    model: str,
+    articles: list[dict],
+    config: CronkiteConfig,
+    max_concurrency: int = 8,
+) -> AsyncIterator[tuple[str, Any]]:
+    """
+    Async variant of generate_story_stream.
+
+    Args:
+        llm: AsyncLLMClient used for model calls
+        model: Model identifier (e.g., "gpt-4o")
+        articles: List of article dicts
+        config: Pipeline configuration
+        max_concurrency: Maximum number of sub-story calls in flight at once
+
+    Yields:
+        The same (field, value) events as generate_story_stream
+    """
+    if not articles:
+        yield "story", _empty_story()
+        return
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(position: int, subgroup: dict, available: ArticleIndex) -> tuple[int, dict]:
+        async with semaphore:
+            return position, await _generate_substory_async(llm, model, subgroup, available, config)
+
+    tasks = []
+    try:
+        with story_meta(config.include_meta) as meta:
+            members = None
+            if config.collapse_duplicates:
+                articles, members = _collapse_duplicates(llm, articles, config)
+
+            cluster, prefiltered = articles, []
+            if config.prefilter_noise and config.filter_noise:
+                articles, prefiltered = _prefilter_noise(llm, model, articles, config)
+
+            def start(subgroups: list[dict], available: ArticleIndex) -> list[asyncio.Future]:
+                return [
+                    asyncio.ensure_future(bounded(position, subgroup, available))
+                    for position, subgroup in enumerate(subgroups)
+                ]
+
+            index = ArticleIndex(articles)
+            response = {}
+            async for field, value in _story_events_async(llm, model, index, config):
+                response[field] = value
+                if field in STREAMED_FIELDS and getattr(config, STREAMED_FIELDS[field]):
+                    yield field, value
+                elif field == "subgroups" and _substories_can_start(response, config):
+                    tasks = start(value, filter_noise(index, response, config))
+
+            story, subgroups, filtered = _assemble_story(llm, response, index, config)
+            sub_stories = {}
+            if subgroups:
+                if not tasks:
+                    tasks = start(subgroups, filtered)
+                for next_done in asyncio.as_completed(tasks):
+                    position, sub_story = await next_done
+                    sub_stories[position] = sub_story
+                    yield "sub_story", _streamed_sub_story(sub_story, members)
+            story["sub_stories"] = [sub_stories[i] for i in sorted(sub_stories)]
+            _record_hallucinated(llm, index)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    if prefiltered:
+        story = merge_noise(story, prefiltered, cluster)
+    if members:
+        story = expand_story(story, members)
+    if meta:
+        story["_meta"] = _with_hallucinated(meta, index)
+    yield "story", story
+
+
+def _substories_can_start(response: dict, config: CronkiteConfig) -> bool:
+    """
+    Whether sub-stories can start while the rest of the response streams.
+
+    They need the noise IDs, which strict JSON Schema output places before
+    subgroups but json_object output (or a model reordering keys) may not.
+    Until then they wait for the complete response.
+    """
+    if not (config.group_articles and config.generate_substories):
+        return False
+    return not config.filter_noise or "noise_article_ids" in response
+
+
+def _streamed_sub_story(sub_story: dict, members: dict[str, list[str]] | None) -> dict:
+    """A sub-story as yielded, with collapsed duplicates expanded like the final story's."""
+    return expand_sub_story(sub_story, members) if members else sub_story
+
+
+def _story_events(
+    llm: LLMClient,
+    model: str,
+    index: ArticleIndex,
+    config: CronkiteConfig,
+) -> Iterator[tuple[str, Any]]:
+    """
+    Yield the main response's (field, value) pairs as they are parsed.
+
+    Streaming always uses the unified call, even with split_execution.
+    When components are routed to several models there is no single
+    response to stream, so the merged fields arrive once every call is done.
+    """
+    unified = replace(config, split_execution=False)
+    first, rest = plan_story_calls(unified, model)
+    if first is None or rest:
+        yield from _call_story(llm, model, index, unified).items()
+        return
+
+    payload = _articles_payload(llm, first.model, index.articles, config.article_token_budget)
+    yield from llm.stream_json(
+        first.model, build_instruction(config), payload, build_response_format(config), "generate_story"
+    )
+
+
+async def _story_events_async(
+    llm: AsyncLLMClient,
+    model: str,
+    index: ArticleIndex,
+    config: CronkiteConfig,
+) -> AsyncIterator[tuple[str, Any]]:
+    """Async variant of _story_events."""
+    unified = replace(config, split_execution=False)
+    first, rest = plan_story_calls(unified, model)
+    if first is None or rest:
+        response = await _call_story_async(llm, model, index, unified)
+        for field, value in response.items():
+            yield field, value
+        return
+
+    payload = _articles_payload(llm, first.model, index.articles, config.article_token_budget)
+    async for field, value in llm.stream_json(
+        first.model, build_instruction(config), payload, build_response_format(config), "generate_story"
+    ):
+        yield field, value
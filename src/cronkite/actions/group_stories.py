@@ -1,24 +1,50 @@
+import asyncio
+import contextvars
 import json
-
-from openai import OpenAI
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from cronkite.instructions.group_stories import GROUP_STORIES_COMPONENT
+from cronkite.instruction_builder import JSON_OBJECT_FORMAT, json_schema_format
+from cronkite.llm import AsyncLLMClient, LLMClient
+from cronkite.similarity import tfidf_vectors, top_matches
+
+
+# Up to this many story pairs, a single call compares every pair. Above it,
+# likely pairs are shortlisted locally and the model only sees those.
+PREFILTER_MAX_PAIRS = 400
+
+# Candidate shortlisting: matches kept per story in each direction, and the
+# minimum TF-IDF cosine similarity for a pair to be considered
+MAX_CANDIDATES = 5
+MIN_SIMILARITY = 0.05
+
+# group_a stories per chunked call
+CHUNK_SIZE = 20
+
+# Strict response schema used when structured outputs are enabled
+_SCHEMA_FORMAT = json_schema_format("links", [GROUP_STORIES_COMPONENT])
 
 
 def group_stories(
-    client: OpenAI,
+    llm: LLMClient,
     model: str,
     group_a: list[dict],
     group_b: list[dict],
+    max_concurrency: int = 8,
+    structured_outputs: bool = False,
 ) -> list[dict]:
     """
     Link stories across two groups that cover the same underlying event.
 
     Args:
-        client: OpenAI client instance
+        llm: LLMClient used for model calls
         model: Model identifier (e.g., "gpt-4o")
         group_a: First list of story dicts with title, summary, key_points, etc.
         group_b: Second list of story dicts with title, summary, key_points, etc.
+        max_concurrency: Maximum number of chunked calls in flight at once
+        structured_outputs: Constrain responses to a strict JSON Schema
 
     Returns:
         List of link dicts, each with "group_a_index" and "group_b_index"
@@ -27,8 +53,163 @@ def group_stories(
     if not group_a or not group_b:
         return []
 
-    instruction = _build_instruction(GROUP_STORIES_COMPONENT)
+    instruction = _build_instruction(structured_outputs)
+    response_format = _response_format(structured_outputs)
+    if len(group_a) * len(group_b) <= PREFILTER_MAX_PAIRS:
+        payload = _stories_payload(group_a, group_b)
+        result = llm.complete_json(model, instruction, payload, response_format, "group_stories")
+        return result.get("links", [])
+
+    chunks = _candidate_chunks(llm, group_a, group_b)
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run,
+                _link_chunk, llm, model, instruction, response_format, group_a, group_b, *chunk,
+            )
+            for chunk in chunks
+        ]
+        return _merge_links(future.result() for future in futures)
 
+
+async def group_stories_async(
+    llm: AsyncLLMClient,
+    model: str,
+    group_a: list[dict],
+    group_b: list[dict],
+    max_concurrency: int = 8,
+    structured_outputs: bool = False,
+) -> list[dict]:
+    """
+    Async variant of group_stories.
+
+    Args:
+        llm: AsyncLLMClient used for model calls
+        model: Model identifier (e.g., "gpt-4o")
+        group_a: First list of story dicts with title, summary, key_points, etc.
+        group_b: Second list of story dicts with title, summary, key_points, etc.
+        max_concurrency: Maximum number of chunked calls in flight at once
+        structured_outputs: Constrain responses to a strict JSON Schema
+
+    Returns:
+        List of link dicts, each with "group_a_index" and "group_b_index"
+        indicating which stories match across the two groups.
+    """
+    if not group_a or not group_b:
+        return []
+
+    instruction = _build_instruction(structured_outputs)
+    response_format = _response_format(structured_outputs)
+    if len(group_a) * len(group_b) <= PREFILTER_MAX_PAIRS:
+        payload = _stories_payload(group_a, group_b)
+        result = await llm.complete_json(model, instruction, payload, response_format, "group_stories")
+        return result.get("links", [])
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(a_indices: list[int], b_indices: list[int]) -> list[dict]:
+        async with semaphore:
+            payload = _stories_payload(
+                [group_a[i] for i in a_indices], [group_b[j] for j in b_indices]
+            )
+            result = await llm.complete_json(model, instruction, payload, response_format, "group_stories")
+            return _remap_links(result.get("links", []), a_indices, b_indices)
+
+    chunks = _candidate_chunks(llm, group_a, group_b)
+    return _merge_links(await asyncio.gather(*(bounded(*chunk) for chunk in chunks)))
+
+
+def _candidate_chunks(
+    llm: LLMClient | AsyncLLMClient,
+    group_a: list[dict],
+    group_b: list[dict],
+) -> list[tuple[list[int], list[int]]]:
+    """
+    Shortlist likely matching pairs with TF-IDF and split them into chunks.
+
+    Returns:
+        List of (group_a indices, group_b indices) to compare in one call
+    """
+    vectors = tfidf_vectors([_story_text(story) for story in group_a + group_b])
+    vectors_a, vectors_b = vectors[:len(group_a)], vectors[len(group_a):]
+
+    candidates = defaultdict(set)
+    for i, matches in enumerate(top_matches(vectors_a, vectors_b, MAX_CANDIDATES, MIN_SIMILARITY)):
+        candidates[i].update(j for j, _ in matches)
+    for j, matches in enumerate(top_matches(vectors_b, vectors_a, MAX_CANDIDATES, MIN_SIMILARITY)):
+        for i, _ in matches:
+            candidates[i].add(j)
+
+    # Stories with no candidate can't link to anything, so they are left out.
+    # The rest are ordered by best candidate so stories sharing candidates
+    # land in one chunk
+    a_indices = sorted((i for i in candidates if candidates[i]), key=lambda i: (min(candidates[i]), i))
+
+    chunks = []
+    pairs = 0
+    for start in range(0, len(a_indices), CHUNK_SIZE):
+        chunk_a = a_indices[start:start + CHUNK_SIZE]
+        chunk_b = sorted(set().union(*(candidates[i] for i in chunk_a)))
+        chunks.append((chunk_a, chunk_b))
+        pairs += sum(len(candidates[i]) for i in chunk_a)
+
+    llm.stats.add(
+        group_pairs_total=len(group_a) * len(group_b),
+        group_pairs_shortlisted=pairs,
+    )
+    return chunks
+
+
+def _link_chunk(
+    llm: LLMClient,
+    model: str,
+    instruction: str,
+    response_format: dict,
+    group_a: list[dict],
+    group_b: list[dict],
+    a_indices: list[int],
+    b_indices: list[int],
+) -> list[dict]:
+    """Ask the model to link one chunk of shortlisted stories."""
+    payload = _stories_payload([group_a[i] for i in a_indices], [group_b[j] for j in b_indices])
+    result = llm.complete_json(model, instruction, payload, response_format, "group_stories")
+    return _remap_links(result.get("links", []), a_indices, b_indices)
+
+
+def _remap_links(links: list[dict], a_indices: list[int], b_indices: list[int]) -> list[dict]:
+    """Map chunk-local link indices back to indices in the full groups."""
+    remapped = []
+    for link in links:
+        a, b = link.get("group_a_index"), link.get("group_b_index")
+        if isinstance(a, int) and isinstance(b, int) and 0 <= a < len(a_indices) and 0 <= b < len(b_indices):
+            remapped.append({"group_a_index": a_indices[a], "group_b_index": b_indices[b]})
+    return remapped
+
+
+def _merge_links(chunk_links) -> list[dict]:
+    """Flatten per-chunk links, dropping duplicates."""
+    seen = set()
+    links = []
+    for chunk in chunk_links:
+        for link in chunk:
+            key = (link["group_a_index"], link["group_b_index"])
+            if key not in seen:
+                seen.add(key)
+                links.append(link)
+    return sorted(links, key=lambda link: (link["group_a_index"], link["group_b_index"]))
+
+
+def _story_text(story: dict) -> str:
+    """Text used to compare stories locally."""
+    return " ".join([
+        story.get("title", ""),
+        story.get("summary", ""),
+        *story.get("key_points", []),
+    ])
+
+
+def _stories_payload(group_a: list[dict], group_b: list[dict]) -> str:
+    """Serialize both groups into the user payload for a grouping call."""
     stories_for_llm = {
         "group_a": [
             {
@@ -50,25 +231,27 @@ def group_stories(
         ],
     }
 
-    response = client.chat.completions.create(
-        model=model,
-        messages=[
-            {"role": "system", "content": instruction},
-            {"role": "user", "content": json.dumps(stories_for_llm)},
-        ],
-        response_format={"type": "json_object"},
-    )
+    return json.dumps(stories_for_llm)
 
-    result = json.loads(response.choices[0].message.content)
-    return result.get("links", [])
 
+@lru_cache(maxsize=2)
+def _build_instruction(structured_outputs: bool = False) -> str:
+    """
+    Build instruction for story grouping, compiled once.
 
-def _build_instruction(component: dict) -> str:
-    """Build instruction for story grouping from a component."""
+    With structured outputs the schema travels in the response_format, so
+    the prose schema section is left out.
+    """
+    component = GROUP_STORIES_COMPONENT
     parts = [
         "You are a news story matching system. You are given two groups of stories and must identify which stories across the groups cover the same underlying event.",
         "",
         component["task"],
+    ]
+    if structured_outputs:
+        return "\n".join(parts)
+
+    parts += [
         "",
         "## Expected Output",
         "",
@@ -81,3 +264,11 @@ def _build_instruction(component: dict) -> str:
         f'- {component["output_field"]} ({component["output_type"]}): e.g., {component["output_example"]}',
     ]
     return "\n".join(parts)
+
+
+def _response_format(structured_outputs: bool) -> dict:
+    """Return the strict schema response_format, or plain JSON mode."""
+    if not structured_outputs:
+        return JSON_OBJECT_FORMAT
+    return _SCHEMA_FORMAT
+
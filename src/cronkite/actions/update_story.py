@@ -0,0 +1,410 @@
+import asyncio
+import json
+
+import openai
+
+from cronkite.config import CronkiteConfig
+from cronkite.dedup import expand_ids
+from cronkite.instruction_builder import build_response_format, build_update_instruction
+from cronkite.llm import AsyncLLMClient, LLMClient
+from cronkite.metrics import story_meta
+from cronkite.models import Story, as_dict
+from cronkite.actions.generate_story import (
+    _budgeted_articles,
+    _collapse_duplicates,
+    _gazetteer_location,
+    _prefilter_noise,
+    _substory_config,
+)
+
+
+# Story fields carried over from the previous story and the config flag that
+# controls whether the model may revise them
+UPDATABLE_FIELDS = {
+    "title": "generate_title",
+    "summary": "generate_summary",
+    "key_points": "generate_key_points",
+    "quotes": "extract_quotes",
+    "location": "resolve_location",
+}
+
+
+def update_story(
+    llm: LLMClient,
+    model: str,
+    story: dict | Story,
+    articles: list[dict],
+    config: CronkiteConfig,
+) -> dict:
+    """
+    Incrementally update a story with new or changed articles.
+
+    Only the delta articles are sent to the model, alongside the previous
+    story's summary, key points and quotes. Like generate_story, the delta
+    is deduplicated and prefiltered when config asks for it, and fitted to
+    config.article_token_budget. Noise decisions for untouched articles are
+    kept, and only sub-stories whose article_ids changed are regenerated.
+
+    Args:
+        llm: LLMClient used for model calls
+        model: Model identifier (e.g., "gpt-4o")
+        story: Previously generated story dict or Story
+        articles: New or changed article dicts with id, title, summary, text,
+                  published_at, source
+        config: Pipeline configuration
+
+    Returns:
+        Updated story dict with the same shape as generate_story's output
+    """
+    story = as_dict(story)
+    if not articles:
+        return _without_meta(story)
+
+    with story_meta(config.include_meta) as meta:
+        update_model = config.model_for("update_story", model)
+        delta, members, prefiltered = _prepare_delta(llm, update_model, articles, config)
+        payload = _update_payload(llm, update_model, story, delta, config.article_token_budget)
+        response = llm.complete_json(
+            update_model, build_update_instruction(config), payload, build_response_format(config), "update_story",
+        )
+
+        response = _expand_response(response, members, prefiltered)
+        updated, subgroups = _merge_update(story, response, articles, config)
+        _update_location(llm, updated, delta, config)
+        if subgroups is not None:
+            updated["sub_stories"] = [
+                _update_substory(llm, model, subgroup, story, delta, config)
+                for subgroup in subgroups
+            ]
+
+    if meta:
+        updated["_meta"] = meta
+    return updated
+
+
+async def update_story_async(
+    llm: AsyncLLMClient,
+    model: str,
+    story: dict | Story,
+    articles: list[dict],
+    config: CronkiteConfig,
+    max_concurrency: int = 8,
+) -> dict:
+    """
+    Async variant of update_story that regenerates sub-stories concurrently.
+
+    Args:
+        llm: AsyncLLMClient used for model calls
+        model: Model identifier (e.g., "gpt-4o")
+        story: Previously generated story dict or Story
+        articles: New or changed article dicts
+        config: Pipeline configuration
+        max_concurrency: Maximum number of sub-story calls in flight at once
+
+    Returns:
+        Updated story dict with the same shape as generate_story's output
+    """
+    story = as_dict(story)
+    if not articles:
+        return _without_meta(story)
+
+    with story_meta(config.include_meta) as meta:
+        update_model = config.model_for("update_story", model)
+        delta, members, prefiltered = _prepare_delta(llm, update_model, articles, config)
+        payload = _update_payload(llm, update_model, story, delta, config.article_token_budget)
+        response = await llm.complete_json(
+            update_model, build_update_instruction(config), payload, build_response_format(config), "update_story",
+        )
+
+        response = _expand_response(response, members, prefiltered)
+        updated, subgroups = _merge_update(story, response, articles, config)
+        _update_location(llm, updated, delta, config)
+        if subgroups is not None:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def bounded(subgroup: dict) -> dict:
+                async with semaphore:
+                    return await _update_substory_async(llm, model, subgroup, story, delta, config)
+
+            updated["sub_stories"] = list(
+                await asyncio.gather(*(bounded(subgroup) for subgroup in subgroups))
+            )
+
+    if meta:
+        updated["_meta"] = meta
+    return updated
+
+
+def _prepare_delta(
+    llm: LLMClient | AsyncLLMClient,
+    model: str,
+    articles: list[dict],
+    config: CronkiteConfig,
+) -> tuple[list[dict], dict[str, list[str]] | None, list[str]]:
+    """
+    Collapse duplicates in and prefilter the delta, as generate_story does.
+
+    Returns:
+        Tuple of (articles to send to the model, duplicate members mapping
+        or None, IDs the prefilter dropped as noise)
+    """
+    members = None
+    if config.collapse_duplicates:
+        articles, members = _collapse_duplicates(llm, articles, config)
+    prefiltered = []
+    if config.prefilter_noise and config.filter_noise:
+        articles, prefiltered = _prefilter_noise(llm, model, articles, config)
+    return articles, members, prefiltered
+
+
+def _expand_response(response: dict, members: dict[str, list[str]] | None, prefiltered: list[str]) -> dict:
+    """
+    Extend the model's judgement of each representative article to its
+    duplicates, and count prefiltered articles as noise.
+    """
+    if not members and not prefiltered:
+        return response
+    noise = response.get("noise_article_ids", [])
+    if members:
+        # Only representatives were sent, so a verdict on anything else is spurious
+        noise = [i for i in noise if i in members]
+    else:
+        members = {}
+    noise = noise + prefiltered
+    expanded = {**response, "noise_article_ids": expand_ids(noise, members)}
+    if "subgroups" in response:
+        expanded["subgroups"] = [
+            {**subgroup, "article_ids": expand_ids(subgroup.get("article_ids", []), members)}
+            for subgroup in response["subgroups"]
+        ]
+    return expanded
+
+
+def _without_meta(story: dict) -> dict:
+    """Copy of story without the _meta block describing the calls that made it."""
+    return {field: value for field, value in story.items() if field != "_meta"}
+
+
+def _update_payload(
+    llm: LLMClient | AsyncLLMClient,
+    model: str,
+    story: dict,
+    articles: list[dict],
+    token_budget: int | None,
+) -> str:
+    """Serialize the previous story and delta articles for the update call."""
+    previous_story = {
+        "title": story.get("title", ""),
+        "summary": story.get("summary", ""),
+        "key_points": story.get("key_points", []),
+        "quotes": story.get("quotes", []),
+        "location": story.get("location"),
+        "sub_stories": [
+            {"theme": sub_story.get("title", ""), "article_ids": sub_story.get("article_ids", [])}
+            for sub_story in story.get("sub_stories", [])
+        ],
+    }
+    return json.dumps({"previous_story": previous_story, "articles": _budgeted_articles(llm, model, articles, token_budget)})
+
+
+def _merge_update(
+    story: dict,
+    response: dict,
+    articles: list[dict],
+    config: CronkiteConfig,
+) -> tuple[dict, list[dict] | None]:
+    """
+    Merge the update response into the previous story.
+
+    Returns:
+        Tuple of (updated story, subgroups to resolve into sub-stories). The
+        subgroups are None when sub-stories should be carried over unchanged.
+    """
+    delta_ids = [a["id"] for a in articles]
+    delta_set = set(delta_ids)
+
+    # Only the delta articles are re-judged; earlier noise decisions stand
+    delta_noise = set()
+    if config.filter_noise:
+        delta_noise = {i for i in response.get("noise_article_ids", []) if i in delta_set}
+
+    noise_article_ids = [i for i in story.get("noise_article_ids", []) if i not in delta_set]
+    noise_article_ids += [i for i in delta_ids if i in delta_noise]
+    article_ids = [i for i in story.get("article_ids", []) if i not in delta_set]
+    article_ids += [i for i in delta_ids if i not in delta_noise]
+
+    updated = _without_meta(story)
+    for field, flag in UPDATABLE_FIELDS.items():
+        if getattr(config, flag) and field in response:
+            updated[field] = response[field]
+    updated["article_ids"] = article_ids
+    updated["noise_article_ids"] = noise_article_ids
+
+    if not article_ids:
+        updated["sub_stories"] = []
+        return updated, None
+
+    if not (config.group_articles and config.generate_substories) or "subgroups" not in response:
+        return updated, None
+
+    known_ids = set(article_ids)
+    subgroups = [
+        {
+            "theme": subgroup.get("theme", ""),
+            "article_ids": [i for i in subgroup.get("article_ids", []) if i in known_ids],
+        }
+        for subgroup in response.get("subgroups", [])
+    ]
+    return updated, subgroups
+
+
+def _update_location(
+    llm: LLMClient | AsyncLLMClient,
+    updated: dict,
+    articles: list[dict],
+    config: CronkiteConfig,
+) -> None:
+    """
+    Apply config.gazetteer_location to an updated story's location.
+
+    The model's revision is validated against the delta articles that
+    belong to the story. A locally resolved location is kept once set and
+    only resolved from the delta when the story has none yet.
+    """
+    if not config.gazetteer_location:
+        return
+    if not config.resolve_location and updated.get("location") is not None:
+        return
+    kept = set(updated["article_ids"])
+    updated["location"] = _gazetteer_location(
+        llm, updated.get("location"), [a for a in articles if a["id"] in kept], config
+    )
+
+
+def _plan_substory(subgroup: dict, story: dict, articles: list[dict]) -> tuple[dict | None, dict | None, list[dict]]:
+    """
+    Decide how to produce a sub-story for an updated subgroup.
+
+    Returns:
+        Tuple of (sub-story to reuse as-is, previous sub-story to update,
+        delta articles belonging to the subgroup). Exactly one of the first
+        two is set when a previous sub-story matches.
+    """
+    article_ids = subgroup["article_ids"]
+    id_set = set(article_ids)
+    delta_articles = [a for a in articles if a["id"] in id_set]
+
+    previous = None
+    best_overlap = 0
+    for sub_story in story.get("sub_stories", []):
+        previous_ids = set(sub_story.get("article_ids", []))
+        if previous_ids == id_set and not delta_articles:
+            return sub_story, None, delta_articles
+        overlap = len(previous_ids & id_set)
+        if overlap > best_overlap:
+            previous, best_overlap = sub_story, overlap
+
+    if previous is not None and not delta_articles:
+        return {**previous, "article_ids": article_ids}, None, delta_articles
+
+    return None, previous, delta_articles
+
+
+def _update_substory(
+    llm: LLMClient,
+    model: str,
+    subgroup: dict,
+    story: dict,
+    articles: list[dict],
+    config: CronkiteConfig,
+) -> dict:
+    """
+    Reuse or regenerate the sub-story for an updated subgroup.
+
+    If the call fails after the scheduler's retries, the previous sub-story's
+    title and summary (or the subgroup theme) are kept.
+    """
+    reused, previous, delta_articles = _plan_substory(subgroup, story, articles)
+    if reused is not None:
+        return reused
+    if not delta_articles:
+        return _theme_substory(subgroup)
+
+    substory_config = _substory_config(config)
+    instruction = build_update_instruction(substory_config)
+    substory_model = config.model_for("generate_substory", model)
+    payload = _substory_payload(llm, substory_model, previous, delta_articles, config.article_token_budget)
+    try:
+        response = llm.complete_json(
+            substory_model, instruction, payload,
+            build_response_format(substory_config), "update_substory",
+        )
+    except openai.OpenAIError:
+        llm.stats.add(substories_failed=1)
+        response = {}
+    return _build_updated_substory(response, subgroup, previous)
+
+
+async def _update_substory_async(
+    llm: AsyncLLMClient,
+    model: str,
+    subgroup: dict,
+    story: dict,
+    articles: list[dict],
+    config: CronkiteConfig,
+) -> dict:
+    """Async variant of _update_substory."""
+    reused, previous, delta_articles = _plan_substory(subgroup, story, articles)
+    if reused is not None:
+        return reused
+    if not delta_articles:
+        return _theme_substory(subgroup)
+
+    substory_config = _substory_config(config)
+    instruction = build_update_instruction(substory_config)
+    substory_model = config.model_for("generate_substory", model)
+    payload = _substory_payload(llm, substory_model, previous, delta_articles, config.article_token_budget)
+    try:
+        response = await llm.complete_json(
+            substory_model, instruction, payload,
+            build_response_format(substory_config), "update_substory",
+        )
+    except openai.OpenAIError:
+        llm.stats.add(substories_failed=1)
+        response = {}
+    return _build_updated_substory(response, subgroup, previous)
+
+
+def _substory_payload(
+    llm: LLMClient | AsyncLLMClient,
+    model: str,
+    previous: dict | None,
+    articles: list[dict],
+    token_budget: int | None,
+) -> str:
+    """Serialize a previous sub-story and its delta articles."""
+    previous_story = {
+        "title": previous.get("title", "") if previous else "",
+        "summary": previous.get("summary", "") if previous else "",
+    }
+    return json.dumps({"previous_story": previous_story, "articles": _budgeted_articles(llm, model, articles, token_budget)})
+
+
+def _build_updated_substory(response: dict, subgroup: dict, previous: dict | None) -> dict:
+    """Build a sub-story dict from an update response."""
+    fallback_title = previous.get("title", "") if previous else subgroup["theme"]
+    fallback_summary = previous.get("summary", "") if previous else ""
+    return {
+        "title": response.get("title", fallback_title),
+        "summary": response.get("summary", fallback_summary),
+        "article_ids": subgroup["article_ids"],
+    }
+
+
+def _theme_substory(subgroup: dict) -> dict:
+    """Return a sub-story titled by theme for a subgroup with no article text."""
+    return {
+        "title": subgroup["theme"],
+        "summary": "",
+        "article_ids": subgroup["article_ids"],
+    }
@@ -0,0 +1,79 @@
+from collections.abc import Iterable
+
+
+class ArticleIndex:
+    """
+    A cluster's articles indexed by ID.
+
+    One index is built per story and shared by noise filtering, sub-story
+    selection and response parsing, so resolving the IDs the model returns
+    costs a dict lookup per ID rather than a scan of the cluster. IDs that
+    match no article in the cluster are collected in hallucinated_ids.
+    """
+
+    def __init__(self, articles: list[dict]):
+        self.articles = articles
+        self.hallucinated_ids: set[str] = set()
+        self._positions = {article["id"]: i for i, article in enumerate(articles)}
+        # IDs of cluster articles left out of this index by without()
+        self._excluded: frozenset[str] = frozenset()
+        self._subsets: dict[tuple[str, ...], "ArticleIndex"] = {}
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+    def __contains__(self, article_id: str) -> bool:
+        return article_id in self._positions
+
+    @property
+    def ids(self) -> list[str]:
+        """IDs of the indexed articles, in article order."""
+        return [article["id"] for article in self.articles]
+
+    def resolve(self, ids: Iterable) -> list[str]:
+        """
+        Return the IDs that name articles in this index.
+
+        Args:
+            ids: Article IDs as returned by the model
+
+        Returns:
+            Matching IDs, deduplicated and in article order. IDs matching no
+            article in the cluster are recorded in hallucinated_ids; IDs of
+            articles excluded by without() are dropped silently.
+        """
+        positions = self._positions
+        found = set()
+        for article_id in ids:
+            if not isinstance(article_id, str):
+                self.hallucinated_ids.add(str(article_id))
+            elif article_id in positions:
+                found.add(article_id)
+            elif article_id not in self._excluded:
+                self.hallucinated_ids.add(article_id)
+        return sorted(found, key=positions.__getitem__)
+
+    def select(self, ids: Iterable) -> list[dict]:
+        """Return the articles named by ids, in article order."""
+        return [self.articles[self._positions[article_id]] for article_id in self.resolve(ids)]
+
+    def without(self, ids: Iterable) -> "ArticleIndex":
+        """
+        Return an index of the articles not named by ids (e.g., minus noise).
+
+        The result shares hallucinated_ids with this index and is memoized,
+        so repeated calls with the same IDs do not rescan the cluster.
+        """
+        removed = self.resolve(ids)
+        if not removed:
+            return self
+
+        key = tuple(removed)
+        subset = self._subsets.get(key)
+        if subset is None:
+            removed_ids = set(removed)
+            subset = ArticleIndex([a for a in self.articles if a["id"] not in removed_ids])
+            subset.hallucinated_ids = self.hallucinated_ids
+            subset._excluded = self._excluded | removed_ids
+            self._subsets[key] = subset
+        return subset
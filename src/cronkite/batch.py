@@ -0,0 +1,324 @@
+import io
+import json
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+
+from cronkite.actions.generate_stories import StoryResult
+from cronkite.actions.generate_story import (
+    _articles_payload,
+    _assemble_story,
+    _build_substory,
+    _collapse_duplicates,
+    _empty_story,
+    _empty_substory,
+    _prefilter_noise,
+    _record_hallucinated,
+    _select_subgroup,
+    _substory_config,
+)
+from cronkite.article_index import ArticleIndex
+from cronkite.cache import cache_key
+from cronkite.config import CronkiteConfig
+from cronkite.dedup import expand_story
+from cronkite.instruction_builder import build_instruction, build_response_format, plan_story_calls
+from cronkite.llm import JSON_OBJECT_FORMAT, LLMClient, build_messages
+from cronkite.metrics import CallEvent, emit, estimate_cost
+from cronkite.prefilter import merge_noise
+
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+# Batch API requests are billed at half the synchronous price
+BATCH_DISCOUNT = 0.5
+
+# Maximum requests the Batch API accepts in one input file
+MAX_BATCH_REQUESTS = 50_000
+
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class BatchError(RuntimeError):
+    """A batch request produced no usable result."""
+
+
+@dataclass
+class BatchRequest:
+    """One chat completion call to submit through the Batch API."""
+
+    custom_id: str
+    model: str
+    instruction: str
+    payload: str
+    action: str
+    response_format: dict | None = None
+
+
+def generate_stories_batch(
+    llm: LLMClient,
+    model: str,
+    clusters: Iterable[list[dict]],
+    config: CronkiteConfig,
+    poll_interval: float = 30.0,
+    completion_window: str = "24h",
+) -> list[StoryResult]:
+    """
+    Generate stories for many clusters through the OpenAI Batch API.
+
+    Main stories are submitted as one batch wave. Once it completes, the
+    sub-stories for every cluster are submitted as a second wave.
+
+    Args:
+        llm: LLMClient whose client submits the batches
+        model: Model identifier (e.g., "gpt-4o")
+        clusters: Iterable of article lists, one per cluster
+        config: Pipeline configuration
+        poll_interval: Seconds between batch status checks
+        completion_window: Batch completion window passed to the API
+
+    Returns:
+        StoryResult per cluster in input order. Clusters whose request
+        failed carry a BatchError instead of a story.
+
+    Raises:
+        ValueError: If config.models routes story components to more than
+                    one model, which would need a call per model
+    """
+    # Batches always make the unified call (split_execution is ignored)
+    first, rest = plan_story_calls(replace(config, split_execution=False), model)
+    if first is None or rest:
+        raise ValueError("Batch generation needs every story component routed to the same model")
+    story_model = first.model
+    substory_model = config.model_for("generate_substory", model)
+
+    start = time.perf_counter()
+    clusters = list(clusters)
+    instruction = build_instruction(config)
+    response_format = build_response_format(config)
+
+    # Wave 1: one main story request per cluster
+    prepared, requests = {}, []
+    for index, articles in enumerate(clusters):
+        members = None
+        if articles and config.collapse_duplicates:
+            articles, members = _collapse_duplicates(llm, articles, config)
+        cluster, prefiltered = articles, []
+        if articles and config.prefilter_noise and config.filter_noise:
+            articles, prefiltered = _prefilter_noise(llm, story_model, articles, config)
+        prepared[index] = (articles, members, cluster, prefiltered)
+        if articles:
+            payload = _articles_payload(llm, story_model, articles, config.article_token_budget)
+            requests.append(BatchRequest(
+                f"story-{index}", story_model, instruction, payload, "generate_story", response_format
+            ))
+    responses = run_batch(llm, requests, poll_interval, completion_window)
+
+    stories, errors, subgroups_by_index = {}, {}, {}
+    for index, (articles, *_) in prepared.items():
+        if not articles:
+            stories[index] = _empty_story()
+            continue
+        response = responses[f"story-{index}"]
+        if isinstance(response, Exception):
+            errors[index] = response
+            continue
+        article_index = ArticleIndex(articles)
+        story, subgroups, filtered = _assemble_story(llm, response, article_index, config)
+        stories[index] = story
+        subgroups_by_index[index] = [
+            _select_subgroup(subgroup, filtered) + (subgroup,) for subgroup in subgroups
+        ]
+        _record_hallucinated(llm, article_index)
+
+    # Wave 2: sub-stories for every cluster that produced subgroups
+    substory_config = _substory_config(config)
+    substory_instruction = build_instruction(substory_config)
+    substory_format = build_response_format(substory_config)
+    requests = [
+        BatchRequest(
+            f"substory-{index}-{position}",
+            substory_model,
+            substory_instruction,
+            _articles_payload(llm, substory_model, subgroup_articles, config.article_token_budget),
+            "generate_substory",
+            substory_format,
+        )
+        for index, selected in subgroups_by_index.items()
+        for position, (_, subgroup_articles, _) in enumerate(selected)
+        if subgroup_articles
+    ]
+    responses = run_batch(llm, requests, poll_interval, completion_window)
+
+    for index, selected in subgroups_by_index.items():
+        sub_stories = []
+        for position, (article_ids, subgroup_articles, subgroup) in enumerate(selected):
+            if not subgroup_articles:
+                sub_stories.append(_empty_substory(subgroup))
+                continue
+            response = responses[f"substory-{index}-{position}"]
+            if isinstance(response, Exception):
+                llm.stats.add(substories_failed=1)
+                sub_stories.append({**_empty_substory(subgroup), "article_ids": article_ids})
+            else:
+                sub_stories.append(_build_substory(response, subgroup, article_ids))
+        stories[index]["sub_stories"] = sub_stories
+
+    elapsed = time.perf_counter() - start
+    results = []
+    for index, (_, members, cluster, prefiltered) in prepared.items():
+        if index in errors:
+            results.append(StoryResult(index, None, errors[index], elapsed))
+            continue
+        story = stories[index]
+        if prefiltered:
+            story = merge_noise(story, prefiltered, cluster)
+        if members:
+            story = expand_story(story, members)
+        results.append(StoryResult(index, story, None, elapsed))
+    return results
+
+
+def run_batch(
+    llm: LLMClient,
+    requests: list[BatchRequest],
+    poll_interval: float = 30.0,
+    completion_window: str = "24h",
+) -> dict[str, dict | Exception]:
+    """
+    Submit chat completion requests through the Batch API and wait for them.
+
+    Requests already in the LLMClient's cache are answered from it, and
+    completed responses are stored in it.
+
+    Args:
+        llm: LLMClient whose client submits the batches
+        requests: Requests with unique custom_ids
+        poll_interval: Seconds between batch status checks
+        completion_window: Batch completion window passed to the API
+
+    Returns:
+        Dict of custom_id to the parsed JSON response, or to a BatchError
+        when the request failed or the batch ended without it
+    """
+    results, pending, keys = {}, [], {}
+    for request in requests:
+        response_format = request.response_format or JSON_OBJECT_FORMAT
+        if llm.cache is not None:
+            key = cache_key(request.model, request.instruction, request.payload, response_format)
+            cached = llm.cache.get(key)
+            if cached is not None:
+                emit(CallEvent(request.action, request.model, 0.0, cache_hit=True), llm.hooks)
+                results[request.custom_id] = json.loads(cached)
+                continue
+            keys[request.custom_id] = key
+        pending.append(request)
+
+    if not pending:
+        return results
+
+    start = time.perf_counter()
+    chunks = [pending[i:i + MAX_BATCH_REQUESTS] for i in range(0, len(pending), MAX_BATCH_REQUESTS)]
+    batch_ids = [_submit(llm, chunk, completion_window) for chunk in chunks]
+
+    for batch_id, chunk in zip(batch_ids, chunks):
+        batch = _wait(llm, batch_id, poll_interval)
+        elapsed = time.perf_counter() - start
+
+        by_id = {request.custom_id: request for request in chunk}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in llm.client.files.content(file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                result = json.loads(line)
+                request = by_id.get(result.get("custom_id"))
+                if request is not None:
+                    results[request.custom_id] = _parse_result(llm, request, result, elapsed, keys)
+
+        # Requests left without a result (e.g., the batch expired first)
+        for request in chunk:
+            if request.custom_id not in results:
+                results[request.custom_id] = BatchError(
+                    f"Batch {batch_id} ended with status {batch.status} "
+                    f"before {request.custom_id} completed"
+                )
+    return results
+
+
+def _submit(llm: LLMClient, requests: list[BatchRequest], completion_window: str) -> str:
+    """Upload requests as a JSONL input file and create a batch. Returns its ID."""
+    lines = [
+        json.dumps({
+            "custom_id": request.custom_id,
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": {
+                "model": request.model,
+                "messages": build_messages(request.instruction, request.payload),
+                "response_format": request.response_format or JSON_OBJECT_FORMAT,
+            },
+        })
+        for request in requests
+    ]
+    data = io.BytesIO(("\n".join(lines) + "\n").encode("utf-8"))
+    input_file = llm.client.files.create(file=("cronkite_batch.jsonl", data), purpose="batch")
+    batch = llm.client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window=completion_window,
+    )
+    llm.stats.add(batches_submitted=1, batch_requests=len(requests))
+    return batch.id
+
+
+def _wait(llm: LLMClient, batch_id: str, poll_interval: float):
+    """Poll a batch until it reaches a terminal status."""
+    while True:
+        batch = llm.client.batches.retrieve(batch_id)
+        if batch.status in TERMINAL_STATUSES:
+            return batch
+        time.sleep(poll_interval)
+
+
+def _parse_result(
+    llm: LLMClient,
+    request: BatchRequest,
+    result: dict,
+    elapsed: float,
+    keys: dict[str, str],
+) -> dict | Exception:
+    """Turn one line of a batch output or error file into a parsed response."""
+    response = result.get("response") or {}
+    if result.get("error") or response.get("status_code") != 200:
+        error = result.get("error") or response.get("body", {}).get("error")
+        return BatchError(f"Batch request {request.custom_id} failed: {error}")
+
+    body = response["body"]
+    usage = body.get("usage") or {}
+    prompt_tokens = usage.get("prompt_tokens", 0)
+    completion_tokens = usage.get("completion_tokens", 0)
+    cached_prompt_tokens = (usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0)
+    cost = estimate_cost(request.model, prompt_tokens, completion_tokens, cached_prompt_tokens)
+    emit(
+        CallEvent(
+            action=request.action,
+            model=request.model,
+            latency=elapsed,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cost=cost * BATCH_DISCOUNT,
+            cached_prompt_tokens=cached_prompt_tokens,
+        ),
+        llm.hooks,
+    )
+
+    content = body["choices"][0]["message"]["content"]
+    try:
+        parsed = json.loads(content)
+    except (TypeError, json.JSONDecodeError):
+        return BatchError(f"Batch request {request.custom_id} returned invalid JSON")
+
+    if request.custom_id in keys:
+        llm.cache.set(keys[request.custom_id], content)
+    return parsed
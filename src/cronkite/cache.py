@@ -0,0 +1,214 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+
+
+def cache_key(model: str, instruction: str, payload: str, response_format: dict) -> str:
+    """
+    Build a content-addressed cache key for an LLM call.
+
+    Args:
+        model: Model identifier
+        instruction: System instruction
+        payload: User message content
+        response_format: response_format passed to the API
+
+    Returns:
+        Hex SHA-256 digest identifying the request
+    """
+    material = json.dumps(
+        [model, instruction, payload, response_format],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ResponseCache(ABC):
+    """
+    Base class for LLM response caches.
+
+    Subclasses implement _get, _set and clear; this class keeps the
+    hit/miss counters.
+    """
+
+    def __init__(self, max_entries: int | None = None, ttl: float | None = None):
+        """
+        Args:
+            max_entries: Maximum entries to keep before evicting the least
+                         recently used. None means unbounded.
+            ttl: Seconds an entry stays valid. None means entries never expire.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response content for key, or None on a miss."""
+        with self._lock:
+            value = self._get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store response content under key."""
+        with self._lock:
+            self._set(key, value)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and hit ratio."""
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / total if total else 0.0,
+        }
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+    @abstractmethod
+    def _get(self, key: str) -> str | None:
+        """Return the value for key, or None if missing or expired. Called under the lock."""
+
+    @abstractmethod
+    def _set(self, key: str, value: str) -> None:
+        """Store value under key, evicting as needed. Called under the lock."""
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl is not None and time.time() - created_at > self.ttl
+
+
+class MemoryCache(ResponseCache):
+    """In-memory LRU response cache."""
+
+    def __init__(self, max_entries: int | None = 1024, ttl: float | None = None):
+        super().__init__(max_entries, ttl)
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _get(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, created_at = entry
+        if self._expired(created_at):
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def _set(self, key: str, value: str) -> None:
+        self._entries[key] = (value, time.time())
+        self._entries.move_to_end(key)
+        if self.max_entries is not None:
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class SQLiteCache(ResponseCache):
+    """On-disk response cache backed by SQLite, with LRU eviction."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int | None = 100_000,
+        ttl: float | None = None,
+    ):
+        """
+        Args:
+            path: SQLite database file. Created if missing.
+            max_entries: Maximum entries to keep before evicting the least
+                         recently used. None means unbounded.
+            ttl: Seconds an entry stays valid. None means entries never expire.
+        """
+        super().__init__(max_entries, ttl)
+        self.path = Path(path)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+        )
+        self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def _get(self, key: str) -> str | None:
+        row = self._conn.execute(
+            "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        value, created_at = row
+        if self._expired(created_at):
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+            return None
+
+        self._conn.execute(
+            "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+        )
+        self._conn.commit()
+        return value
+
+    def _set(self, key: str, value: str) -> None:
+        now = time.time()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+            (key, value, now, now),
+        )
+        if self.ttl is not None:
+            self._conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl,))
+        if self.max_entries is not None:
+            self._conn.execute(
+                """
+                DELETE FROM responses WHERE key IN (
+                    SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+        self._conn.commit()
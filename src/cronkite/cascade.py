@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+
+from cronkite.config import CronkiteConfig
+
+
+@dataclass(frozen=True)
+class Cascade:
+    """
+    Generate stories with a cheaper model first, escalating on weak results.
+
+    Each story from the cheap model is scored by local checks (see
+    check_story); if any check fails, the story is regenerated with the
+    main model. Stories with no kept articles are accepted as they are.
+    """
+
+    # Model tried first (e.g., "gpt-4o-mini")
+    model: str = "gpt-4o-mini"
+
+    # Accepted title length in words. The prompt asks for 3-7.
+    min_title_words: int = 2
+    max_title_words: int = 9
+
+    # Accepted key point count. The prompt asks for 3-6.
+    min_key_points: int = 3
+    max_key_points: int = 6
+
+    # Escalate when more than this share of the cluster is marked noise
+    max_noise_ratio: float = 0.5
+
+
+def check_story(
+    story: dict,
+    articles: list[dict],
+    config: CronkiteConfig,
+    cascade: Cascade,
+) -> list[str]:
+    """
+    Score a generated story with local heuristics.
+
+    Args:
+        story: Story dict returned by generate_story
+        articles: Articles the story was generated from
+        config: Pipeline configuration the story was generated with
+        cascade: Thresholds for the checks
+
+    Returns:
+        Names of the failed checks ("schema", "title_length",
+        "key_point_count", "quote_article_ids", "noise_ratio"). Empty when
+        the story passes, and for a story with no kept articles (an empty
+        cluster, or one that is all noise), which the main model could
+        not improve on.
+    """
+    if not _valid_schema(story, config):
+        return ["schema"]
+    if not story["article_ids"]:
+        return []
+
+    failed = []
+    if config.generate_title:
+        words = len(story["title"].split())
+        if not cascade.min_title_words <= words <= cascade.max_title_words:
+            failed.append("title_length")
+
+    if config.generate_key_points:
+        if not cascade.min_key_points <= len(story["key_points"]) <= cascade.max_key_points:
+            failed.append("key_point_count")
+
+    if config.extract_quotes:
+        article_ids = set(story["article_ids"])
+        if any(quote["article_id"] not in article_ids for quote in story["quotes"]):
+            failed.append("quote_article_ids")
+
+    if articles and len(story["noise_article_ids"]) / len(articles) > cascade.max_noise_ratio:
+        failed.append("noise_ratio")
+
+    return failed
+
+
+def _valid_schema(story: dict, config: CronkiteConfig) -> bool:
+    """
+    Whether the enabled fields are present with the expected types.
+
+    Title and summary must also be non-empty when the story kept articles.
+    """
+    if not isinstance(story.get("article_ids"), list):
+        return False
+    kept = bool(story["article_ids"])
+    if config.generate_title and not (isinstance(story.get("title"), str) and (story["title"] or not kept)):
+        return False
+    if config.generate_summary and not (isinstance(story.get("summary"), str) and (story["summary"] or not kept)):
+        return False
+    if config.generate_key_points:
+        key_points = story.get("key_points")
+        if not isinstance(key_points, list) or not all(isinstance(p, str) for p in key_points):
+            return False
+    if config.extract_quotes:
+        quotes = story.get("quotes")
+        if not isinstance(quotes, list):
+            return False
+        for quote in quotes:
+            if not isinstance(quote, dict) or not isinstance(quote.get("text"), str) or "article_id" not in quote:
+                return False
+    if config.resolve_location:
+        location = story.get("location")
+        if location is not None and not isinstance(location, dict):
+            return False
+    return True
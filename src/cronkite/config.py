@@ -1,9 +1,32 @@
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 
-@dataclass
+# Actions a model can be routed to with CronkiteConfig.models: each story
+# component, the sub-story pass, updates, classification and grouping
+ROUTABLE_ACTIONS = frozenset({
+    "filter_noise",
+    "group_articles",
+    "generate_title",
+    "generate_summary",
+    "generate_key_points",
+    "extract_quotes",
+    "resolve_location",
+    "generate_substory",
+    "update_story",
+    "classify_stories",
+    "group_stories",
+})
+
+
+@dataclass(frozen=True)
 class CronkiteConfig:
-    """Configuration for which pipeline actions to run."""
+    """
+    Configuration for which pipeline actions to run.
+
+    Frozen so it is hashable: instructions are compiled once per distinct
+    config. Use dataclasses.replace to derive a modified config.
+    """
 
     filter_noise: bool = True
     group_articles: bool = True
@@ -13,3 +36,57 @@ class CronkiteConfig:
     extract_quotes: bool = True
     resolve_location: bool = True
     generate_substories: bool = True
+
+    # Collapse near-duplicate articles (e.g., wire copy) before the LLM call
+    collapse_duplicates: bool = False
+    duplicate_threshold: float = 0.7
+
+    # Drop clear outliers (by TF-IDF similarity to the cluster centroid) and
+    # generic roundups locally before the LLM call; borderline articles are
+    # still judged by the model. Requires filter_noise.
+    prefilter_noise: bool = False
+    prefilter_threshold: float = 0.08
+
+    # Check locations against the offline gazetteer (see locate.py). With
+    # resolve_location the model's answer is validated and normalised (ISO3
+    # codes, canonical names); without it the location is ranked from place
+    # mentions in the articles locally and no model tokens are spent on it.
+    # gazetteer_path points at a custom index built by cronkite.gazetteer.
+    gazetteer_location: bool = False
+    gazetteer_path: str | None = None
+
+    # Run the main story call as a noise-filtering call followed by
+    # concurrent smaller calls per component (grouping, title/summary/key
+    # points, quotes, location). Lower latency, more prompt tokens. Used by
+    # generate_story and generate_stories; streaming and batch stay unified.
+    split_execution: bool = False
+
+    # Token budget for the article payload of each call (None = unlimited)
+    article_token_budget: int | None = None
+
+    # Constrain responses to a strict JSON Schema built from the enabled
+    # components instead of JSON mode (requires a model that supports
+    # structured outputs)
+    structured_outputs: bool = False
+
+    # Attach a _meta block (latency, tokens, cost, cache hits) to stories
+    include_meta: bool = False
+
+    # Model per action (see ROUTABLE_ACTIONS), e.g. {"resolve_location":
+    # "gpt-4o-mini"}. Unlisted actions use the Cronkite instance's model.
+    # Given as a dict and stored as sorted (action, model) pairs.
+    models: Mapping[str, str] | tuple[tuple[str, str], ...] = ()
+
+    def __post_init__(self):
+        models = dict(self.models)
+        unknown = set(models) - ROUTABLE_ACTIONS
+        if unknown:
+            raise ValueError(f"Cannot route models for unknown actions: {', '.join(sorted(unknown))}")
+        object.__setattr__(self, "models", tuple(sorted(models.items())))
+
+    def model_for(self, action: str, default: str) -> str:
+        """Model routed to action, or default when none is."""
+        for routed_action, model in self.models:
+            if routed_action == action:
+                return model
+        return default
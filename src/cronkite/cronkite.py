@@ -1,12 +1,25 @@
-from dotenv import load_dotenv
-from openai import OpenAI
-
-load_dotenv()
+from collections.abc import AsyncIterator, Iterable, Iterator
+from dataclasses import replace
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from cronkite.config import CronkiteConfig
-from cronkite.actions import generate_story as _generate_story
-from cronkite.actions import classify_stories as _classify_stories
-from cronkite.actions import group_stories as _group_stories
+from cronkite.models import Article, Location, Quote, Story, SubStory
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
+
+    from cronkite.actions import StoryResult
+    from cronkite.cache import ResponseCache
+    from cronkite.cascade import Cascade
+    from cronkite.llm import AsyncLLMClient, LLMClient
+    from cronkite.metrics import MetricsHook
+    from cronkite.scheduler import Scheduler
+    from cronkite.transport import HTTPPool
+
+# openai, the LLM clients, the actions and the optional pieces (cache,
+# cascade, metrics, scheduler) are imported on first use rather than here,
+# which keeps cold starts short for workers that only need a few actions.
 
 
 class Cronkite:
@@ -14,54 +27,502 @@ class Cronkite:
     LLM-powered agent that generates cohesive news stories from article clusters.
     """
 
-    def __init__(self, model: str = "gpt-4o", config: CronkiteConfig | None = None):
+    def __init__(
+        self,
+        model: str = "gpt-4o",
+        config: CronkiteConfig | None = None,
+        cache: "ResponseCache | None" = None,
+        hooks: "list[MetricsHook] | None" = None,
+        scheduler: "Scheduler | None" = None,
+        cascade: "Cascade | None" = None,
+        client: "OpenAI | None" = None,
+        pool: "HTTPPool | None" = None,
+    ):
         """
         Initialize Cronkite with a configurable OpenAI model and pipeline config.
 
         Args:
             model: OpenAI model identifier (e.g., "gpt-4o", "gpt-4o-mini")
             config: Pipeline configuration. Defaults to all actions enabled.
+            cache: Optional response cache (e.g., MemoryCache, SQLiteCache)
+                   consulted before every LLM call
+            hooks: Metrics hooks (e.g., MetricsRecorder, PrometheusExporter)
+                   notified after every LLM call
+            scheduler: Scheduler applying rate limits, retries and priorities
+                       to every LLM call. Share one between instances that
+                       draw on the same API quota. Defaults to a new
+                       Scheduler with no rate limits.
+            cascade: Generate stories with cascade.model first and re-run
+                     them on model only when they fail local quality
+                     checks. Applies to generate_story and generate_stories.
+            client: OpenAI client to use instead of creating one. Created
+                    on first use when not given.
+            pool: HTTPPool whose connections the created client shares.
+                  Share one pool between instances to reuse connections.
+        """
+        self.model = model
+        self.config = config or CronkiteConfig()
+        self.cascade = cascade
+        if scheduler is None:
+            from cronkite.scheduler import Scheduler
+
+            scheduler = Scheduler()
+        self.scheduler = scheduler
+        self._cache = cache
+        self._hooks = hooks
+        self._pool = pool
+        if client is not None:
+            self.client = client
+
+    @cached_property
+    def client(self) -> "OpenAI":
+        """OpenAI client, created on first use."""
+        if self._pool is not None:
+            return self._pool.openai()
+        from openai import OpenAI
+
+        return OpenAI()
+
+    @cached_property
+    def llm(self) -> "LLMClient":
+        """LLMClient wrapping client, created on first use."""
+        from cronkite.llm import LLMClient
+
+        return LLMClient(self.client, cache=self._cache, hooks=self._hooks, scheduler=self.scheduler)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counters recorded by local pipeline stages (e.g., tokens_saved)."""
+        return self.llm.stats.snapshot()
+
+    @property
+    def escalation_rate(self) -> float:
+        """Share of cascaded stories re-run on the main model."""
+        return _escalation_rate(self.llm.stats.snapshot())
+
+    def generate_story(self, articles: list[dict | Article]) -> dict | Story:
+        """
+        Process articles through unified pipeline and return a story.
+
+        Args:
+            articles: List of article dicts or Article records with id,
+                      title, summary, text, published_at, source
+
+        Returns:
+            Story dict with title, summary, key_points, quotes, sub_stories,
+            article_ids, noise_article_ids. A Story record when the
+            articles are Article records.
+        """
+        from cronkite.actions.generate_story_cascade import generate_story_cascade
+        from cronkite.actions.generate_story import generate_story
+
+        if self.cascade is not None:
+            story = generate_story_cascade(self.llm, self.model, articles, self.config, self.cascade)
+        else:
+            story = generate_story(self.llm, self.model, articles, self.config)
+        return _as_story(story) if _typed(articles) else story
+
+    def generate_story_stream(self, articles: list[dict | Article]) -> Iterator[tuple[str, Any]]:
+        """
+        Generate a story, yielding each field as soon as it is produced.
+
+        Args:
+            articles: List of article dicts or Article records with id,
+                      title, summary, text, published_at, source
+
+        Yields:
+            (field, value) pairs: "title", "summary", "key_points", "quotes"
+            and "location" as each completes, "sub_story" for each sub-story,
+            and finally "story" with the complete story dict. Values are
+            records when the articles are Article records.
+        """
+        from cronkite.actions.generate_story_stream import generate_story_stream
+
+        events = generate_story_stream(self.llm, self.model, articles, self.config)
+        if not _typed(articles):
+            return events
+        return (_typed_event(field, value) for field, value in events)
+
+    def generate_stories(
+        self,
+        clusters: Iterable[list[dict | Article]],
+        max_concurrency: int = 8,
+    ) -> "Iterator[StoryResult]":
+        """
+        Generate stories for many clusters in parallel.
+
+        Args:
+            clusters: Iterable of article lists, one per cluster
+            max_concurrency: Maximum number of clusters processed at once
+
+        Yields:
+            StoryResult (index, story, error, elapsed) for each cluster in
+            completion order. Failed clusters carry their error and do not
+            stop the rest of the batch. Clusters of Article records get
+            Story records.
+        """
+        from cronkite.actions.generate_stories import generate_stories
+
+        typed = set()
+        results = generate_stories(
+            self.llm, self.model, _track_typed(clusters, typed), self.config, max_concurrency,
+            self.cascade,
+        )
+        return (_typed_result(result, typed) for result in results)
+
+    def generate_stories_batch(
+        self,
+        clusters: Iterable[list[dict | Article]],
+        poll_interval: float = 30.0,
+        completion_window: str = "24h",
+    ) -> "list[StoryResult]":
+        """
+        Generate stories for many clusters through the OpenAI Batch API.
+
+        Slower than generate_stories but billed at the Batch API discount,
+        which suits backfills where latency doesn't matter.
+
+        Args:
+            clusters: Iterable of article lists, one per cluster
+            poll_interval: Seconds between batch status checks
+            completion_window: Batch completion window passed to the API
+
+        Returns:
+            StoryResult (index, story, error, elapsed) for each cluster in
+            input order
+        """
+        from cronkite.batch import generate_stories_batch
+
+        typed = set()
+        results = generate_stories_batch(
+            self.llm, self.model, _track_typed(clusters, typed), self.config,
+            poll_interval, completion_window,
+        )
+        return [_typed_result(result, typed) for result in results]
+
+    def update_story(
+        self,
+        story: dict | Story,
+        articles: list[dict | Article],
+    ) -> dict | Story:
+        """
+        Incrementally update a story with new or changed articles.
+
+        Args:
+            story: Story previously returned by generate_story or update_story
+            articles: Only the new or changed articles
+
+        Returns:
+            Updated story, a Story record when story is one. Unchanged
+            articles keep their noise decisions and only sub-stories whose
+            article_ids changed are regenerated.
+        """
+        from cronkite.actions.update_story import update_story
+
+        updated = update_story(self.llm, self.model, story, articles, self.config)
+        return _as_story(updated) if isinstance(story, Story) else updated
+
+    def classify_stories(self, stories: list[dict | Story]) -> list[dict | Story]:
+        """
+        Classify stories by topic.
+
+        Args:
+            stories: List of story dicts or Story records with title,
+                     summary, key_points, etc.
+
+        Returns:
+            List of stories with 'topics' field added to each. Story
+            records come back as new Story records.
+        """
+        from cronkite.actions.classify_stories import classify_stories
+
+        return classify_stories(
+            self.llm, self.config.model_for("classify_stories", self.model), stories,
+            structured_outputs=self.config.structured_outputs,
+        )
+
+    def group_stories(
+        self,
+        group_a: list[dict | Story],
+        group_b: list[dict | Story],
+    ) -> list[dict]:
+        """
+        Link stories across two groups that cover the same underlying event.
+
+        Args:
+            group_a: First list of story dicts or Story records
+            group_b: Second list of story dicts or Story records
+
+        Returns:
+            List of link dicts, each with "group_a_index" and "group_b_index"
+            indicating which stories match across the two groups.
+        """
+        from cronkite.actions.group_stories import group_stories
+
+        return group_stories(
+            self.llm, self.config.model_for("group_stories", self.model), group_a, group_b,
+            structured_outputs=self.config.structured_outputs,
+        )
+
+
+class AsyncCronkite:
+    """
+    Async counterpart of Cronkite built on AsyncOpenAI.
+
+    Sub-stories are generated concurrently, so a story costs roughly two
+    LLM round-trips regardless of how many sub-groups the model returns.
+    """
+
+    def __init__(
+        self,
+        model: str = "gpt-4o",
+        config: CronkiteConfig | None = None,
+        max_concurrency: int = 8,
+        cache: "ResponseCache | None" = None,
+        hooks: "list[MetricsHook] | None" = None,
+        scheduler: "Scheduler | None" = None,
+        cascade: "Cascade | None" = None,
+        client: "AsyncOpenAI | None" = None,
+        pool: "HTTPPool | None" = None,
+    ):
+        """
+        Initialize AsyncCronkite with a configurable OpenAI model and pipeline config.
+
+        Args:
+            model: OpenAI model identifier (e.g., "gpt-4o", "gpt-4o-mini")
+            config: Pipeline configuration. Defaults to all actions enabled.
+            max_concurrency: Maximum number of concurrent sub-story calls per story
+            cache: Optional response cache consulted before every LLM call
+            hooks: Metrics hooks notified after every LLM call
+            scheduler: Scheduler applying rate limits, retries and priorities
+                       to every LLM call. Defaults to a new Scheduler with no
+                       rate limits.
+            cascade: Generate stories with cascade.model first and re-run
+                     them on model only when they fail local quality
+                     checks. Applies to generate_story and generate_stories.
+            client: AsyncOpenAI client to use instead of creating one.
+                    Created on first use when not given.
+            pool: HTTPPool whose connections the created client shares
         """
         self.model = model
         self.config = config or CronkiteConfig()
-        self.client = OpenAI()
+        self.max_concurrency = max_concurrency
+        self.cascade = cascade
+        if scheduler is None:
+            from cronkite.scheduler import Scheduler
+
+            scheduler = Scheduler()
+        self.scheduler = scheduler
+        self._cache = cache
+        self._hooks = hooks
+        self._pool = pool
+        if client is not None:
+            self.client = client
+
+    @cached_property
+    def client(self) -> "AsyncOpenAI":
+        """AsyncOpenAI client, created on first use."""
+        if self._pool is not None:
+            return self._pool.async_openai()
+        from openai import AsyncOpenAI
+
+        return AsyncOpenAI()
+
+    @cached_property
+    def llm(self) -> "AsyncLLMClient":
+        """AsyncLLMClient wrapping client, created on first use."""
+        from cronkite.llm import AsyncLLMClient
+
+        return AsyncLLMClient(self.client, cache=self._cache, hooks=self._hooks, scheduler=self.scheduler)
 
-    def generate_story(self, articles: list[dict]) -> dict:
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counters recorded by local pipeline stages (e.g., tokens_saved)."""
+        return self.llm.stats.snapshot()
+
+    @property
+    def escalation_rate(self) -> float:
+        """Share of cascaded stories re-run on the main model."""
+        return _escalation_rate(self.llm.stats.snapshot())
+
+    async def generate_story(self, articles: list[dict | Article]) -> dict | Story:
         """
         Process articles through unified pipeline and return a story.
 
         Args:
-            articles: List of article dicts with id, title, summary, text,
-                      published_at, source
+            articles: List of article dicts or Article records with id,
+                      title, summary, text, published_at, source
 
         Returns:
             Story dict with title, summary, key_points, quotes, sub_stories,
-            article_ids, noise_article_ids
+            article_ids, noise_article_ids. A Story record when the
+            articles are Article records.
+        """
+        from cronkite.actions.generate_story_cascade import generate_story_cascade_async
+        from cronkite.actions.generate_story import generate_story_async
+
+        if self.cascade is not None:
+            story = await generate_story_cascade_async(
+                self.llm, self.model, articles, self.config, self.cascade, self.max_concurrency
+            )
+        else:
+            story = await generate_story_async(
+                self.llm, self.model, articles, self.config, self.max_concurrency
+            )
+        return _as_story(story) if _typed(articles) else story
+
+    def generate_story_stream(self, articles: list[dict | Article]) -> AsyncIterator[tuple[str, Any]]:
+        """
+        Generate a story, yielding each field as soon as it is produced.
+
+        Args:
+            articles: List of article dicts or Article records with id,
+                      title, summary, text, published_at, source
+
+        Returns:
+            Async iterator of (field, value) pairs, as for
+            Cronkite.generate_story_stream
         """
-        return _generate_story(self.client, self.model, articles, self.config)
+        from cronkite.actions.generate_story_stream import generate_story_stream_async
+
+        events = generate_story_stream_async(
+            self.llm, self.model, articles, self.config, self.max_concurrency
+        )
+        if not _typed(articles):
+            return events
+        return (_typed_event(field, value) async for field, value in events)
 
-    def classify_stories(self, stories: list[dict]) -> list[dict]:
+    def generate_stories(
+        self,
+        clusters: Iterable[list[dict | Article]],
+        max_concurrency: int = 8,
+    ) -> "AsyncIterator[StoryResult]":
+        """
+        Generate stories for many clusters concurrently.
+
+        Args:
+            clusters: Iterable of article lists, one per cluster
+            max_concurrency: Maximum number of clusters processed at once
+
+        Returns:
+            Async iterator of StoryResult (index, story, error, elapsed) in
+            completion order. Clusters of Article records get Story records.
+        """
+        from cronkite.actions.generate_stories import generate_stories_async
+
+        typed = set()
+        results = generate_stories_async(
+            self.llm, self.model, _track_typed(clusters, typed), self.config, max_concurrency,
+            self.cascade,
+        )
+        return (_typed_result(result, typed) async for result in results)
+
+    async def update_story(
+        self,
+        story: dict | Story,
+        articles: list[dict | Article],
+    ) -> dict | Story:
+        """
+        Incrementally update a story with new or changed articles.
+
+        Args:
+            story: Story previously returned by generate_story or update_story
+            articles: Only the new or changed articles
+
+        Returns:
+            Updated story, a Story record when story is one
+        """
+        from cronkite.actions.update_story import update_story_async
+
+        updated = await update_story_async(
+            self.llm, self.model, story, articles, self.config, self.max_concurrency
+        )
+        return _as_story(updated) if isinstance(story, Story) else updated
+
+    async def classify_stories(self, stories: list[dict | Story]) -> list[dict | Story]:
         """
         Classify stories by topic.
 
         Args:
-            stories: List of story dicts with title, summary, key_points, etc.
+            stories: List of story dicts or Story records with title,
+                     summary, key_points, etc.
 
         Returns:
-            List of story dicts with 'topics' field added to each
+            List of stories with 'topics' field added to each. Story
+            records come back as new Story records.
         """
-        return _classify_stories(self.client, self.model, stories)
+        from cronkite.actions.classify_stories import classify_stories_async
 
-    def group_stories(self, group_a: list[dict], group_b: list[dict]) -> list[dict]:
+        return await classify_stories_async(
+            self.llm, self.config.model_for("classify_stories", self.model), stories,
+            self.max_concurrency, self.config.structured_outputs,
+        )
+
+    async def group_stories(
+        self,
+        group_a: list[dict | Story],
+        group_b: list[dict | Story],
+    ) -> list[dict]:
         """
         Link stories across two groups that cover the same underlying event.
 
         Args:
-            group_a: First list of story dicts with title, summary, key_points, etc.
-            group_b: Second list of story dicts with title, summary, key_points, etc.
+            group_a: First list of story dicts or Story records
+            group_b: Second list of story dicts or Story records
 
         Returns:
             List of link dicts, each with "group_a_index" and "group_b_index"
             indicating which stories match across the two groups.
         """
-        return _group_stories(self.client, self.model, group_a, group_b)
+        from cronkite.actions.group_stories import group_stories_async
+
+        return await group_stories_async(
+            self.llm, self.config.model_for("group_stories", self.model), group_a, group_b,
+            self.max_concurrency, self.config.structured_outputs,
+        )
+
+
+def _escalation_rate(stats: dict[str, int]) -> float:
+    """Escalations per cascaded story, from a stats snapshot."""
+    stories = stats.get("cascade_stories", 0)
+    return stats.get("cascade_escalations", 0) / stories if stories else 0.0
+
+
+def _typed(articles: list[dict | Article]) -> bool:
+    """Whether the caller passed Article records rather than dicts."""
+    return bool(articles) and isinstance(articles[0], Article)
+
+
+def _as_story(story: dict) -> Story:
+    """Convert a pipeline story dict into a Story record."""
+    return Story.from_dict(story)
+
+
+def _track_typed(clusters: Iterable[list], typed: set[int]) -> Iterator[list]:
+    """Pass clusters through, noting the indices of typed ones."""
+    for i, articles in enumerate(clusters):
+        if _typed(articles):
+            typed.add(i)
+        yield articles
+
+
+def _typed_result(result: "StoryResult", typed: set[int]) -> "StoryResult":
+    """Give a typed cluster's result a Story record."""
+    if result.story is None or result.index not in typed:
+        return result
+    return replace(result, story=_as_story(result.story))
+
+
+def _typed_event(field: str, value: Any) -> tuple[str, Any]:
+    """Convert a streamed (field, value) event's value to records."""
+    if field == "story":
+        return field, _as_story(value)
+    if field == "sub_story":
+        return field, SubStory.from_dict(value)
+    if field == "quotes":
+        return field, tuple(Quote.from_dict(q) for q in value)
+    if field == "location" and value is not None:
+        return field, Location.from_dict(value)
+    if field == "key_points":
+        return field, tuple(value)
+    return field, value
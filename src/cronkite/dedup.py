@@ -0,0 +1,158 @@
+import re
+import zlib
+from collections import defaultdict
+
+
+# Signature length (one-permutation MinHash bins) and LSH banding. With 16
+# bands of 4 rows, pairs above ~0.5 Jaccard are very likely to collide in
+# at least one band and are then verified against the threshold.
+NUM_BINS = 64
+NUM_BANDS = 16
+SHINGLE_SIZE = 3
+
+_BIN_BITS = NUM_BINS.bit_length() - 1
+_BIN_MASK = NUM_BINS - 1
+_EMPTY = 1 << 32
+_WORD = re.compile(r"\w+")
+
+
+def collapse_duplicates(
+    articles: list[dict],
+    threshold: float = 0.7,
+) -> tuple[list[dict], dict[str, list[str]]]:
+    """
+    Collapse near-duplicate articles (e.g., syndicated wire copy).
+
+    Articles are shingled over title and text, MinHashed and bucketed with
+    LSH; candidate pairs whose estimated Jaccard similarity reaches the
+    threshold are merged. Each group is represented by its longest article.
+
+    Args:
+        articles: List of article dicts with id, title, text
+        threshold: Minimum estimated Jaccard similarity to treat two
+                   articles as duplicates
+
+    Returns:
+        Tuple of (representative articles in input order, mapping of
+        representative ID to the IDs of every article it stands for).
+        Articles without duplicates map to themselves.
+    """
+    signatures = [_signature(a.get("title", ""), a.get("text", "")) for a in articles]
+
+    parent = list(range(len(articles)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    rows = NUM_BINS // NUM_BANDS
+    checked = set()
+    for band in range(NUM_BANDS):
+        buckets = defaultdict(list)
+        start = band * rows
+        for i, signature in enumerate(signatures):
+            if signature is not None:
+                buckets[tuple(signature[start:start + rows])].append(i)
+
+        for members in buckets.values():
+            for j in members[1:]:
+                i = members[0]
+                pair = (i, j)
+                if pair in checked:
+                    continue
+                checked.add(pair)
+                if _similarity(signatures[i], signatures[j]) >= threshold:
+                    parent[find(j)] = find(i)
+
+    groups = defaultdict(list)
+    for i in range(len(articles)):
+        groups[find(i)].append(i)
+
+    representatives = []
+    members = {}
+    for group in groups.values():
+        best = max(group, key=lambda i: (len(articles[i].get("text", "")), -i))
+        representatives.append(best)
+        members[articles[best]["id"]] = [articles[i]["id"] for i in group]
+
+    representatives.sort()
+    return [articles[i] for i in representatives], members
+
+
+def expand_story(story: dict, members: dict[str, list[str]]) -> dict:
+    """
+    Expand representative IDs in a story back to every duplicate they cover.
+
+    Args:
+        story: Story dict produced from representative articles
+        members: Mapping returned by collapse_duplicates
+
+    Returns:
+        Story dict whose article_ids, noise_article_ids and sub-story
+        article_ids list every member article
+    """
+    return {
+        **story,
+        "article_ids": expand_ids(story.get("article_ids", []), members),
+        "noise_article_ids": expand_ids(story.get("noise_article_ids", []), members),
+        "sub_stories": [expand_sub_story(sub_story, members) for sub_story in story.get("sub_stories", [])],
+    }
+
+
+def expand_sub_story(sub_story: dict, members: dict[str, list[str]]) -> dict:
+    """Expand representative IDs in a sub-story's article_ids."""
+    return {**sub_story, "article_ids": expand_ids(sub_story.get("article_ids", []), members)}
+
+
+def expand_ids(ids: list[str], members: dict[str, list[str]]) -> list[str]:
+    """Replace each representative ID with the IDs of all its members."""
+    expanded = []
+    for article_id in ids:
+        expanded.extend(members.get(article_id, [article_id]))
+    return expanded
+
+
+def _signature(title: str, text: str) -> list[int] | None:
+    """Compute a one-permutation MinHash signature, or None for empty text."""
+    words = _WORD.findall(f"{title} {text}".lower())
+    if not words:
+        return None
+
+    if len(words) < SHINGLE_SIZE:
+        shingles = {" ".join(words)}
+    else:
+        shingles = {
+            " ".join(words[i:i + SHINGLE_SIZE])
+            for i in range(len(words) - SHINGLE_SIZE + 1)
+        }
+
+    bins = [_EMPTY] * NUM_BINS
+    for shingle in shingles:
+        h = zlib.crc32(shingle.encode())
+        b = h & _BIN_MASK
+        v = h >> _BIN_BITS
+        if v < bins[b]:
+            bins[b] = v
+
+    _densify(bins)
+    return bins
+
+
+def _densify(bins: list[int]) -> None:
+    """Fill empty bins from the next non-empty bin (rotation densification)."""
+    if all(v == _EMPTY for v in bins):
+        return
+    for b in range(NUM_BINS):
+        if bins[b] != _EMPTY:
+            continue
+        offset = 1
+        while bins[(b + offset) % NUM_BINS] == _EMPTY:
+            offset += 1
+        bins[b] = bins[(b + offset) % NUM_BINS] + offset * _EMPTY
+
+
+def _similarity(a: list[int], b: list[int]) -> float:
+    """Estimate Jaccard similarity from two signatures."""
+    return sum(1 for x, y in zip(a, b) if x == y) / NUM_BINS
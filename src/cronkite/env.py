@@ -0,0 +1,18 @@
+def load_env(dotenv_path: str | None = None, override: bool = False) -> bool:
+    """
+    Load environment variables (e.g., OPENAI_API_KEY) from a .env file.
+
+    Importing cronkite no longer reads .env, so call this once at startup
+    when you rely on one.
+
+    Args:
+        dotenv_path: Path to the .env file. Defaults to the nearest .env
+                     in the working directory or its parents.
+        override: Whether values in the file replace existing variables
+
+    Returns:
+        True if at least one variable was set
+    """
+    from dotenv import find_dotenv, load_dotenv
+
+    return load_dotenv(dotenv_path or find_dotenv(usecwd=True), override=override)
@@ -0,0 +1,322 @@
+"""
+Offline gazetteer of countries, first-level regions and major cities.
+
+The source is a TSV file (kind, name, ISO3 country, region, population,
+|-separated aliases) compiled into a binary index of sorted keys that is
+memory-mapped on load, so opening it costs microseconds whatever its size
+and lookups are a binary search over the mapped file.
+
+Usage:
+    python -m cronkite.gazetteer [SOURCE.tsv] [INDEX.idx]
+"""
+
+import argparse
+import mmap
+import re
+import struct
+import sys
+import unicodedata
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+
+DATA_DIR = Path(__file__).parent / "data"
+DEFAULT_SOURCE = DATA_DIR / "gazetteer.tsv"
+DEFAULT_INDEX = DATA_DIR / "gazetteer.idx"
+
+KINDS = ("country", "region", "city")
+
+# Key flag: an ISO3 code, found by lookup but never matched in article text
+# (three capital letters are too often an acronym)
+CODE = 1
+
+_MAGIC = b"CKGZ"
+_VERSION = 1
+# magic, version, reserved, key count, posting count, place count
+_HEADER = struct.Struct("<4sHHIII")
+# key offset, key length, flags, place count, first posting
+_KEY = struct.Struct("<IHBBI")
+_KEY_REF = struct.Struct("<IH")
+_POSTING = struct.Struct("<I")
+# kind, country, name offset, region offset, population
+_PLACE = struct.Struct("<B3sIII")
+_NO_STRING = 0xFFFFFFFF
+
+_FOLD = str.maketrans({"ı": "i", "ø": "o", "ł": "l", "đ": "d", "ð": "d", "æ": "ae", "œ": "oe", "þ": "th"})
+_DROP = str.maketrans("", "", ".'’")
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+@dataclass(frozen=True)
+class Place:
+    """A gazetteer entry."""
+
+    kind: str
+    name: str
+    country: str
+    region: str | None
+    population: int
+
+
+def normalize(name: str) -> str:
+    """
+    Fold a place name to its index key.
+
+    Case, accents, periods and apostrophes are dropped and other
+    punctuation becomes a space, so "U.S." and "US", or "Kahramanmaraş"
+    and "Kahramanmaras", share a key.
+    """
+    if name.isascii():
+        folded = name.lower().translate(_DROP)
+    else:
+        folded = unicodedata.normalize("NFKD", name.casefold().translate(_FOLD))
+        folded = "".join(c for c in folded if not unicodedata.combining(c)).translate(_DROP)
+    return _NON_WORD.sub(" ", folded).strip()
+
+
+class Gazetteer:
+    """
+    Read-only view of a compiled gazetteer index.
+
+    Places are decoded from the mapped file on first access and kept, so
+    repeated lookups of the same name only pay for the binary search.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_INDEX):
+        """
+        Args:
+            path: Index file written by build_index
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, n_keys, n_postings, n_places = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{self.path} is not a version {_VERSION} gazetteer index")
+        self._n_keys = n_keys
+        self._n_places = n_places
+        self._keys_at = _HEADER.size
+        self._postings_at = self._keys_at + n_keys * _KEY.size
+        self._places_at = self._postings_at + n_postings * _POSTING.size
+        self._strings_at = self._places_at + n_places * _PLACE.size
+        self._places: dict[int, Place] = {}
+
+    def __len__(self) -> int:
+        return self._n_places
+
+    def lookup(self, name: str) -> list[Place]:
+        """
+        Places known by a name, alias or (for countries) ISO3 code.
+
+        Returns:
+            Matching places, most populous first. Empty if none match.
+        """
+        places, _ = self.match(normalize(name).encode())
+        return sorted(places, key=lambda place: -place.population)
+
+    def country(self, value: str) -> Place | None:
+        """The country named by an ISO3 code, name or alias, if any."""
+        for place in self.lookup(value):
+            if place.kind == "country":
+                return place
+        return None
+
+    def complete(self, prefix: str, limit: int = 10) -> list[Place]:
+        """
+        Places with a name or alias starting with prefix, most populous first.
+
+        Args:
+            prefix: Start of a place name (e.g., "kahraman")
+            limit: Maximum number of places to return
+        """
+        key = normalize(prefix).encode()
+        places = set()
+        i = self._seek(key)
+        while i < self._n_keys and self._key(i).startswith(key):
+            places.update(self._postings(i))
+            i += 1
+        return sorted(places, key=lambda place: (-place.population, place.name))[:limit]
+
+    def match(self, key: bytes) -> tuple[list[Place], int]:
+        """
+        Exact lookup of a normalized, UTF-8 encoded key.
+
+        Returns:
+            Tuple of (places, key flags). No places when the key is unknown.
+        """
+        i = self._seek(key)
+        if i == self._n_keys or self._key(i) != key:
+            return [], 0
+        return self._postings(i), _KEY.unpack_from(self._mm, self._keys_at + i * _KEY.size)[2]
+
+    def scan(self, key: bytes) -> tuple[list[Place], int, bool]:
+        """
+        One search answering both whether key names places and whether a
+        longer name continues it.
+
+        Returns:
+            Tuple of (places, key flags, whether some key starts with key
+            followed by a space)
+        """
+        i = self._seek(key)
+        places, flags = [], 0
+        if i < self._n_keys and self._key(i) == key:
+            places = self._postings(i)
+            flags = _KEY.unpack_from(self._mm, self._keys_at + i * _KEY.size)[2]
+            i += 1
+        extends = i < self._n_keys and self._key(i).startswith(key + b" ")
+        return places, flags, extends
+
+    def _seek(self, key: bytes) -> int:
+        """Position of the first key not less than key."""
+        lo, hi = 0, self._n_keys
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _key(self, i: int) -> bytes:
+        offset, length = _KEY_REF.unpack_from(self._mm, self._keys_at + i * _KEY.size)
+        start = self._strings_at + offset
+        return self._mm[start:start + length]
+
+    def _postings(self, i: int) -> list[Place]:
+        _, _, _, count, first = _KEY.unpack_from(self._mm, self._keys_at + i * _KEY.size)
+        at = self._postings_at + first * _POSTING.size
+        return [self._place(_POSTING.unpack_from(self._mm, at + j * _POSTING.size)[0]) for j in range(count)]
+
+    def _place(self, i: int) -> Place:
+        place = self._places.get(i)
+        if place is None:
+            kind, country, name, region, population = _PLACE.unpack_from(self._mm, self._places_at + i * _PLACE.size)
+            place = Place(
+                KINDS[kind],
+                self._string(name),
+                country.decode("ascii"),
+                self._string(region) if region != _NO_STRING else None,
+                population,
+            )
+            self._places[i] = place
+        return place
+
+    def _string(self, offset: int) -> str:
+        start = self._strings_at + offset
+        (length,) = struct.unpack_from("<H", self._mm, start)
+        return self._mm[start + 2:start + 2 + length].decode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def load_gazetteer(path: str | Path | None = None) -> Gazetteer:
+    """The gazetteer at path (the bundled one by default), opened once."""
+    return Gazetteer(path or DEFAULT_INDEX)
+
+
+def read_source(path: str | Path = DEFAULT_SOURCE) -> list[tuple[Place, list[str]]]:
+    """
+    Read a gazetteer source TSV.
+
+    Lines are kind, name, country (ISO3), region, population and aliases
+    separated by "|". Blank lines and lines starting with "#" are skipped.
+
+    Returns:
+        List of (place, aliases) in file order
+    """
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.rstrip("\n")
+            if not line.strip() or line.startswith("#"):
+                continue
+            fields = line.split("\t")
+            if len(fields) != 6 or fields[0] not in KINDS or len(fields[2]) != 3:
+                raise ValueError(f"{path}:{line_number}: expected kind, name, ISO3 country, region, population, aliases")
+            kind, name, country, region, population, aliases = fields
+            place = Place(kind, name, country, region or None, int(population or 0))
+            entries.append((place, [alias for alias in aliases.split("|") if alias]))
+    return entries
+
+
+def build_index(entries: Iterable[tuple[Place, list[str]]], path: str | Path) -> None:
+    """
+    Compile gazetteer entries into an index file.
+
+    Each place is keyed by its normalized name and aliases, and countries
+    also by their ISO3 code (flagged CODE). Output is deterministic for
+    the same entries.
+
+    Args:
+        entries: (place, aliases) pairs, e.g. from read_source
+        path: Index file to write
+    """
+    places = []
+    keys: dict[bytes, tuple[int, list[int]]] = {}
+
+    def add(name: str, place_id: int, flags: int) -> None:
+        key = normalize(name).encode()
+        if not key:
+            return
+        key_flags, ids = keys.get(key, (flags, []))
+        if place_id not in ids:
+            ids.append(place_id)
+        # A key is only a code if nothing else uses it as a name
+        keys[key] = (key_flags & flags, ids)
+
+    for place_id, (place, aliases) in enumerate(entries):
+        places.append(place)
+        for name in [place.name, *aliases]:
+            add(name, place_id, 0)
+        if place.kind == "country":
+            add(place.country, place_id, CODE)
+
+    strings = bytearray()
+    key_records, postings = [], []
+    for key in sorted(keys):
+        flags, ids = keys[key]
+        key_records.append(_KEY.pack(len(strings), len(key), flags, len(ids), len(postings)))
+        postings.extend(sorted(ids))
+        strings += key
+
+    offsets: dict[str, int] = {}
+
+    def string(value: str | None) -> int:
+        if value is None:
+            return _NO_STRING
+        if value not in offsets:
+            encoded = value.encode("utf-8")
+            offsets[value] = len(strings)
+            strings.extend(struct.pack("<H", len(encoded)) + encoded)
+        return offsets[value]
+
+    place_records = [
+        _PLACE.pack(
+            KINDS.index(place.kind), place.country.encode("ascii"), string(place.name),
+            string(place.region), place.population,
+        )
+        for place in places
+    ]
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, 0, len(key_records), len(postings), len(place_records)))
+        f.writelines(key_records)
+        f.writelines(_POSTING.pack(place_id) for place_id in postings)
+        f.writelines(place_records)
+        f.write(strings)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m cronkite.gazetteer", description="Compile a gazetteer index.")
+    parser.add_argument("source", nargs="?", default=DEFAULT_SOURCE, help="Source TSV (default: bundled)")
+    parser.add_argument("index", nargs="?", default=DEFAULT_INDEX, help="Index to write (default: bundled)")
+    args = parser.parse_args(argv)
+    build_index(read_source(args.source), args.index)
+    print(f"Wrote {args.index} ({len(Gazetteer(args.index))} places)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,6 @@
+from dataclasses import dataclass, replace
+from functools import lru_cache
+
 from cronkite.config import CronkiteConfig
 from cronkite.instructions.generate_story import (
     BASE_PREAMBLE,
@@ -9,16 +12,181 @@ from cronkite.instructions.generate_story import (
     EXTRACT_QUOTES_COMPONENT,
     RESOLVE_LOCATION_COMPONENT,
 )
+from cronkite.instructions.update_story import UPDATE_PREAMBLE
+
 
+JSON_OBJECT_FORMAT = {"type": "json_object"}
 
+
+@lru_cache(maxsize=None)
 def build_instruction(config: CronkiteConfig) -> str:
     """
     Build a combined instruction based on enabled config options.
 
     Returns a system prompt that includes only the relevant task
-    descriptions for enabled actions.
+    descriptions for enabled actions. Compiled once per distinct config,
+    so every call with that config sends a byte-identical prompt prefix
+    that the provider's prompt cache can reuse.
+    """
+    return _build(BASE_PREAMBLE, config)
+
+
+@lru_cache(maxsize=None)
+def build_response_format(config: CronkiteConfig) -> dict:
+    """
+    Build the response_format for calls made with build_instruction or
+    build_update_instruction.
+
+    With config.structured_outputs, returns a strict json_schema format
+    generated from the enabled components, so the model can only produce
+    the requested fields. Otherwise returns plain JSON mode.
+    """
+    components = _get_enabled_components(config)
+    if not config.structured_outputs or not components:
+        return JSON_OBJECT_FORMAT
+    return json_schema_format("story", components)
+
+
+def json_schema_format(name: str, components: list[dict]) -> dict:
+    """
+    Build a strict json_schema response_format from components.
+
+    Each component's output_field becomes a required property with its
+    output_schema, described by its output_description.
+    """
+    properties = {
+        component["output_field"]: {
+            **component["output_schema"],
+            "description": component["output_description"],
+        }
+        for component in components
+    }
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": properties,
+                "required": list(properties),
+                "additionalProperties": False,
+            },
+        },
+    }
+
+
+# Components run together in each concurrent call of split execution, by
+# action name. Title, summary and key points share a call because they are
+# short and read the same articles the same way.
+SPLIT_STAGES = {
+    "group_articles": ("group_articles",),
+    "generate_text": ("generate_title", "generate_summary", "generate_key_points"),
+    "extract_quotes": ("extract_quotes",),
+    "resolve_location": ("resolve_location",),
+}
+
+# Every component flag, switched off to derive single-call configs
+_COMPONENT_FLAGS = {
+    "filter_noise": False,
+    "group_articles": False,
+    "generate_title": False,
+    "generate_summary": False,
+    "generate_key_points": False,
+    "extract_quotes": False,
+    "resolve_location": False,
+}
+
+
+@dataclass(frozen=True)
+class StoryCall:
+    """One model call making up a story's main response."""
+
+    action: str
+    model: str
+    config: CronkiteConfig
+
+
+@lru_cache(maxsize=None)
+def plan_story_calls(
+    config: CronkiteConfig,
+    model: str,
+) -> tuple[StoryCall | None, tuple[StoryCall, ...]]:
+    """
+    Plan the calls that produce a story's main response.
+
+    Components are grouped into as few calls as their models allow (see
+    CronkiteConfig.models), or into SPLIT_STAGES with split_execution.
+    When other calls depend on noise filtering, the call holding
+    filter_noise runs first and the rest read only the articles it keeps.
+
+    Args:
+        config: Pipeline configuration
+        model: Model for components config doesn't route elsewhere
+
+    Returns:
+        Tuple of (call to make first, or None, and calls to make
+        concurrently after it). With one model and no split this is the
+        single unified call with config itself.
+    """
+    enabled = [flag for flag in _COMPONENT_FLAGS if getattr(config, flag)]
+
+    groups = {}
+    if config.split_execution:
+        for action, flags in SPLIT_STAGES.items():
+            for flag in flags:
+                if flag in enabled:
+                    groups.setdefault((action, config.model_for(flag, model)), []).append(flag)
+    else:
+        for flag in enabled:
+            groups.setdefault(("generate_story", config.model_for(flag, model)), []).append(flag)
+        if len(groups) <= 1:
+            routed = next(iter(groups), ("generate_story", model))[1]
+            return StoryCall("generate_story", routed, config), ()
+
+    first = None
+    if config.filter_noise:
+        noise_model = config.model_for("filter_noise", model)
+        if config.split_execution:
+            first = _story_call("filter_noise", noise_model, ["filter_noise"], config)
+        else:
+            # Components sharing filter_noise's model ride along in its call
+            flags = groups.pop(("generate_story", noise_model))
+            first = _story_call("generate_story", noise_model, flags, config)
+
+    rest = tuple(
+        _story_call(action, call_model, flags, config)
+        for (action, call_model), flags in groups.items()
+    )
+    return first, rest
+
+
+def _story_call(action: str, model: str, flags: list[str], config: CronkiteConfig) -> StoryCall:
+    """A StoryCall running only the given components."""
+    return StoryCall(action, model, replace(config, **{**_COMPONENT_FLAGS, **dict.fromkeys(flags, True)}))
+
+
+@lru_cache(maxsize=None)
+def build_update_instruction(config: CronkiteConfig) -> str:
+    """
+    Build an instruction for incrementally updating an existing story.
+
+    Uses the same components as build_instruction, behind a preamble that
+    explains the previous story plus new articles payload.
     """
-    parts = [BASE_PREAMBLE]
+    return _build(UPDATE_PREAMBLE, config)
+
+
+def _build(preamble: str, config: CronkiteConfig) -> str:
+    """
+    Combine a preamble with the enabled components and output schema.
+
+    Everything here is static text in a fixed order; per-call data belongs
+    in the user message after it, never in the system prompt. With
+    structured outputs the schema travels in the response_format instead,
+    so the prose schema section is left out.
+    """
+    parts = [preamble]
 
     # Collect enabled components
     components = _get_enabled_components(config)
@@ -28,21 +196,29 @@ def build_instruction(config: CronkiteConfig) -> str:
         parts.append(component["task"])
 
     # Add output schema
-    parts.append(_build_output_schema(components))
+    if not (config.structured_outputs and components):
+        parts.append(_build_output_schema(components))
 
     return "\n".join(parts)
 
 
 def _get_enabled_components(config: CronkiteConfig) -> list[dict]:
-    """Get list of enabled components based on config."""
+    """
+    Get list of enabled components based on config.
+
+    The order is the order fields appear in the output schema, and so the
+    order the model produces them: the short title first so streamed
+    responses show something quickly, then noise and subgroups so
+    sub-stories can start while the rest is still being generated.
+    """
     components = []
 
+    if config.generate_title:
+        components.append(GENERATE_TITLE_COMPONENT)
     if config.filter_noise:
         components.append(FILTER_NOISE_COMPONENT)
     if config.group_articles:
         components.append(GROUP_ARTICLES_COMPONENT)
-    if config.generate_title:
-        components.append(GENERATE_TITLE_COMPONENT)
     if config.generate_summary:
         components.append(GENERATE_SUMMARY_COMPONENT)
     if config.generate_key_points:
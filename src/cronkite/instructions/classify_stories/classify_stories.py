@@ -1,3 +1,18 @@
+# Topic names the model may assign, matching the list in the task below
+TOPICS = [
+    "Politics",
+    "Conflict & Security",
+    "Crime",
+    "Business",
+    "Economy",
+    "Technology",
+    "Health",
+    "Environment",
+    "Society",
+    "Sports",
+    "Entertainment",
+]
+
 CLASSIFY_STORIES_COMPONENT = {
     "task": """## Classify Stories
 
@@ -27,4 +42,16 @@ For each story provided, assign one or more topic classifications from the follo
     "output_type": "array of objects",
     "output_description": "Array of classification objects, one per story, each containing the story index and assigned topics",
     "output_example": '[{"story_index": 0, "topics": ["Politics", "Conflict & Security"]}, {"story_index": 1, "topics": ["Technology", "Business"]}]',
+    "output_schema": {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "properties": {
+                "story_index": {"type": "integer"},
+                "topics": {"type": "array", "items": {"type": "string", "enum": TOPICS}},
+            },
+            "required": ["story_index", "topics"],
+            "additionalProperties": False,
+        },
+    },
 }
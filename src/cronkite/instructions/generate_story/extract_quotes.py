@@ -24,4 +24,20 @@ Note: Not all speaker fields will be available - extract what you can determine.
     "output_type": "array of objects",
     "output_description": "Array of quote objects with text, speaker_name, speaker_title, speaker_org, speaker_nation, article_id",
     "output_example": '[{"text": "Quote here", "speaker_name": "John Smith", "speaker_title": "Director", "speaker_org": "FBI", "speaker_nation": "USA", "article_id": "article-1"}]',
+    "output_schema": {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "properties": {
+                "text": {"type": "string"},
+                "speaker_name": {"type": ["string", "null"]},
+                "speaker_title": {"type": ["string", "null"]},
+                "speaker_org": {"type": ["string", "null"]},
+                "speaker_nation": {"type": ["string", "null"]},
+                "article_id": {"type": "string"},
+            },
+            "required": ["text", "speaker_name", "speaker_title", "speaker_org", "speaker_nation", "article_id"],
+            "additionalProperties": False,
+        },
+    },
 }
@@ -17,4 +17,8 @@ Be conservative - only filter articles that clearly don't belong.""",
     "output_type": "array of strings",
     "output_description": "Array of article IDs to filter out as noise",
     "output_example": '["article-id-1", "article-id-2"]',
+    "output_schema": {
+        "type": "array",
+        "items": {"type": "string"},
+    },
 }
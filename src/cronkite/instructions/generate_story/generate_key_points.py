@@ -19,4 +19,8 @@ Guidelines:
     "output_type": "array of strings",
     "output_description": "Array of 3-6 key point sentences",
     "output_example": '["Key point 1.", "Key point 2.", "Key point 3."]',
+    "output_schema": {
+        "type": "array",
+        "items": {"type": "string"},
+    },
 }
@@ -19,4 +19,5 @@ Guidelines:
     "output_type": "string",
     "output_description": "Condensed single-paragraph summary (150-200 words)",
     "output_example": '"Summary text here..."',
+    "output_schema": {"type": "string"},
 }
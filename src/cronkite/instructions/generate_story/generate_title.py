@@ -23,4 +23,5 @@ Examples:
     "output_type": "string",
     "output_description": "Short, neutral event title (3-7 words)",
     "output_example": '"US Bombs Iranian Energy Infrastructure"',
+    "output_schema": {"type": "string"},
 }
@@ -16,4 +16,16 @@ DO NOT create sub-groups just to categorize by topic. If no clear sub-events exi
     "output_type": "array of objects",
     "output_description": "Array of sub-group objects, each with 'theme' (string) and 'article_ids' (array of strings). Empty array if no sub-grouping needed.",
     "output_example": '[{"theme": "Hospital strike in northern region", "article_ids": ["id1", "id2"]}]',
+    "output_schema": {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "properties": {
+                "theme": {"type": "string"},
+                "article_ids": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": ["theme", "article_ids"],
+            "additionalProperties": False,
+        },
+    },
 }
@@ -13,10 +13,21 @@ Location fields:
 - region: State, province, or region (e.g., "California", "England")
 - city: City or town (e.g., "Los Angeles", "London")
 
-If a location level cannot be determined, use null for that field.""",
+If a location level cannot be determined, use null for that field. If no
+location can be determined at all, use null for location.""",
 
     "output_field": "location",
     "output_type": "object",
-    "output_description": "Object with country (ISO3), region, and city fields (null if unknown)",
+    "output_description": "Object with country (ISO3), region, and city fields (null if unknown), or null",
     "output_example": '{"country": "USA", "region": "California", "city": "Los Angeles"}',
+    "output_schema": {
+        "type": ["object", "null"],
+        "properties": {
+            "country": {"type": ["string", "null"]},
+            "region": {"type": ["string", "null"]},
+            "city": {"type": ["string", "null"]},
+        },
+        "required": ["country", "region", "city"],
+        "additionalProperties": False,
+    },
 }
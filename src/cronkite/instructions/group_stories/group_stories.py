@@ -16,4 +16,16 @@ You are given two groups of news stories: group_a and group_b. Your task is to i
     "output_type": "array of objects",
     "output_description": "Array of link objects, each containing the index of a story in group_a and the index of a matching story in group_b",
     "output_example": '[{"group_a_index": 0, "group_b_index": 2}, {"group_a_index": 1, "group_b_index": 0}]',
+    "output_schema": {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "properties": {
+                "group_a_index": {"type": "integer"},
+                "group_b_index": {"type": "integer"},
+            },
+            "required": ["group_a_index", "group_b_index"],
+            "additionalProperties": False,
+        },
+    },
 }
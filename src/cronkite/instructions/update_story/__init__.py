@@ -0,0 +1,3 @@
+from cronkite.instructions.update_story.update_story_base import UPDATE_PREAMBLE
+
+__all__ = ["UPDATE_PREAMBLE"]
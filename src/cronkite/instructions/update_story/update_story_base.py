@@ -0,0 +1,20 @@
+UPDATE_PREAMBLE = """You are updating an existing news story after new or revised articles were added to its cluster.
+
+You will receive a JSON object with:
+- previous_story: the story as it currently stands (title, summary, key_points, quotes, location, and sub_stories with their theme and article_ids). Treat it as an accurate synthesis of the articles you are not shown.
+- articles: only the new or revised articles, each with:
+  - id: unique identifier
+  - title: the article headline
+  - summary: brief summary of the article
+  - text: the full article text
+  - source: the publication name
+  - published_at: publication timestamp
+
+Your task is to fold the new articles into the previous story and return a JSON object with the requested fields.
+
+When updating:
+- Return complete, updated values for every requested field, not just the changes
+- Keep previous content that is still accurate; revise it only where the new articles add, correct or supersede information
+- Only judge the new articles when identifying noise; previous noise decisions stand
+- When returning sub-groups, carry over each previous sub-story as a sub-group (using its theme and article_ids) and add new article IDs to it where they fit; create new sub-groups only for genuinely new sub-events
+"""
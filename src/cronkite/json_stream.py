@@ -0,0 +1,82 @@
+import json
+from typing import Any
+
+
+class JSONFieldStream:
+    """
+    Incremental parser for a streamed top-level JSON object.
+
+    Feed it text chunks as they arrive; it returns each top-level field as
+    soon as that field's value is complete, without waiting for the rest of
+    the object. Only string, nesting and escape state is tracked, so every
+    character is scanned once.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._scanned = 0
+        self._member_start = None
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self.done = False
+
+    def feed(self, chunk: str) -> list[tuple[str, Any]]:
+        """
+        Consume a chunk of the JSON text.
+
+        Args:
+            chunk: Next piece of the streamed response
+
+        Returns:
+            List of (field, value) pairs completed by this chunk, in order
+        """
+        if self.done:
+            return []
+
+        self._buffer += chunk
+        fields = []
+        buffer = self._buffer
+        i = self._scanned
+        while i < len(buffer):
+            char = buffer[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                if self._depth == 1:
+                    self._member_start = i + 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    fields += self._complete_member(buffer, i)
+                    self.done = True
+                    break
+            elif char == "," and self._depth == 1:
+                fields += self._complete_member(buffer, i)
+                self._member_start = i + 1
+            i += 1
+
+        # Drop text belonging to fields already returned
+        if self._member_start is not None and self._member_start > 0:
+            self._buffer = buffer[self._member_start:]
+            i -= self._member_start
+            self._member_start = 0
+        self._scanned = i + 1 if self.done else i
+        return fields
+
+    def _complete_member(self, buffer: str, end: int) -> list[tuple[str, Any]]:
+        """Parse the `"key": value` member ending just before end."""
+        if self._member_start is None:
+            return []
+        member = buffer[self._member_start:end].strip()
+        if not member:
+            return []
+        return list(json.loads("{" + member + "}").items())
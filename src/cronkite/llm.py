@@ -0,0 +1,373 @@
+import json
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+from openai import AsyncOpenAI, OpenAI, OpenAIError
+
+from cronkite.cache import ResponseCache, cache_key
+from cronkite.instruction_builder import JSON_OBJECT_FORMAT
+from cronkite.json_stream import JSONFieldStream
+from cronkite.metrics import CallEvent, MetricsHook, emit, estimate_cost
+from cronkite.scheduler import Scheduler
+from cronkite.stats import PipelineStats
+from cronkite.token_budget import count_tokens
+
+
+class RefusalError(OpenAIError):
+    """The model refused to answer, so there is no JSON to parse."""
+
+
+# Completion tokens reserved against the tokens-per-minute limit before the
+# real usage is known
+ESTIMATED_COMPLETION_TOKENS = 1000
+
+
+class LLMClient:
+    """
+    Wrapper around an OpenAI client through which every action makes its calls.
+
+    Centralising the chat completion call lets cross-cutting concerns such
+    as response caching, rate limiting, retries and metrics apply uniformly
+    to all actions.
+    """
+
+    def __init__(
+        self,
+        client: OpenAI,
+        cache: ResponseCache | None = None,
+        hooks: list[MetricsHook] | None = None,
+        scheduler: Scheduler | None = None,
+    ):
+        """
+        Args:
+            client: OpenAI client instance
+            cache: Optional response cache consulted before each call
+            hooks: Metrics hooks notified after every call
+            scheduler: Optional scheduler applying rate limits and retries
+        """
+        self.client = client
+        self.cache = cache
+        self.hooks = list(hooks or [])
+        self.scheduler = scheduler
+        self.stats = PipelineStats()
+
+    def complete_json(
+        self,
+        model: str,
+        instruction: str,
+        payload: str,
+        response_format: dict = JSON_OBJECT_FORMAT,
+        action: str = "llm",
+    ) -> dict:
+        """
+        Make a chat completion call and parse the JSON response.
+
+        Args:
+            model: Model identifier (e.g., "gpt-4o")
+            instruction: System instruction
+            payload: User message content
+            response_format: response_format passed to the API
+            action: Label for metrics (e.g., "generate_story")
+
+        Returns:
+            Parsed JSON response
+        """
+        key = None
+        if self.cache is not None:
+            key = cache_key(model, instruction, payload, response_format)
+            cached = self.cache.get(key)
+            if cached is not None:
+                emit(CallEvent(action, model, 0.0, cache_hit=True), self.hooks)
+                return json.loads(cached)
+
+        messages = build_messages(instruction, payload)
+        start = time.perf_counter()
+        retries = 0
+        if self.scheduler is None:
+            response = self.client.chat.completions.create(
+                model=model, messages=messages, response_format=response_format
+            )
+        else:
+            # The scheduler owns retries, so the SDK's own retry loop is disabled
+            client = self.client.with_options(max_retries=0)
+            estimated = _estimate_tokens(model, instruction, payload)
+            response, retries = self.scheduler.run(
+                model,
+                estimated,
+                lambda: client.chat.completions.create(
+                    model=model, messages=messages, response_format=response_format
+                ),
+            )
+            _record_usage(self.scheduler, model, estimated, response)
+        emit(_call_event(action, model, time.perf_counter() - start, response, retries), self.hooks)
+        content = _content(response)
+        parsed = json.loads(content)
+
+        if key is not None:
+            self.cache.set(key, content)
+        return parsed
+
+    def stream_json(
+        self,
+        model: str,
+        instruction: str,
+        payload: str,
+        response_format: dict = JSON_OBJECT_FORMAT,
+        action: str = "llm",
+    ) -> Iterator[tuple[str, Any]]:
+        """
+        Make a streaming chat completion call and yield top-level JSON fields.
+
+        Args:
+            model: Model identifier (e.g., "gpt-4o")
+            instruction: System instruction
+            payload: User message content
+            response_format: response_format passed to the API
+            action: Label for metrics (e.g., "generate_story")
+
+        Yields:
+            (field, value) pairs as soon as each top-level field is complete
+        """
+        key = None
+        if self.cache is not None:
+            key = cache_key(model, instruction, payload, response_format)
+            cached = self.cache.get(key)
+            if cached is not None:
+                emit(CallEvent(action, model, 0.0, cache_hit=True), self.hooks)
+                yield from json.loads(cached).items()
+                return
+
+        messages = build_messages(instruction, payload)
+        start = time.perf_counter()
+        retries = 0
+        def create(client):
+            return client.chat.completions.create(
+                model=model,
+                messages=messages,
+                response_format=response_format,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+
+        if self.scheduler is None:
+            stream = create(self.client)
+        else:
+            client = self.client.with_options(max_retries=0)
+            estimated = _estimate_tokens(model, instruction, payload)
+            stream, retries = self.scheduler.run(model, estimated, lambda: create(client))
+
+        parser = JSONFieldStream()
+        parts, refusal, usage = [], [], None
+        for chunk in stream:
+            usage = getattr(chunk, "usage", None) or usage
+            delta = chunk.choices[0].delta if chunk.choices else None
+            content = delta.content if delta else None
+            if delta is not None and getattr(delta, "refusal", None):
+                refusal.append(delta.refusal)
+            if content:
+                parts.append(content)
+                yield from parser.feed(content)
+
+        response = _StreamedResponse(usage)
+        if self.scheduler is not None:
+            _record_usage(self.scheduler, model, estimated, response)
+        emit(_call_event(action, model, time.perf_counter() - start, response, retries), self.hooks)
+        if refusal:
+            raise RefusalError("".join(refusal))
+
+        if key is not None:
+            _cache_streamed(self.cache, key, "".join(parts))
+
+
+class AsyncLLMClient:
+    """Async counterpart of LLMClient wrapping an AsyncOpenAI client."""
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        cache: ResponseCache | None = None,
+        hooks: list[MetricsHook] | None = None,
+        scheduler: Scheduler | None = None,
+    ):
+        """
+        Args:
+            client: AsyncOpenAI client instance
+            cache: Optional response cache consulted before each call
+            hooks: Metrics hooks notified after every call
+            scheduler: Optional scheduler applying rate limits and retries
+        """
+        self.client = client
+        self.cache = cache
+        self.hooks = list(hooks or [])
+        self.scheduler = scheduler
+        self.stats = PipelineStats()
+
+    async def complete_json(
+        self,
+        model: str,
+        instruction: str,
+        payload: str,
+        response_format: dict = JSON_OBJECT_FORMAT,
+        action: str = "llm",
+    ) -> dict:
+        """Async variant of LLMClient.complete_json."""
+        key = None
+        if self.cache is not None:
+            key = cache_key(model, instruction, payload, response_format)
+            cached = self.cache.get(key)
+            if cached is not None:
+                emit(CallEvent(action, model, 0.0, cache_hit=True), self.hooks)
+                return json.loads(cached)
+
+        messages = build_messages(instruction, payload)
+        start = time.perf_counter()
+        retries = 0
+        if self.scheduler is None:
+            response = await self.client.chat.completions.create(
+                model=model, messages=messages, response_format=response_format
+            )
+        else:
+            client = self.client.with_options(max_retries=0)
+            estimated = _estimate_tokens(model, instruction, payload)
+            response, retries = await self.scheduler.run_async(
+                model,
+                estimated,
+                lambda: client.chat.completions.create(
+                    model=model, messages=messages, response_format=response_format
+                ),
+            )
+            _record_usage(self.scheduler, model, estimated, response)
+        emit(_call_event(action, model, time.perf_counter() - start, response, retries), self.hooks)
+        content = _content(response)
+        parsed = json.loads(content)
+
+        if key is not None:
+            self.cache.set(key, content)
+        return parsed
+
+    async def stream_json(
+        self,
+        model: str,
+        instruction: str,
+        payload: str,
+        response_format: dict = JSON_OBJECT_FORMAT,
+        action: str = "llm",
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """Async variant of LLMClient.stream_json."""
+        key = None
+        if self.cache is not None:
+            key = cache_key(model, instruction, payload, response_format)
+            cached = self.cache.get(key)
+            if cached is not None:
+                emit(CallEvent(action, model, 0.0, cache_hit=True), self.hooks)
+                for field in json.loads(cached).items():
+                    yield field
+                return
+
+        messages = build_messages(instruction, payload)
+        start = time.perf_counter()
+        retries = 0
+        def create(client):
+            return client.chat.completions.create(
+                model=model,
+                messages=messages,
+                response_format=response_format,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+
+        if self.scheduler is None:
+            stream = await create(self.client)
+        else:
+            client = self.client.with_options(max_retries=0)
+            estimated = _estimate_tokens(model, instruction, payload)
+            stream, retries = await self.scheduler.run_async(model, estimated, lambda: create(client))
+
+        parser = JSONFieldStream()
+        parts, refusal, usage = [], [], None
+        async for chunk in stream:
+            usage = getattr(chunk, "usage", None) or usage
+            delta = chunk.choices[0].delta if chunk.choices else None
+            content = delta.content if delta else None
+            if delta is not None and getattr(delta, "refusal", None):
+                refusal.append(delta.refusal)
+            if content:
+                parts.append(content)
+                for field in parser.feed(content):
+                    yield field
+
+        response = _StreamedResponse(usage)
+        if self.scheduler is not None:
+            _record_usage(self.scheduler, model, estimated, response)
+        emit(_call_event(action, model, time.perf_counter() - start, response, retries), self.hooks)
+        if refusal:
+            raise RefusalError("".join(refusal))
+
+        if key is not None:
+            _cache_streamed(self.cache, key, "".join(parts))
+
+
+def _estimate_tokens(model: str, instruction: str, payload: str) -> int:
+    """Estimate a request's prompt plus completion tokens for rate limiting."""
+    return count_tokens(instruction, model) + count_tokens(payload, model) + ESTIMATED_COMPLETION_TOKENS
+
+
+def _record_usage(scheduler: Scheduler, model: str, estimated: int, response) -> None:
+    """Correct the scheduler's token estimate with the response's real usage."""
+    usage = getattr(response, "usage", None)
+    total_tokens = getattr(usage, "total_tokens", None)
+    if total_tokens:
+        scheduler.record_usage(model, estimated, total_tokens)
+
+
+def _cache_streamed(cache: ResponseCache, key: str, content: str) -> None:
+    """Cache a streamed response, unless it didn't parse as a JSON object."""
+    try:
+        parsed = json.loads(content)
+    except json.JSONDecodeError:
+        return
+    if isinstance(parsed, dict):
+        cache.set(key, content)
+
+
+def _content(response) -> str:
+    """Return a completion's JSON text, raising RefusalError if it refused."""
+    message = response.choices[0].message
+    if message.content is None:
+        raise RefusalError(getattr(message, "refusal", None) or "Model returned no content")
+    return message.content
+
+
+class _StreamedResponse:
+    """Carries a streamed completion's usage in the shape _call_event reads."""
+
+    def __init__(self, usage):
+        self.usage = usage
+
+
+def _call_event(action: str, model: str, latency: float, response, retries: int = 0) -> CallEvent:
+    """Build a CallEvent from a chat completion response."""
+    usage = getattr(response, "usage", None)
+    prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+    completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached_prompt_tokens = getattr(details, "cached_tokens", 0) or 0
+    return CallEvent(
+        action=action,
+        model=model,
+        latency=latency,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        cost=estimate_cost(model, prompt_tokens, completion_tokens, cached_prompt_tokens),
+        retries=retries,
+        cached_prompt_tokens=cached_prompt_tokens,
+    )
+
+
+def build_messages(instruction: str, payload: str) -> list[dict]:
+    """Build the chat messages for a system instruction and user payload."""
+    return [
+        {"role": "system", "content": instruction},
+        {"role": "user", "content": payload},
+    ]
@@ -0,0 +1,214 @@
+import re
+from collections import Counter, defaultdict
+
+from cronkite.gazetteer import CODE, Gazetteer, Place, load_gazetteer, normalize
+
+
+# Weight of a place mention by the article field it appears in
+FIELD_WEIGHTS = {"title": 3.0, "summary": 2.0, "text": 1.0}
+
+# Text mentions of one place counted per article, so a single article
+# repeating a name can't outweigh several that each mention another
+MAX_TEXT_MENTIONS = 3
+
+# Share of the country's score a region or city needs to be reported; below
+# it the story is spread too thinly to name one
+MIN_SHARE = 0.25
+
+# Longest place name, in words, tried when matching text
+MAX_NAME_WORDS = 6
+
+_TOKEN = re.compile(r"\w+(?:[-'’.]\w+)*")
+_POSSESSIVE = re.compile(r"['’]s?$")
+
+# Preference among candidates for an ambiguous name when country evidence
+# doesn't decide
+_KIND_RANK = {"country": 0, "region": 1, "city": 2}
+
+
+def find_mentions(text: str, gazetteer: Gazetteer) -> list[tuple[Place, ...]]:
+    """
+    Find place names in text.
+
+    Names must start with a capital letter and are matched longest first
+    ("New York City" over "New York"), so each span of text yields at most
+    one mention.
+
+    Returns:
+        Candidate places for each mention, in text order. A mention has
+        several candidates when its name is ambiguous (e.g., "Georgia").
+    """
+    tokens = [_POSSESSIVE.sub("", match.group()) for match in _TOKEN.finditer(text)]
+    keys: dict[int, bytes] = {}
+
+    def key_at(position: int) -> bytes:
+        if position not in keys:
+            keys[position] = normalize(tokens[position]).encode()
+        return keys[position]
+
+    mentions = []
+    i = 0
+    while i < len(tokens):
+        if not tokens[i][:1].isupper() or not key_at(i):
+            i += 1
+            continue
+        key, end, found = key_at(i), i, None
+        while True:
+            places, flags, extends = gazetteer.scan(key)
+            if places and not flags & CODE:
+                found = (end, tuple(places))
+            if not extends or end + 1 >= len(tokens) or end + 1 - i >= MAX_NAME_WORDS:
+                break
+            end += 1
+            key += b" " + key_at(end)
+        if found is None:
+            i += 1
+        else:
+            mentions.append(found[1])
+            i = found[0] + 1
+    return mentions
+
+
+def rank_places(articles: list[dict], gazetteer: Gazetteer) -> dict[Place, float]:
+    """
+    Score every place mentioned in articles.
+
+    Mentions are weighted by field (FIELD_WEIGHTS). An ambiguous name counts
+    for the candidate in the country the unambiguous mentions point to most,
+    then for a city over the region containing it, then the most populous.
+
+    Returns:
+        Dict of place to score, only for places that were mentioned
+    """
+    weighted = []
+    for article in articles:
+        weights = Counter()
+        text_mentions = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for candidates in find_mentions(article.get(field) or "", gazetteer):
+                if field == "text":
+                    text_mentions[candidates] += 1
+                    if text_mentions[candidates] > MAX_TEXT_MENTIONS:
+                        continue
+                weights[candidates] += weight
+        weighted.append(weights)
+
+    support = Counter()
+    for weights in weighted:
+        for candidates, weight in weights.items():
+            countries = {place.country for place in candidates}
+            if len(countries) == 1:
+                support[countries.pop()] += weight
+
+    scores = defaultdict(float)
+    for weights in weighted:
+        for candidates, weight in weights.items():
+            place = max(
+                candidates,
+                key=lambda p: (support[p.country], _KIND_RANK[p.kind], p.population, p.name),
+            )
+            scores[place] += weight
+    return dict(scores)
+
+
+def locate(articles: list[dict], gazetteer: Gazetteer | None = None) -> dict | None:
+    """
+    Resolve a story's location from place mentions in its articles.
+
+    The country is the one with the highest combined score of its own,
+    its regions' and its cities' mentions. The city (and region) must
+    carry at least MIN_SHARE of that score to be reported.
+
+    Args:
+        articles: List of article dicts with title, summary, text
+        gazetteer: Gazetteer to match against (default: the bundled one)
+
+    Returns:
+        Dict with country (ISO3), region and city, any of the last two
+        None, in the shape of the resolve_location component's output.
+        None when no place is mentioned.
+    """
+    gazetteer = gazetteer or load_gazetteer()
+    scores = rank_places(articles, gazetteer)
+    if not scores:
+        return None
+
+    countries, regions = Counter(), Counter()
+    for place, score in scores.items():
+        countries[place.country] += score
+        if place.kind == "region":
+            regions[place.country, place.name] += score
+        elif place.region is not None:
+            regions[place.country, place.region] += score
+    country = max(countries, key=lambda c: (countries[c], c))
+    threshold = countries[country] * MIN_SHARE
+
+    city = _best(
+        [(score, place) for place, score in scores.items() if place.kind == "city" and place.country == country],
+        threshold,
+    )
+    if city is not None and city.region is not None:
+        region = city.region
+    else:
+        region = _best([(score, name) for (c, name), score in regions.items() if c == country], threshold)
+    return {"country": country, "region": region, "city": city.name if city is not None else None}
+
+
+def validate_location(
+    location: dict | None,
+    articles: list[dict],
+    gazetteer: Gazetteer | None = None,
+) -> dict | None:
+    """
+    Check a model's location against the gazetteer and normalise it.
+
+    The country may be given as an ISO3 code, name or alias and becomes
+    its ISO3 code. Known regions and cities in that country become their
+    canonical names, and a known city fills in a missing region. Names the
+    gazetteer doesn't know are kept, since it only covers major places.
+
+    Args:
+        location: Model output with country, region and city (or None)
+        articles: The story's articles, located instead when the country
+                  is missing or not a country
+        gazetteer: Gazetteer to check against (default: the bundled one)
+
+    Returns:
+        Normalised location dict, or locate(articles) when the model's
+        country could not be validated
+    """
+    gazetteer = gazetteer or load_gazetteer()
+    country = location.get("country") if isinstance(location, dict) else None
+    match = gazetteer.country(country) if isinstance(country, str) and country.strip() else None
+    if match is None:
+        return locate(articles, gazetteer)
+
+    region, _ = _canonical(gazetteer, location.get("region"), match.country, "region")
+    city, city_place = _canonical(gazetteer, location.get("city"), match.country, "city")
+    if region is None and city_place is not None:
+        region = city_place.region
+    return {"country": match.country, "region": region, "city": city}
+
+
+def _best(scored: list[tuple[float, object]], threshold: float):
+    """The highest-scoring item, if it reaches threshold."""
+    if not scored:
+        return None
+    score, item = max(scored, key=lambda pair: (pair[0], str(pair[1])))
+    return item if score >= threshold else None
+
+
+def _canonical(gazetteer: Gazetteer, value, country: str, kind: str) -> tuple[str | None, Place | None]:
+    """
+    Canonical name of a region or city in country.
+
+    Returns:
+        Tuple of (name, matching place). Unknown names come back unchanged
+        with no place; blanks and non-strings become None.
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None, None
+    for place in gazetteer.lookup(value):
+        if place.kind == kind and place.country == country:
+            return place.name, place
+    return value, None
@@ -0,0 +1,300 @@
+import contextvars
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+
+# USD per million (prompt, completion) tokens. Dated snapshots (e.g.,
+# "gpt-4o-2024-08-06") are priced by their longest matching prefix.
+MODEL_PRICING = {
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "gpt-4-turbo": (10.00, 30.00),
+    "gpt-3.5-turbo": (0.50, 1.50),
+}
+
+# USD per million prompt tokens served from the provider's prompt cache
+CACHED_PROMPT_PRICING = {
+    "gpt-4o": 1.25,
+    "gpt-4o-mini": 0.075,
+    "gpt-4.1": 0.50,
+    "gpt-4.1-mini": 0.10,
+    "gpt-4.1-nano": 0.025,
+}
+
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+@dataclass
+class CallEvent:
+    """Metrics for a single LLM call (or cache hit)."""
+
+    action: str
+    model: str
+    latency: float
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost: float = 0.0
+    cache_hit: bool = False
+    retries: int = 0
+    # Prompt tokens the provider served from its prompt cache
+    cached_prompt_tokens: int = 0
+
+
+class MetricsHook:
+    """
+    Base class for metrics callbacks.
+
+    Subclass and override on_call, then pass instances to
+    Cronkite(..., hooks=[...]).
+    """
+
+    def on_call(self, event: CallEvent) -> None:
+        """Called after every LLM call or cache hit."""
+
+
+class MetricsRecorder(MetricsHook):
+    """In-memory aggregation of call metrics per action."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events: list[CallEvent] = []
+
+    def on_call(self, event: CallEvent) -> None:
+        with self._lock:
+            self._events.append(event)
+
+    @property
+    def events(self) -> list[CallEvent]:
+        with self._lock:
+            return list(self._events)
+
+    def summary(self) -> dict:
+        """Return totals overall and per action."""
+        return summarize(self.events)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._events.clear()
+
+
+class PrometheusExporter(MetricsHook):
+    """
+    Prometheus text-format exporter for call metrics.
+
+    Call render() from an existing /metrics endpoint, or serve() to start a
+    standalone HTTP endpoint in a background thread.
+    """
+
+    def __init__(self, namespace: str = "cronkite"):
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._calls = defaultdict(int)
+        self._tokens = defaultdict(int)
+        self._cost = defaultdict(float)
+        self._retries = defaultdict(int)
+        self._latency_buckets = defaultdict(lambda: [0] * len(LATENCY_BUCKETS))
+        self._latency_sum = defaultdict(float)
+        self._latency_count = defaultdict(int)
+
+    def on_call(self, event: CallEvent) -> None:
+        labels = (event.action, event.model)
+        with self._lock:
+            self._calls[labels + ("hit" if event.cache_hit else "miss",)] += 1
+            self._tokens[labels + ("prompt",)] += event.prompt_tokens
+            self._tokens[labels + ("completion",)] += event.completion_tokens
+            self._tokens[labels + ("cached_prompt",)] += event.cached_prompt_tokens
+            self._cost[labels] += event.cost
+            self._retries[labels] += event.retries
+            if not event.cache_hit:
+                buckets = self._latency_buckets[labels]
+                for i, bound in enumerate(LATENCY_BUCKETS):
+                    if event.latency <= bound:
+                        buckets[i] += 1
+                self._latency_sum[labels] += event.latency
+                self._latency_count[labels] += 1
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        ns = self.namespace
+        lines = []
+        with self._lock:
+            lines += [f"# HELP {ns}_llm_calls_total LLM calls by action, model and cache outcome.",
+                      f"# TYPE {ns}_llm_calls_total counter"]
+            for (action, model, cache), value in sorted(self._calls.items()):
+                lines.append(f'{ns}_llm_calls_total{{action="{action}",model="{model}",cache="{cache}"}} {value}')
+
+            lines += [f"# HELP {ns}_llm_tokens_total Tokens by action, model and kind (prompt, completion, cached_prompt).",
+                      f"# TYPE {ns}_llm_tokens_total counter"]
+            for (action, model, kind), value in sorted(self._tokens.items()):
+                lines.append(f'{ns}_llm_tokens_total{{action="{action}",model="{model}",kind="{kind}"}} {value}')
+
+            lines += [f"# HELP {ns}_llm_cost_usd_total Estimated cost in USD.",
+                      f"# TYPE {ns}_llm_cost_usd_total counter"]
+            for (action, model), value in sorted(self._cost.items()):
+                lines.append(f'{ns}_llm_cost_usd_total{{action="{action}",model="{model}"}} {value:.6f}')
+
+            lines += [f"# HELP {ns}_llm_retries_total Retried LLM requests.",
+                      f"# TYPE {ns}_llm_retries_total counter"]
+            for (action, model), value in sorted(self._retries.items()):
+                lines.append(f'{ns}_llm_retries_total{{action="{action}",model="{model}"}} {value}')
+
+            lines += [f"# HELP {ns}_llm_latency_seconds LLM call latency.",
+                      f"# TYPE {ns}_llm_latency_seconds histogram"]
+            for labels, buckets in sorted(self._latency_buckets.items()):
+                label_text = f'action="{labels[0]}",model="{labels[1]}"'
+                for bound, count in zip(LATENCY_BUCKETS, buckets):
+                    lines.append(f'{ns}_llm_latency_seconds_bucket{{{label_text},le="{bound}"}} {count}')
+                lines.append(f'{ns}_llm_latency_seconds_bucket{{{label_text},le="+Inf"}} {self._latency_count[labels]}')
+                lines.append(f"{ns}_llm_latency_seconds_sum{{{label_text}}} {self._latency_sum[labels]:.6f}")
+                lines.append(f"{ns}_llm_latency_seconds_count{{{label_text}}} {self._latency_count[labels]}")
+
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int = 9464, host: str = "0.0.0.0") -> "ThreadingHTTPServer":
+        """
+        Serve render() at /metrics from a daemon thread.
+
+        Returns:
+            The running server; call shutdown() on it to stop serving.
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = exporter.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+def estimate_cost(
+    model: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+    cached_prompt_tokens: int = 0,
+) -> float:
+    """
+    Estimate the USD cost of a call, or 0.0 for models without pricing.
+
+    cached_prompt_tokens is the part of prompt_tokens served from the
+    provider's prompt cache, billed at the cached rate where one is known.
+    """
+    name = _price_key(MODEL_PRICING, model)
+    if name is None:
+        return 0.0
+    prompt_price, completion_price = MODEL_PRICING[name]
+    cached_name = _price_key(CACHED_PROMPT_PRICING, model)
+    cached_price = CACHED_PROMPT_PRICING[cached_name] if cached_name else prompt_price
+    uncached_tokens = prompt_tokens - cached_prompt_tokens
+    return (
+        uncached_tokens * prompt_price
+        + cached_prompt_tokens * cached_price
+        + completion_tokens * completion_price
+    ) / 1_000_000
+
+
+def _price_key(pricing: dict, model: str) -> str | None:
+    """Longest pricing entry matching model exactly or as a dated prefix."""
+    matches = [name for name in pricing if model == name or model.startswith(name + "-")]
+    return max(matches, key=len) if matches else None
+
+
+def summarize(events: list[CallEvent]) -> dict:
+    """Aggregate call events into totals, overall and per action."""
+    summary = _totals(events)
+    by_action = defaultdict(list)
+    for event in events:
+        by_action[event.action].append(event)
+    summary["actions"] = {action: _totals(action_events) for action, action_events in by_action.items()}
+    return summary
+
+
+def _totals(events: list[CallEvent]) -> dict:
+    prompt_tokens = sum(e.prompt_tokens for e in events)
+    cached_prompt_tokens = sum(e.cached_prompt_tokens for e in events)
+    return {
+        "calls": len(events),
+        "latency": sum(e.latency for e in events),
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": sum(e.completion_tokens for e in events),
+        "cached_prompt_tokens": cached_prompt_tokens,
+        "prompt_cache_hit_ratio": cached_prompt_tokens / prompt_tokens if prompt_tokens else 0.0,
+        "cost": sum(e.cost for e in events),
+        "cache_hits": sum(1 for e in events if e.cache_hit),
+        "retries": sum(e.retries for e in events),
+    }
+
+
+_collectors: contextvars.ContextVar[tuple[list[CallEvent], ...]] = contextvars.ContextVar(
+    "cronkite_metric_collectors", default=()
+)
+
+
+@contextmanager
+def collect_calls():
+    """
+    Collect the CallEvents emitted within this context.
+
+    Collectors nest, so events inside a sub-story's collector also reach the
+    enclosing story's collector. Asyncio tasks inherit the collectors active
+    when they were created.
+
+    Yields:
+        List that receives each CallEvent as it is emitted
+    """
+    events: list[CallEvent] = []
+    token = _collectors.set(_collectors.get() + (events,))
+    try:
+        yield events
+    finally:
+        _collectors.reset(token)
+
+
+def emit(event: CallEvent, hooks: list[MetricsHook]) -> None:
+    """Send an event to the given hooks and any active collectors."""
+    for hook in hooks:
+        hook.on_call(event)
+    for collector in _collectors.get():
+        collector.append(event)
+
+
+@contextmanager
+def story_meta(enabled: bool):
+    """
+    Collect calls for a story and build its _meta block.
+
+    Yields:
+        Dict filled with the _meta block (latency plus call summary) when
+        the context exits. Stays empty when disabled.
+    """
+    meta: dict = {}
+    if not enabled:
+        yield meta
+        return
+
+    start = time.perf_counter()
+    with collect_calls() as events:
+        yield meta
+    meta.update(summarize(events))
+    meta["elapsed"] = time.perf_counter() - start
@@ -0,0 +1,236 @@
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+
+class _Record(Mapping):
+    """
+    Read-only mapping view over a slotted record.
+
+    Records can be passed anywhere the pipeline reads article or story
+    dicts, without first being copied into one.
+    """
+
+    __slots__ = ()
+
+    # Keys always present, one per field
+    _KEYS: tuple[str, ...] = ()
+    # Keys present only when their attribute is not None, mapped to it
+    _OPTIONAL: dict[str, str] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._KEYS:
+            return getattr(self, key)
+        attr = self._OPTIONAL.get(key)
+        if attr is not None:
+            value = getattr(self, attr)
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._KEYS
+        for key, attr in self._OPTIONAL.items():
+            if getattr(self, attr) is not None:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+@dataclass(frozen=True, slots=True)
+class Article(_Record):
+    """A news article in a cluster."""
+
+    id: str
+    title: str
+    summary: str
+    text: str
+    published_at: str
+    source: str
+
+    _KEYS = ("id", "title", "summary", "text", "published_at", "source")
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Article":
+        if isinstance(data, cls):
+            return data
+        return cls(
+            data["id"],
+            data["title"],
+            data["summary"],
+            data["text"],
+            data["published_at"],
+            data["source"],
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "summary": self.summary,
+            "text": self.text,
+            "published_at": self.published_at,
+            "source": self.source,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Quote(_Record):
+    """A direct quote with speaker attribution."""
+
+    text: str
+    speaker_name: str | None = None
+    speaker_title: str | None = None
+    speaker_org: str | None = None
+    speaker_nation: str | None = None
+    article_id: str = ""
+
+    _KEYS = ("text", "speaker_name", "speaker_title", "speaker_org", "speaker_nation", "article_id")
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Quote":
+        if isinstance(data, cls):
+            return data
+        return cls(
+            data.get("text", ""),
+            data.get("speaker_name"),
+            data.get("speaker_title"),
+            data.get("speaker_org"),
+            data.get("speaker_nation"),
+            data.get("article_id", ""),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "text": self.text,
+            "speaker_name": self.speaker_name,
+            "speaker_title": self.speaker_title,
+            "speaker_org": self.speaker_org,
+            "speaker_nation": self.speaker_nation,
+            "article_id": self.article_id,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Location(_Record):
+    """Where a story takes place. Country is an ISO3 code."""
+
+    country: str | None = None
+    region: str | None = None
+    city: str | None = None
+
+    _KEYS = ("country", "region", "city")
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Location":
+        if isinstance(data, cls):
+            return data
+        return cls(data.get("country"), data.get("region"), data.get("city"))
+
+    def to_dict(self) -> dict:
+        return {"country": self.country, "region": self.region, "city": self.city}
+
+
+@dataclass(frozen=True, slots=True)
+class SubStory(_Record):
+    """A distinct sub-event within a story."""
+
+    title: str
+    summary: str
+    article_ids: tuple[str, ...] = ()
+    meta: dict | None = field(default=None, compare=False, hash=False)
+
+    _KEYS = ("title", "summary", "article_ids")
+    _OPTIONAL = {"_meta": "meta"}
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "SubStory":
+        if isinstance(data, cls):
+            return data
+        return cls(
+            data.get("title", ""),
+            data.get("summary", ""),
+            tuple(data.get("article_ids", ())),
+            data.get("_meta"),
+        )
+
+    def to_dict(self) -> dict:
+        data = {
+            "title": self.title,
+            "summary": self.summary,
+            "article_ids": list(self.article_ids),
+        }
+        if self.meta is not None:
+            data["_meta"] = self.meta
+        return data
+
+
+@dataclass(frozen=True, slots=True)
+class Story(_Record):
+    """A story generated from an article cluster."""
+
+    title: str = ""
+    summary: str = ""
+    key_points: tuple[str, ...] = ()
+    quotes: tuple[Quote, ...] = ()
+    location: Location | None = None
+    sub_stories: tuple[SubStory, ...] = ()
+    article_ids: tuple[str, ...] = ()
+    noise_article_ids: tuple[str, ...] = ()
+    # Set by classify_stories
+    topics: tuple[str, ...] | None = None
+    meta: dict | None = field(default=None, compare=False, hash=False)
+
+    _KEYS = (
+        "title",
+        "summary",
+        "key_points",
+        "quotes",
+        "location",
+        "sub_stories",
+        "article_ids",
+        "noise_article_ids",
+    )
+    _OPTIONAL = {"topics": "topics", "_meta": "meta"}
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Story":
+        if isinstance(data, cls):
+            return data
+        location = data.get("location")
+        topics = data.get("topics")
+        return cls(
+            data.get("title", ""),
+            data.get("summary", ""),
+            tuple(data.get("key_points", ())),
+            tuple(Quote.from_dict(q) for q in data.get("quotes", ())),
+            Location.from_dict(location) if location is not None else None,
+            tuple(SubStory.from_dict(s) for s in data.get("sub_stories", ())),
+            tuple(data.get("article_ids", ())),
+            tuple(data.get("noise_article_ids", ())),
+            tuple(topics) if topics is not None else None,
+            data.get("_meta"),
+        )
+
+    def to_dict(self) -> dict:
+        data = {
+            "title": self.title,
+            "summary": self.summary,
+            "key_points": list(self.key_points),
+            "quotes": [q.to_dict() for q in self.quotes],
+            "location": self.location.to_dict() if self.location is not None else None,
+            "sub_stories": [s.to_dict() for s in self.sub_stories],
+            "article_ids": list(self.article_ids),
+            "noise_article_ids": list(self.noise_article_ids),
+        }
+        if self.topics is not None:
+            data["topics"] = list(self.topics)
+        if self.meta is not None:
+            data["_meta"] = self.meta
+        return data
+
+
+def as_dict(record: Mapping) -> dict:
+    """Return a record as a plain dict, passing dicts through unchanged."""
+    return record.to_dict() if isinstance(record, _Record) else record
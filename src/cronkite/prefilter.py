@@ -0,0 +1,105 @@
+import math
+import re
+from collections import defaultdict
+from statistics import median
+
+from cronkite.similarity import cosine, tfidf_vectors
+
+
+# Smallest cluster with a meaningful centroid; smaller clusters are left to
+# the model entirely
+MIN_CLUSTER_SIZE = 4
+
+# Titles of generic aggregation articles (e.g., "Today's Top Headlines")
+ROUNDUP_TITLE = re.compile(
+    r"\b(round-?ups?|briefing|digest|top (headlines|stories)|headlines you need|"
+    r"news in brief|week in review|what you need to know today)\b",
+    re.IGNORECASE,
+)
+
+
+def prefilter_noise(
+    articles: list[dict],
+    threshold: float = 0.08,
+) -> tuple[list[dict], list[str]]:
+    """
+    Drop clear outliers from a cluster before it is sent to the model.
+
+    Each article is vectorised with TF-IDF over its title, summary and text
+    and compared with the centroid of the rest of the cluster. Articles
+    below the threshold are off-topic, as are roundups (by title) that sit
+    below the cluster's median similarity. Everything else, including
+    borderline articles, is left for the model's noise filter.
+
+    Args:
+        articles: List of article dicts with id, title, summary, text
+        threshold: Cosine similarity to the centroid below which an
+                   article is dropped
+
+    Returns:
+        Tuple of (kept articles in input order, IDs of dropped articles in
+        input order). Nothing is dropped from clusters smaller than
+        MIN_CLUSTER_SIZE or when more than half would be.
+    """
+    if len(articles) < MIN_CLUSTER_SIZE:
+        return articles, []
+
+    scores = centroid_similarities(articles)
+    typical = median(scores)
+    noise = {
+        i for i, (article, score) in enumerate(zip(articles, scores))
+        if score < threshold or (score < typical and ROUNDUP_TITLE.search(article.get("title", "")))
+    }
+    # A centroid dominated by outliers says nothing about the cluster
+    if not noise or len(noise) * 2 > len(articles):
+        return articles, []
+
+    kept = [a for i, a in enumerate(articles) if i not in noise]
+    return kept, [a["id"] for i, a in enumerate(articles) if i in noise]
+
+
+def centroid_similarities(articles: list[dict]) -> list[float]:
+    """
+    Score each article against the centroid of the other articles.
+
+    Leaving the article out of its own centroid keeps a single long
+    outlier from pulling the centroid towards itself.
+    """
+    vectors = tfidf_vectors([
+        f"{a.get('title', '')} {a.get('summary', '')} {a.get('text', '')}" for a in articles
+    ])
+    total = defaultdict(float)
+    for vector in vectors:
+        for term, weight in vector.items():
+            total[term] += weight
+
+    total_sq = sum(w * w for w in total.values())
+    scores = []
+    for vector in vectors:
+        # cosine(v, total - v) without materialising each leave-one-out
+        # centroid; v is unit length (or empty, scoring 0)
+        dot = cosine(vector, total) - (1.0 if vector else 0.0)
+        norm = math.sqrt(max(total_sq - 2 * (dot + 1.0) + 1.0, 0.0)) if vector else 0.0
+        scores.append(dot / norm if norm else 0.0)
+    return scores
+
+
+def merge_noise(story: dict, noise_ids: list[str], articles: list[dict]) -> dict:
+    """
+    Add prefiltered noise IDs to a story's noise_article_ids.
+
+    Args:
+        story: Story dict produced from the kept articles
+        noise_ids: IDs returned by prefilter_noise
+        articles: The cluster passed to prefilter_noise, which sets the
+                  order of the merged IDs
+
+    Returns:
+        Story dict whose noise_article_ids lists model and prefiltered
+        noise in cluster order
+    """
+    noise = set(story.get("noise_article_ids", [])) | set(noise_ids)
+    return {
+        **story,
+        "noise_article_ids": [a["id"] for a in articles if a["id"] in noise],
+    }
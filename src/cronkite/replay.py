@@ -0,0 +1,223 @@
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+
+class ReplayMiss(LookupError):
+    """A request has no recorded response and no client to fetch one from."""
+
+
+class Recording:
+    """
+    Request-to-response pairs for chat completions, optionally on disk.
+
+    With a path, pairs are loaded from and appended to a JSON Lines file,
+    one {"key", "request", "response"} object per line, so recordings can
+    be committed and replayed offline.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        """
+        Args:
+            path: JSON Lines file to load from and append to. None keeps
+                  the recording in memory.
+        """
+        self.path = Path(path) if path is not None else None
+        self._responses: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            with open(self.path) as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._responses[entry["key"]] = entry["response"]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._responses)
+
+    def get(self, key: str) -> dict | None:
+        """Return the recorded ChatCompletion dict for a key, or None."""
+        with self._lock:
+            return self._responses.get(key)
+
+    def add(self, key: str, request: dict, response: dict) -> None:
+        """Record a response, appending it to the file if there is one."""
+        with self._lock:
+            self._responses[key] = response
+            if self.path is not None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "a") as f:
+                    f.write(json.dumps({"key": key, "request": request, "response": response}) + "\n")
+
+
+def request_key(request: dict) -> str:
+    """Hex SHA-256 digest of the parts of a request that determine its response."""
+    material = json.dumps(
+        [request.get("model"), request.get("messages"), request.get("response_format")],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ReplayClient:
+    """
+    Stand-in for an OpenAI client that replays recorded chat completions.
+
+    Requests missing from the recording are forwarded to client and
+    recorded when one is given (record mode), and raise ReplayMiss
+    otherwise (replay mode). Streamed requests are fetched unstreamed and
+    replayed as chunks, so one recording serves both.
+    """
+
+    def __init__(
+        self,
+        recording: Recording,
+        client=None,
+        latency: float = 0.0,
+        token_latency: float = 0.0,
+    ):
+        """
+        Args:
+            recording: Recorded responses to serve
+            client: OpenAI client used on a miss. None raises ReplayMiss.
+            latency: Seconds each call sleeps, to simulate the network
+            token_latency: Extra seconds slept per completion token, to
+                           simulate generation time
+        """
+        self.recording = recording
+        self.client = client
+        self.chat = _Chat(_Completions(recording, self._fetch, latency, token_latency))
+
+    def with_options(self, **options) -> "ReplayClient":
+        return self
+
+    def _fetch(self, request: dict) -> dict:
+        if self.client is None:
+            raise ReplayMiss(f"No recorded response for {request.get('model')} request")
+        return self.client.chat.completions.create(**request).model_dump(mode="json")
+
+
+class AsyncReplayClient:
+    """Async variant of ReplayClient, for AsyncLLMClient."""
+
+    def __init__(
+        self,
+        recording: Recording,
+        client=None,
+        latency: float = 0.0,
+        token_latency: float = 0.0,
+    ):
+        """
+        Args:
+            recording: Recorded responses to serve
+            client: AsyncOpenAI client used on a miss. None raises ReplayMiss.
+            latency: Seconds each call sleeps, to simulate the network
+            token_latency: Extra seconds slept per completion token
+        """
+        self.recording = recording
+        self.client = client
+        self.chat = _Chat(_AsyncCompletions(recording, self._fetch, latency, token_latency))
+
+    def with_options(self, **options) -> "AsyncReplayClient":
+        return self
+
+    async def _fetch(self, request: dict) -> dict:
+        if self.client is None:
+            raise ReplayMiss(f"No recorded response for {request.get('model')} request")
+        response = await self.client.chat.completions.create(**request)
+        return response.model_dump(mode="json")
+
+
+class _Chat:
+    def __init__(self, completions):
+        self.completions = completions
+
+
+class _Completions:
+    """chat.completions backed by a recording and a source for misses."""
+
+    def __init__(
+        self,
+        recording: Recording,
+        source: Callable[[dict], dict],
+        latency: float,
+        token_latency: float = 0.0,
+    ):
+        self.recording = recording
+        self.source = source
+        self.latency = latency
+        self.token_latency = token_latency
+
+    def delay(self, response: dict) -> float:
+        """Seconds to sleep before answering with response."""
+        usage = response.get("usage") or {}
+        return self.latency + self.token_latency * usage.get("completion_tokens", 0)
+
+    def create(self, **request):
+        stream = request.pop("stream", False)
+        request.pop("stream_options", None)
+        key = request_key(request)
+        response = self.recording.get(key)
+        if response is None:
+            response = self.source(request)
+            self.recording.add(key, request, response)
+        delay = self.delay(response)
+        if delay:
+            time.sleep(delay)
+        if stream:
+            return _chunks(response)
+        return ChatCompletion.model_validate(response)
+
+
+class _AsyncCompletions(_Completions):
+    """Async chat.completions backed by a recording and an async source."""
+
+    async def create(self, **request):
+        stream = request.pop("stream", False)
+        request.pop("stream_options", None)
+        key = request_key(request)
+        response = self.recording.get(key)
+        if response is None:
+            response = await self.source(request)
+            self.recording.add(key, request, response)
+        delay = self.delay(response)
+        if delay:
+            await asyncio.sleep(delay)
+        if stream:
+            return _async_chunks(response)
+        return ChatCompletion.model_validate(response)
+
+
+# Characters of content per replayed stream chunk
+CHUNK_CHARS = 16
+
+
+def _chunks(response: dict) -> Iterator[ChatCompletionChunk]:
+    """Replay a ChatCompletion dict as stream chunks, then a usage chunk."""
+    content = response["choices"][0]["message"].get("content") or ""
+    base = {"id": response["id"], "created": response["created"], "model": response["model"]}
+    for start in range(0, len(content), CHUNK_CHARS):
+        yield ChatCompletionChunk.model_validate({
+            **base,
+            "object": "chat.completion.chunk",
+            "choices": [{"index": 0, "delta": {"content": content[start:start + CHUNK_CHARS]}}],
+        })
+    yield ChatCompletionChunk.model_validate({
+        **base,
+        "object": "chat.completion.chunk",
+        "choices": [],
+        "usage": response.get("usage"),
+    })
+
+
+async def _async_chunks(response: dict):
+    for chunk in _chunks(response):
+        yield chunk
@@ -1,3 +1,4 @@
+from cronkite.article_index import ArticleIndex
 from cronkite.config import CronkiteConfig
 
 
@@ -13,23 +14,22 @@ FIELD_DEFAULTS = {
 }
 
 
-def parse_response(response: dict, config: CronkiteConfig, articles: list[dict]) -> dict:
+def parse_response(response: dict, config: CronkiteConfig, index: ArticleIndex) -> dict:
     """
     Parse LLM response and structure it according to output schema.
 
     Args:
         response: Raw JSON response from LLM
         config: CronkiteConfig indicating which actions were enabled
-        articles: Original articles list (for computing article_ids)
+        index: ArticleIndex over the original articles (for computing
+               article_ids)
 
     Returns:
         Structured story dict with all fields populated
     """
-    # Get noise_article_ids to filter articles
-    noise_ids = set(response.get("noise_article_ids", []) if config.filter_noise else [])
-
-    # Compute filtered article IDs
-    filtered_article_ids = [a["id"] for a in articles if a["id"] not in noise_ids]
+    # Noise IDs the model made up are dropped here and recorded on the index
+    filtered = filter_noise(index, response, config)
+    noise_ids = [i for i in index.ids if i not in filtered]
 
     # Build story dict
     story = {
@@ -39,8 +39,8 @@ def parse_response(response: dict, config: CronkiteConfig, articles: list[dict])
         "quotes": _get_field(response, "quotes", config.extract_quotes),
         "location": _get_field(response, "location", config.resolve_location),
         "sub_stories": [],  # Populated separately after substory generation
-        "article_ids": filtered_article_ids,
-        "noise_article_ids": list(noise_ids),
+        "article_ids": filtered.ids,
+        "noise_article_ids": noise_ids,
     }
 
     return story
@@ -60,20 +60,19 @@ def get_subgroups(response: dict, config: CronkiteConfig) -> list[dict]:
     return []
 
 
-def get_filtered_articles(articles: list[dict], response: dict, config: CronkiteConfig) -> list[dict]:
+def filter_noise(index: ArticleIndex, response: dict, config: CronkiteConfig) -> ArticleIndex:
     """
     Get articles after filtering noise.
 
     Args:
-        articles: Original articles list
+        index: ArticleIndex over the original articles
         response: LLM response containing noise_article_ids
         config: Config indicating if filtering was enabled
 
     Returns:
-        Filtered list of articles
+        ArticleIndex over the articles that are not noise
     """
     if not config.filter_noise:
-        return articles
+        return index
 
-    noise_ids = set(response.get("noise_article_ids", []))
-    return [a for a in articles if a["id"] not in noise_ids]
+    return index.without(response.get("noise_article_ids", []))
@@ -0,0 +1,301 @@
+import asyncio
+import contextvars
+import heapq
+import itertools
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import contextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from typing import TypeVar
+
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying: timeouts, conflicts, rate limits, server errors
+RETRYABLE_STATUSES = {408, 409, 429}
+
+# How often async waiters that are not at the head of the queue re-check it
+ASYNC_POLL_INTERVAL = 0.05
+
+
+class Priority(IntEnum):
+    """Scheduling priority. Lower values are served first."""
+
+    INTERACTIVE = 0
+    BATCH = 10
+
+
+@dataclass(frozen=True)
+class RateLimits:
+    """Per-model request and token limits (None = unlimited)."""
+
+    requests_per_minute: int | None = None
+    tokens_per_minute: int | None = None
+
+
+class TokenBucket:
+    """Token bucket refilled continuously up to a per-minute capacity."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until amount can be taken (0 if available now)."""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+
+    def take(self, amount: float) -> None:
+        """Take amount from the bucket. May go negative when correcting usage."""
+        self._refill()
+        self.level -= min(amount, self.capacity)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class _Lane:
+    """Queue and buckets for one model."""
+
+    def __init__(self, limits: RateLimits, lock: threading.Lock):
+        self.requests = TokenBucket(limits.requests_per_minute) if limits.requests_per_minute else None
+        self.tokens = TokenBucket(limits.tokens_per_minute) if limits.tokens_per_minute else None
+        self.waiting: list[tuple[int, int]] = []
+        self.condition = threading.Condition(lock)
+
+    def wait_time(self, tokens: int) -> float:
+        wait = 0.0
+        if self.requests is not None:
+            wait = max(wait, self.requests.wait_time(1))
+        if self.tokens is not None:
+            wait = max(wait, self.tokens.wait_time(tokens))
+        return wait
+
+    def take(self, tokens: int) -> None:
+        if self.requests is not None:
+            self.requests.take(1)
+        if self.tokens is not None:
+            self.tokens.take(tokens)
+
+    def remove(self, ticket: tuple[int, int]) -> None:
+        self.waiting.remove(ticket)
+        heapq.heapify(self.waiting)
+        self.condition.notify_all()
+
+
+class Scheduler:
+    """
+    Central scheduler every LLM request goes through.
+
+    Requests for each model wait in a priority queue and are released when
+    that model's requests-per-minute and tokens-per-minute buckets allow.
+    Rate limits and transient failures are retried with jittered
+    exponential backoff, honouring Retry-After when the API sends it.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, RateLimits] | None = None,
+        default_limits: RateLimits = RateLimits(),
+        max_retries: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 60.0,
+    ):
+        """
+        Args:
+            limits: Rate limits per model identifier
+            default_limits: Limits for models not listed in limits
+            max_retries: Retries per request before the error is raised
+            base_delay: Backoff before the first retry, doubled each attempt
+            max_delay: Upper bound on any single backoff
+        """
+        self.limits = dict(limits or {})
+        self.default_limits = default_limits
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self._lanes: dict[str, _Lane] = {}
+        self._tickets = itertools.count()
+
+    def run(
+        self,
+        model: str,
+        estimated_tokens: int,
+        call: Callable[[], T],
+    ) -> tuple[T, int]:
+        """
+        Run a request once capacity allows, retrying transient failures.
+
+        Args:
+            model: Model identifier the request is billed against
+            estimated_tokens: Estimated prompt plus completion tokens
+            call: Function performing the request
+
+        Returns:
+            Tuple of (call result, number of retries)
+        """
+        import openai
+
+        for attempt in range(self.max_retries + 1):
+            self.acquire(model, estimated_tokens)
+            try:
+                return call(), attempt
+            except openai.APIError as e:
+                if attempt == self.max_retries or not is_retryable(e):
+                    raise
+                time.sleep(self.backoff(attempt, e))
+
+    async def run_async(
+        self,
+        model: str,
+        estimated_tokens: int,
+        call: Callable[[], Awaitable[T]],
+    ) -> tuple[T, int]:
+        """Async variant of run."""
+        import openai
+
+        for attempt in range(self.max_retries + 1):
+            await self.acquire_async(model, estimated_tokens)
+            try:
+                return await call(), attempt
+            except openai.APIError as e:
+                if attempt == self.max_retries or not is_retryable(e):
+                    raise
+                await asyncio.sleep(self.backoff(attempt, e))
+
+    def acquire(self, model: str, tokens: int) -> None:
+        """Block until the request is at the head of its queue and within limits."""
+        with self._lock:
+            lane = self._lane(model)
+            ticket = (current_priority(), next(self._tickets))
+            heapq.heappush(lane.waiting, ticket)
+            try:
+                while True:
+                    if lane.waiting[0] == ticket:
+                        wait = lane.wait_time(tokens)
+                        if wait <= 0:
+                            lane.take(tokens)
+                            heapq.heappop(lane.waiting)
+                            lane.condition.notify_all()
+                            return
+                        lane.condition.wait(wait)
+                    else:
+                        lane.condition.wait()
+            except BaseException:
+                lane.remove(ticket)
+                raise
+
+    async def acquire_async(self, model: str, tokens: int) -> None:
+        """Async variant of acquire."""
+        with self._lock:
+            lane = self._lane(model)
+            ticket = (current_priority(), next(self._tickets))
+            heapq.heappush(lane.waiting, ticket)
+
+        try:
+            while True:
+                with self._lock:
+                    wait = ASYNC_POLL_INTERVAL
+                    if lane.waiting[0] == ticket:
+                        wait = lane.wait_time(tokens)
+                        if wait <= 0:
+                            lane.take(tokens)
+                            heapq.heappop(lane.waiting)
+                            lane.condition.notify_all()
+                            return
+                await asyncio.sleep(wait)
+        except BaseException:
+            with self._lock:
+                lane.remove(ticket)
+            raise
+
+    def record_usage(self, model: str, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct a model's token bucket once a request's real usage is known."""
+        with self._lock:
+            lane = self._lane(model)
+            if lane.tokens is not None:
+                lane.tokens.take(actual_tokens - estimated_tokens)
+
+    def backoff(self, attempt: int, error: Exception | None = None) -> float:
+        """Seconds to wait before retry number attempt + 1."""
+        retry_after = _retry_after(error) if error is not None else None
+        if retry_after is not None:
+            return min(self.max_delay, retry_after) + random.uniform(0, self.base_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def _lane(self, model: str) -> _Lane:
+        lane = self._lanes.get(model)
+        if lane is None:
+            lane = _Lane(self.limits.get(model, self.default_limits), self._lock)
+            self._lanes[model] = lane
+        return lane
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether an OpenAI error is transient and worth retrying."""
+    import openai
+
+    if isinstance(error, (openai.APIConnectionError, openai.APITimeoutError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code in RETRYABLE_STATUSES or error.status_code >= 500
+    return False
+
+
+def _retry_after(error: Exception) -> float | None:
+    """Read the server's requested delay from Retry-After headers, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "cronkite_priority", default=Priority.INTERACTIVE
+)
+
+
+def current_priority() -> Priority:
+    """Priority applied to requests made in the current context."""
+    return _priority.get()
+
+
+@contextmanager
+def scheduling_priority(priority: Priority):
+    """Run the requests made within this context at the given priority."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
@@ -0,0 +1,109 @@
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+
+
+_WORD = re.compile(r"[a-z0-9]+(?:['’][a-z]+)?")
+
+STOPWORDS = frozenset("""
+a about after against all also an and any are as at be been before being between both but by
+can could did do does during each for from had has have he her his how i if in into is it its
+just may more most new no not now of on one only or other our out over said says she should
+so some such than that the their them then there these they this those through to under up
+was we were what when where which while who will with would you your
+""".split())
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase text and split it into content words."""
+    return [w for w in _WORD.findall(text.lower()) if w not in STOPWORDS and len(w) > 1]
+
+
+def tfidf_vectors(documents: list[str]) -> list[dict[str, float]]:
+    """
+    Build L2-normalised sparse TF-IDF vectors for a corpus.
+
+    Args:
+        documents: Raw document texts
+
+    Returns:
+        One term -> weight dict per document
+    """
+    term_counts = [Counter(tokenize(doc)) for doc in documents]
+    document_frequency = Counter()
+    for counts in term_counts:
+        document_frequency.update(counts.keys())
+
+    n = len(documents)
+    idf = {term: math.log((1 + n) / (1 + df)) + 1 for term, df in document_frequency.items()}
+
+    vectors = []
+    for counts in term_counts:
+        vector = {term: (1 + math.log(tf)) * idf[term] for term, tf in counts.items()}
+        vectors.append(_normalize(vector))
+    return vectors
+
+
+def cosine(u: dict[str, float], v: dict[str, float]) -> float:
+    """Cosine similarity of two L2-normalised sparse vectors."""
+    if len(u) > len(v):
+        u, v = v, u
+    return sum(weight * v.get(term, 0.0) for term, weight in u.items())
+
+
+def centroid(vectors: list[dict[str, float]]) -> dict[str, float]:
+    """L2-normalised mean of sparse vectors."""
+    total = defaultdict(float)
+    for vector in vectors:
+        for term, weight in vector.items():
+            total[term] += weight
+    return _normalize(total)
+
+
+def top_matches(
+    queries: list[dict[str, float]],
+    targets: list[dict[str, float]],
+    top_k: int,
+    min_similarity: float = 0.0,
+    query_terms: int = 32,
+) -> list[list[tuple[int, float]]]:
+    """
+    Find the most similar targets for each query using an inverted index.
+
+    Only each query's highest-weighted terms are used to score candidates,
+    which keeps lookups fast on large corpora at a small cost in recall.
+
+    Args:
+        queries: Sparse query vectors
+        targets: Sparse target vectors
+        top_k: Maximum matches to return per query
+        min_similarity: Minimum approximate cosine similarity to keep
+        query_terms: Number of top-weighted query terms used for scoring
+
+    Returns:
+        For each query, a list of (target index, score) sorted by score
+    """
+    postings = defaultdict(list)
+    for j, vector in enumerate(targets):
+        for term, weight in vector.items():
+            postings[term].append((j, weight))
+
+    results = []
+    for query in queries:
+        terms = heapq.nlargest(query_terms, query.items(), key=lambda item: item[1])
+        scores = defaultdict(float)
+        for term, weight in terms:
+            for j, target_weight in postings.get(term, ()):
+                scores[j] += weight * target_weight
+
+        best = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        results.append([(j, score) for j, score in best if score >= min_similarity])
+    return results
+
+
+def _normalize(vector: dict[str, float]) -> dict[str, float]:
+    norm = math.sqrt(sum(w * w for w in vector.values()))
+    if not norm:
+        return {}
+    return {term: w / norm for term, w in vector.items()}
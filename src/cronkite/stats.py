@@ -0,0 +1,35 @@
+import threading
+from collections import Counter
+
+
+class PipelineStats:
+    """
+    Thread-safe counters for work saved or done by local pipeline stages.
+
+    Stages record named counts (e.g., "tokens_saved") which accumulate for
+    the lifetime of the owning LLMClient.
+    """
+
+    def __init__(self):
+        self._counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def add(self, **counts: int) -> None:
+        """Add to one or more named counters."""
+        with self._lock:
+            self._counts.update(counts)
+
+    def get(self, name: str) -> int:
+        """Return the current value of a counter (0 if never recorded)."""
+        with self._lock:
+            return self._counts[name]
+
+    def snapshot(self) -> dict[str, int]:
+        """Return a copy of all counters."""
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        with self._lock:
+            self._counts.clear()
@@ -0,0 +1,196 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+# Rough characters-per-token ratio used when no tokenizer is available
+CHARS_PER_TOKEN = 4
+
+# Per-article allowance for JSON keys, id, source and timestamp
+ARTICLE_OVERHEAD_TOKENS = 24
+
+# Below this many body tokens per article, trimming stops being useful and
+# lower-priority articles fall back to their summary instead
+MIN_BODY_TOKENS = 200
+
+_PARAGRAPH_SPLIT = re.compile(r"\n\s*\n")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class BudgetStats:
+    """Token counts before and after fitting articles to a budget."""
+
+    tokens_before: int = 0
+    tokens_after: int = 0
+    paragraphs_dropped: int = 0
+    articles_trimmed: int = 0
+    articles_summarized: int = 0
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+
+def count_tokens(text: str, model: str = "gpt-4o") -> int:
+    """
+    Count tokens in text for a model.
+
+    Uses tiktoken when installed (pip install cronkite[tokenizer]) and falls
+    back to a characters-per-token estimate otherwise.
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_tokens(text: str, max_tokens: int, model: str = "gpt-4o") -> str:
+    """Truncate text to at most max_tokens tokens."""
+    if max_tokens <= 0:
+        return ""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return text[: max_tokens * CHARS_PER_TOKEN]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+
+def article_tokens(article: dict, model: str = "gpt-4o") -> int:
+    """Estimate the tokens an article contributes to an LLM payload."""
+    return (
+        count_tokens(article.get("title", ""), model)
+        + count_tokens(article.get("summary", ""), model)
+        + count_tokens(article.get("text", ""), model)
+        + ARTICLE_OVERHEAD_TOKENS
+    )
+
+
+def fit_to_budget(
+    articles: list[dict],
+    max_tokens: int,
+    model: str = "gpt-4o",
+) -> tuple[list[dict], BudgetStats]:
+    """
+    Fit articles into a token budget for the LLM payload.
+
+    Applies progressively lossier steps until the articles fit:
+    1. Drop paragraphs that already appeared in an earlier article
+    2. Trim article bodies to an equal per-article cap
+    3. Replace the body of the lowest-priority articles with their summary
+
+    Priority follows input order, so callers should list the most
+    important articles first. Input dicts are never mutated.
+
+    Args:
+        articles: List of article dicts with title, summary, text
+        max_tokens: Token budget for all articles combined
+        model: Model whose tokenizer should be used for counting
+
+    Returns:
+        Tuple of (fitted articles, BudgetStats)
+    """
+    body_tokens = [count_tokens(a.get("text", ""), model) for a in articles]
+    fixed_tokens = [article_tokens(a, model) - body for a, body in zip(articles, body_tokens)]
+    stats = BudgetStats(tokens_before=sum(fixed_tokens) + sum(body_tokens))
+
+    if stats.tokens_before <= max_tokens:
+        stats.tokens_after = stats.tokens_before
+        return articles, stats
+
+    texts, stats.paragraphs_dropped = _drop_duplicate_paragraphs(articles)
+    body_tokens = [count_tokens(text, model) for text in texts]
+
+    # Summarize from the back until an equal body cap is worth having
+    summarized = 0
+    while True:
+        kept = len(articles) - summarized
+        body_budget = max_tokens - sum(fixed_tokens)
+        cap = _body_cap(body_tokens[:kept], body_budget)
+        if cap is None or cap >= MIN_BODY_TOKENS or kept == 0:
+            break
+        summarized += 1
+
+    fitted = []
+    for i, article in enumerate(articles):
+        text = texts[i]
+        if i >= len(articles) - summarized:
+            if text:
+                stats.articles_summarized += 1
+            text = ""
+        elif cap is not None and body_tokens[i] > cap:
+            text = truncate_tokens(text, cap, model)
+            stats.articles_trimmed += 1
+
+        fitted.append(article if text == article.get("text", "") else {**article, "text": text})
+
+    stats.tokens_after = sum(article_tokens(a, model) for a in fitted)
+    return fitted, stats
+
+
+def _drop_duplicate_paragraphs(articles: list[dict]) -> tuple[list[str], int]:
+    """Remove paragraphs already seen in an earlier article."""
+    seen = set()
+    texts = []
+    dropped = 0
+
+    for article in articles:
+        kept = []
+        for paragraph in _PARAGRAPH_SPLIT.split(article.get("text", "")):
+            key = _WHITESPACE.sub(" ", paragraph).strip().lower()
+            if not key:
+                continue
+            if key in seen:
+                dropped += 1
+                continue
+            seen.add(key)
+            kept.append(paragraph.strip())
+        texts.append("\n\n".join(kept))
+
+    return texts, dropped
+
+
+def _body_cap(body_tokens: list[int], body_budget: int) -> int | None:
+    """
+    Find the largest per-article body cap that fits the budget.
+
+    Returns None when every body already fits uncapped, and 0 when not even
+    an empty body fits.
+    """
+    if sum(body_tokens) <= body_budget:
+        return None
+    if body_budget <= 0:
+        return 0
+
+    remaining = body_budget
+    ordered = sorted(body_tokens)
+    for i, tokens in enumerate(ordered):
+        share = remaining // (len(ordered) - i)
+        if tokens > share:
+            return share
+        remaining -= tokens
+    return None
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    """Load the tiktoken encoding for a model, or None if unavailable."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        encoding_name = tiktoken.encoding_name_for_model(model)
+    except KeyError:
+        encoding_name = "o200k_base"
+
+    try:
+        return tiktoken.get_encoding(encoding_name)
+    except Exception:
+        # Encodings are downloaded on first use; fall back when offline
+        return None
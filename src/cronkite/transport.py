@@ -0,0 +1,242 @@
+import threading
+from collections.abc import AsyncIterator, Iterator
+
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+
+try:
+    # openai 3.x builds on httpx2, which keeps httpx's API
+    import httpx2 as httpx
+except ImportError:
+    import httpx
+
+
+class HTTPPool:
+    """
+    One tuned connection pool shared by many Cronkite instances.
+
+    Workers often create an instance per model or config. Passing the same
+    HTTPPool to each (Cronkite(pool=...)) makes their OpenAI clients share
+    keep-alive connections instead of each opening its own pool and paying
+    for fresh TLS handshakes. Sync and async clients get separate
+    transports with the same settings. Share one pool's async clients only
+    within a single event loop.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 100,
+        keepalive_expiry: float = 60.0,
+        http2: bool = False,
+        timeout: float = 600.0,
+        connect_timeout: float = 5.0,
+    ):
+        """
+        Args:
+            max_connections: Maximum concurrent connections per transport
+            max_keepalive_connections: Idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection is kept open
+            http2: Multiplex requests over HTTP/2 connections (pip install
+                   cronkite[http2])
+            timeout: Seconds to wait for a response
+            connect_timeout: Seconds to wait for a connection
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self._meter = _Meter()
+        self._transport = _MeteredTransport(
+            httpx.HTTPTransport(http2=http2, limits=self.limits), self._meter
+        )
+        self._async_transport = _AsyncMeteredTransport(
+            httpx.AsyncHTTPTransport(http2=http2, limits=self.limits), self._meter
+        )
+        self._lock = threading.Lock()
+        self._http_client = None
+        self._async_http_client = None
+
+    def http_client(self) -> httpx.Client:
+        """The shared sync HTTP client, created on first use."""
+        with self._lock:
+            if self._http_client is None:
+                self._http_client = DefaultHttpxClient(transport=self._transport, timeout=self.timeout)
+            return self._http_client
+
+    def async_http_client(self) -> httpx.AsyncClient:
+        """The shared async HTTP client, created on first use."""
+        with self._lock:
+            if self._async_http_client is None:
+                self._async_http_client = DefaultAsyncHttpxClient(
+                    transport=self._async_transport, timeout=self.timeout
+                )
+            return self._async_http_client
+
+    def openai(self, **kwargs) -> OpenAI:
+        """Create an OpenAI client on the shared pool."""
+        return OpenAI(http_client=self.http_client(), **kwargs)
+
+    def async_openai(self, **kwargs) -> AsyncOpenAI:
+        """Create an AsyncOpenAI client on the shared pool."""
+        return AsyncOpenAI(http_client=self.async_http_client(), **kwargs)
+
+    def stats(self) -> dict:
+        """
+        Pool utilisation across the sync and async transports.
+
+        Returns:
+            Dict with requests (total sent), in_flight and peak_in_flight
+            (requests awaiting or streaming a response), utilisation and
+            peak_utilisation (in-flight requests per max_connections), and
+            connections and idle_connections currently open
+        """
+        snapshot = self._meter.snapshot()
+        max_connections = self.limits.max_connections or 0
+        connections = _connections(self._transport.transport) + _connections(
+            self._async_transport.transport
+        )
+        return {
+            **snapshot,
+            "max_connections": max_connections,
+            "utilisation": snapshot["in_flight"] / max_connections if max_connections else 0.0,
+            "peak_utilisation": snapshot["peak_in_flight"] / max_connections if max_connections else 0.0,
+            "connections": len(connections),
+            "idle_connections": sum(1 for c in connections if c.is_idle()),
+        }
+
+    def close(self) -> None:
+        """Close the sync client and its connections."""
+        with self._lock:
+            client, self._http_client = self._http_client, None
+        if client is not None:
+            client.close()
+        else:
+            self._transport.close()
+
+    async def aclose(self) -> None:
+        """Close the async client and its connections."""
+        with self._lock:
+            client, self._async_http_client = self._async_http_client, None
+        if client is not None:
+            await client.aclose()
+        else:
+            await self._async_transport.aclose()
+
+
+def _connections(transport) -> list:
+    """Open connections in a transport's pool (empty if it can't be inspected)."""
+    pool = getattr(transport, "_pool", None)
+    return list(getattr(pool, "connections", []))
+
+
+class _Meter:
+    """Thread-safe request counters shared by a pool's transports."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+
+    def start(self) -> None:
+        with self._lock:
+            self._requests += 1
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    def finish(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "in_flight": self._in_flight,
+                "peak_in_flight": self._peak_in_flight,
+            }
+
+
+class _MeteredTransport(httpx.BaseTransport):
+    """Counts requests from send until their response body is closed."""
+
+    def __init__(self, transport: httpx.BaseTransport, meter: _Meter):
+        self.transport = transport
+        self.meter = meter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.meter.start()
+        try:
+            response = self.transport.handle_request(request)
+        except BaseException:
+            self.meter.finish()
+            raise
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_MeteredStream(response.stream, self.meter),
+            extensions=response.extensions,
+        )
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class _AsyncMeteredTransport(httpx.AsyncBaseTransport):
+    """Async variant of _MeteredTransport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, meter: _Meter):
+        self.transport = transport
+        self.meter = meter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.meter.start()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except BaseException:
+            self.meter.finish()
+            raise
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_AsyncMeteredStream(response.stream, self.meter),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class _MeteredStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, meter: _Meter):
+        self.stream = stream
+        self.meter = meter
+        self.closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self.stream
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self.meter.finish()
+        self.stream.close()
+
+
+class _AsyncMeteredStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, meter: _Meter):
+        self.stream = stream
+        self.meter = meter
+        self.closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self.stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self.meter.finish()
+        await self.stream.aclose()
@@ -0,0 +1,493 @@
+"""
+Long-running worker that turns queued jobs into stories.
+
+Usage:
+    python -m cronkite.worker run --db jobs.sqlite [--model MODEL] [--concurrency N]
+    python -m cronkite.worker enqueue --db jobs.sqlite generate_story cluster.json
+    python -m cronkite.worker status --db jobs.sqlite
+"""
+
+import argparse
+import json
+import signal
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from cronkite.cronkite import Cronkite
+
+
+# Job types and how each runs on a Cronkite instance
+JOB_TYPES: dict[str, Callable[[Cronkite, dict], Any]] = {
+    "generate_story": lambda cronkite, payload: cronkite.generate_story(payload["articles"]),
+    "classify_stories": lambda cronkite, payload: cronkite.classify_stories(payload["stories"]),
+}
+
+
+class QueueFull(Exception):
+    """A job was offered to a queue already holding max_pending jobs."""
+
+
+@dataclass
+class Job:
+    """A claimed unit of work."""
+
+    id: str
+    type: str
+    payload: dict
+    attempts: int
+
+
+class JobQueue(ABC):
+    """
+    Base class for job queues.
+
+    Jobs are claimed under a lease. A job whose lease runs out before it is
+    completed or failed (e.g., because its worker crashed) is claimed again.
+    Each claim counts an attempt, and complete and fail only apply for the
+    attempt that currently holds the job, so a worker that finishes after
+    losing its lease cannot overwrite the state of the job's new owner.
+    """
+
+    @abstractmethod
+    def put(self, job_type: str, payload: dict, job_id: str | None = None) -> str:
+        """
+        Add a job.
+
+        Args:
+            job_type: One of JOB_TYPES
+            payload: Job input ({"articles": [...]} or {"stories": [...]})
+            job_id: ID to enqueue under. Putting an ID the queue already
+                    holds, in any status, is a no-op (even when the queue
+                    is full), so producers can retry safely.
+
+        Returns:
+            The job ID
+
+        Raises:
+            QueueFull: If job_id is new and the queue already holds
+                       max_pending queued jobs
+        """
+
+    @abstractmethod
+    def claim(self, limit: int, lease: float) -> list[Job]:
+        """Claim up to limit queued jobs (or jobs with expired leases) for lease seconds."""
+
+    @abstractmethod
+    def extend(self, job_ids: list[str], lease: float) -> None:
+        """Renew the leases of jobs still being worked on."""
+
+    @abstractmethod
+    def complete(self, job_id: str, attempt: int) -> bool:
+        """
+        Mark a claimed job done.
+
+        Args:
+            job_id: ID of the claimed job
+            attempt: The claimed Job's attempts, identifying the claim
+
+        Returns:
+            False if the job is no longer running under that claim (it was
+            claimed again after the lease expired), in which case nothing
+            changes
+        """
+
+    @abstractmethod
+    def fail(self, job_id: str, attempt: int, error: str, retry: bool) -> bool:
+        """
+        Release a claimed job for another attempt, or mark it failed.
+
+        Returns:
+            False if the job is no longer running under that claim, as for
+            complete
+        """
+
+    @abstractmethod
+    def counts(self) -> dict[str, int]:
+        """Number of jobs in each status."""
+
+
+class ResultStore(ABC):
+    """
+    Base class for job result stores.
+
+    Writes are idempotent: the first result stored for a job wins, so a job
+    re-run after a crash cannot overwrite or duplicate its result.
+    """
+
+    @abstractmethod
+    def put(self, job_id: str, result: Any) -> bool:
+        """Store a job's result. Returns False if one was already stored."""
+
+    @abstractmethod
+    def get(self, job_id: str) -> Any | None:
+        """Return a job's result, or None if there is none yet."""
+
+    def __contains__(self, job_id: str) -> bool:
+        return self.get(job_id) is not None
+
+
+class SQLiteQueue(JobQueue):
+    """Job queue in a SQLite database, safe to share between worker processes."""
+
+    def __init__(self, path: str | Path, max_pending: int | None = None):
+        """
+        Args:
+            path: SQLite database file. Created if missing.
+            max_pending: Maximum queued jobs before put raises QueueFull.
+                         None means unbounded.
+        """
+        self.path = Path(path)
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        # Autocommit mode, so claims can take the write lock up front
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                type TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_expires_at REAL,
+                error TEXT,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+
+    def put(self, job_type: str, payload: dict, job_id: str | None = None) -> str:
+        if job_type not in JOB_TYPES:
+            raise ValueError(f"Unknown job type {job_type!r}; expected one of {', '.join(JOB_TYPES)}")
+        job_id = job_id or uuid.uuid4().hex
+        with self._lock, self._transaction():
+            if self._conn.execute("SELECT 1 FROM jobs WHERE id = ?", (job_id,)).fetchone():
+                return job_id
+            if self.max_pending is not None:
+                queued = self._conn.execute("SELECT COUNT(*) FROM jobs WHERE status = 'queued'").fetchone()[0]
+                if queued >= self.max_pending:
+                    raise QueueFull(f"{queued} jobs already queued")
+            self._conn.execute(
+                "INSERT OR IGNORE INTO jobs (id, type, payload, status, created_at) VALUES (?, ?, ?, 'queued', ?)",
+                (job_id, job_type, json.dumps(payload), time.time()),
+            )
+        return job_id
+
+    def claim(self, limit: int, lease: float) -> list[Job]:
+        if limit <= 0:
+            return []
+        now = time.time()
+        with self._lock, self._transaction():
+            rows = self._conn.execute(
+                """
+                SELECT id, type, payload, attempts FROM jobs
+                WHERE status = 'queued' OR (status = 'running' AND lease_expires_at < ?)
+                ORDER BY created_at LIMIT ?
+                """,
+                (now, limit),
+            ).fetchall()
+            self._conn.executemany(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, lease_expires_at = ? WHERE id = ?",
+                [(now + lease, row[0]) for row in rows],
+            )
+        return [Job(job_id, job_type, json.loads(payload), attempts + 1) for job_id, job_type, payload, attempts in rows]
+
+    def extend(self, job_ids: list[str], lease: float) -> None:
+        with self._lock, self._transaction():
+            self._conn.executemany(
+                "UPDATE jobs SET lease_expires_at = ? WHERE id = ? AND status = 'running'",
+                [(time.time() + lease, job_id) for job_id in job_ids],
+            )
+
+    def complete(self, job_id: str, attempt: int) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                """
+                UPDATE jobs SET status = 'done', lease_expires_at = NULL, error = NULL
+                WHERE id = ? AND status = 'running' AND attempts = ?
+                """,
+                (job_id, attempt),
+            )
+        return cursor.rowcount == 1
+
+    def fail(self, job_id: str, attempt: int, error: str, retry: bool) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                """
+                UPDATE jobs SET status = ?, lease_expires_at = NULL, error = ?
+                WHERE id = ? AND status = 'running' AND attempts = ?
+                """,
+                ("queued" if retry else "failed", error, job_id, attempt),
+            )
+        return cursor.rowcount == 1
+
+    def counts(self) -> dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {"queued": 0, "running": 0, "done": 0, "failed": 0, **dict(rows)}
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def _transaction(self):
+        return _Transaction(self._conn)
+
+
+class SQLiteResultStore(ResultStore):
+    """Job results in a SQLite database, stored as JSON."""
+
+    def __init__(self, path: str | Path):
+        """
+        Args:
+            path: SQLite database file. Created if missing. May be the
+                  queue's database.
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                job_id TEXT PRIMARY KEY,
+                result TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def put(self, job_id: str, result: Any) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO results (job_id, result, created_at) VALUES (?, ?, ?)",
+                (job_id, json.dumps(result, default=_to_json), time.time()),
+            )
+            self._conn.commit()
+            return cursor.rowcount == 1
+
+    def get(self, job_id: str) -> Any | None:
+        with self._lock:
+            row = self._conn.execute("SELECT result FROM results WHERE job_id = ?", (job_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+
+class Worker:
+    """
+    Pulls jobs from a queue and runs them on a Cronkite instance.
+
+    At most max_concurrency jobs are in flight, and jobs are only claimed
+    when a slot is free, so a busy worker leaves the rest of the queue to
+    other workers. stop() (SIGTERM/SIGINT from the command line) stops
+    claiming and lets in-flight jobs finish. A job whose worker dies is
+    resumed elsewhere once its lease expires; if the worker was only slow,
+    its late acknowledgement is rejected and counted in stale.
+    """
+
+    def __init__(
+        self,
+        cronkite: Cronkite,
+        queue: JobQueue,
+        store: ResultStore,
+        max_concurrency: int = 4,
+        lease: float = 300.0,
+        poll_interval: float = 1.0,
+        max_attempts: int = 3,
+    ):
+        """
+        Args:
+            cronkite: Cronkite instance jobs run on
+            queue: Queue jobs are claimed from
+            store: Store results are written to
+            max_concurrency: Maximum jobs in flight at once
+            lease: Seconds a claimed job is reserved for. Leases of running
+                   jobs are renewed, so this bounds how long a crashed
+                   worker's jobs wait, not how long a job may take.
+            poll_interval: Seconds to wait when the queue is empty
+            max_attempts: Attempts before a failing job is marked failed
+        """
+        self.cronkite = cronkite
+        self.queue = queue
+        self.store = store
+        self.max_concurrency = max_concurrency
+        self.lease = lease
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.processed = 0
+        self.failed = 0
+        # Jobs finished after another worker claimed them
+        self.stale = 0
+        self._stopping = threading.Event()
+
+    def stop(self) -> None:
+        """Stop claiming jobs; run() returns once in-flight jobs finish."""
+        self._stopping.set()
+
+    def run(self, max_jobs: int | None = None) -> None:
+        """
+        Process jobs until stop() is called.
+
+        Args:
+            max_jobs: Return once this many jobs have finished or the queue
+                      is drained, whichever comes first. None runs until
+                      stopped.
+        """
+        in_flight: dict[Future, Job] = {}
+        finished_before = self.processed + self.failed + self.stale
+        renewed_at = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            while True:
+                if not self._stopping.is_set():
+                    free = self.max_concurrency - len(in_flight)
+                    if max_jobs is not None:
+                        finished = self.processed + self.failed + self.stale - finished_before
+                        free = min(free, max_jobs - finished - len(in_flight))
+                    for job in self.queue.claim(free, self.lease):
+                        in_flight[executor.submit(self._run_job, job)] = job
+                    if max_jobs is not None and not in_flight:
+                        return
+
+                if not in_flight:
+                    if self._stopping.is_set():
+                        return
+                    self._stopping.wait(self.poll_interval)
+                    continue
+
+                done, _ = wait(in_flight, timeout=min(self.poll_interval, self.lease / 3), return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._finish(in_flight.pop(future), future)
+
+                if in_flight and time.monotonic() - renewed_at >= self.lease / 3:
+                    self.queue.extend([job.id for job in in_flight.values()], self.lease)
+                    renewed_at = time.monotonic()
+
+    def _run_job(self, job: Job) -> Any:
+        # A job re-claimed after a crash may already have its result
+        if job.id in self.store:
+            return None
+        return JOB_TYPES[job.type](self.cronkite, job.payload)
+
+    def _finish(self, job: Job, future: Future) -> None:
+        """Store a finished job's result and acknowledge it."""
+        error = future.exception()
+        if error is None:
+            result = future.result()
+            # Stored even when the lease was lost; the first result wins
+            if result is not None:
+                self.store.put(job.id, result)
+            if not self.queue.complete(job.id, job.attempts):
+                self.stale += 1
+                return
+            self.processed += 1
+            return
+
+        retry = job.attempts < self.max_attempts
+        if not self.queue.fail(job.id, job.attempts, f"{type(error).__name__}: {error}", retry):
+            self.stale += 1
+        elif not retry:
+            self.failed += 1
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT on an autocommit connection."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+def _to_json(value: Any) -> Any:
+    """Serialize Story records and other Mappings in results."""
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m cronkite.worker", description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Process jobs until SIGTERM")
+    run.add_argument("--db", required=True, help="SQLite job queue")
+    run.add_argument("--results", help="SQLite results store (default: the queue database)")
+    run.add_argument("--model", default="gpt-4o", help="OpenAI model (default: gpt-4o)")
+    run.add_argument("--concurrency", type=int, default=4, help="Jobs in flight at once (default: 4)")
+    run.add_argument("--lease", type=float, default=300.0, help="Job lease in seconds (default: 300)")
+    run.add_argument("--max-attempts", type=int, default=3, help="Attempts per job (default: 3)")
+    run.add_argument("--env", action="store_true", help="Load OPENAI_API_KEY etc. from .env")
+
+    enqueue = commands.add_parser("enqueue", help="Queue a job from a JSON file")
+    enqueue.add_argument("--db", required=True, help="SQLite job queue")
+    enqueue.add_argument("--id", help="Job ID (default: random)")
+    enqueue.add_argument("type", choices=sorted(JOB_TYPES), help="Job type")
+    enqueue.add_argument("file", help="JSON list of articles (generate_story) or stories (classify_stories)")
+
+    status = commands.add_parser("status", help="Show job counts")
+    status.add_argument("--db", required=True, help="SQLite job queue")
+
+    args = parser.parse_args(argv)
+    queue = SQLiteQueue(args.db)
+
+    if args.command == "enqueue":
+        with open(args.file) as f:
+            items = json.load(f)
+        key = "articles" if args.type == "generate_story" else "stories"
+        print(queue.put(args.type, {key: items}, args.id))
+        return 0
+
+    if args.command == "status":
+        print(json.dumps(queue.counts()))
+        return 0
+
+    if args.env:
+        from cronkite.env import load_env
+
+        load_env()
+    worker = Worker(
+        Cronkite(model=args.model),
+        queue,
+        SQLiteResultStore(args.results or args.db),
+        max_concurrency=args.concurrency,
+        lease=args.lease,
+        max_attempts=args.max_attempts,
+    )
+
+    def shutdown(signum, frame):
+        if worker._stopping.is_set():
+            # Second signal: leave unfinished jobs to expire and be resumed
+            sys.exit(1)
+        print("Finishing in-flight jobs; signal again to exit now", file=sys.stderr)
+        worker.stop()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+    worker.run()
+    print(
+        f"Processed {worker.processed} jobs, {worker.failed} failed, {worker.stale} lost to expired leases",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+import threading
+
+import pytest
+
+from cronkite import Cronkite, CronkiteConfig, MetricsRecorder
+from tests.benchmarks.fake import FakeClient
+
+
+class PayloadMeter:
+    """Client wrapper counting the calls and request bytes sent through it."""
+
+    def __init__(self, client):
+        self.client = client
+        self.chat = self
+        self.completions = self
+        self.calls = 0
+        self.payload_bytes = 0
+        self._lock = threading.Lock()
+
+    def with_options(self, **options) -> "PayloadMeter":
+        return self
+
+    def create(self, **request):
+        with self._lock:
+            self.calls += 1
+            self.payload_bytes += sum(len(m["content"].encode("utf-8")) for m in request["messages"])
+        return self.client.chat.completions.create(**request)
+
+
+# The fake answers from the response's JSON Schema, so offline runs opt in
+# to structured outputs
+STRUCTURED = CronkiteConfig(structured_outputs=True)
+
+
+class Offline:
+    """A Cronkite wired to a FakeClient, plus what each run sends to it."""
+
+    def __init__(self, client=None):
+        self.recorder = MetricsRecorder()
+        self.meter = PayloadMeter(client or FakeClient())
+        self.cronkite = Cronkite(config=STRUCTURED, hooks=[self.recorder], client=self.meter)
+
+    def run(self, benchmark, fn, *args):
+        """
+        Benchmark fn(*args), reporting one run's calls, bytes, tokens and
+        the pipeline stats it recorded (e.g., tokens_saved).
+
+        The measured run also warms the fake's recording, so benchmark
+        rounds time Cronkite's own overhead rather than response faking.
+        """
+        self.meter.calls = self.meter.payload_bytes = 0
+        self.recorder.reset()
+        before = self.cronkite.stats
+        result = fn(*args)
+        after = self.cronkite.stats
+        summary = self.recorder.summary()
+        benchmark.extra_info.update(
+            calls=self.meter.calls,
+            payload_bytes=self.meter.payload_bytes,
+            prompt_tokens=summary["prompt_tokens"],
+            completion_tokens=summary["completion_tokens"],
+            estimated_cost=summary["cost"],
+            stats={
+                name: count - before.get(name, 0)
+                for name, count in after.items()
+                if count != before.get(name, 0)
+            },
+        )
+        benchmark(fn, *args)
+        return result
+
+
+@pytest.fixture
+def offline() -> Offline:
+    return Offline()
@@ -0,0 +1,197 @@
+"""
+Offline stand-ins for the OpenAI client, for benchmarks and unit tests.
+
+Responses are faked from each request's JSON Schema, so Cronkite configs
+using them need structured_outputs=True.
+"""
+
+import json
+
+from cronkite.replay import AsyncReplayClient, Recording, ReplayClient, request_key
+from cronkite.token_budget import count_tokens
+
+
+class FakeClient(ReplayClient):
+    """
+    Offline OpenAI client stand-in that answers from the request's schema.
+
+    Responses are built by fake_completion: deterministic, valid against
+    the strict JSON Schema in response_format, and referring to article IDs
+    and story indices from the payload. Nothing is sent over the network.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        recording: Recording | None = None,
+        token_latency: float = 0.0,
+    ):
+        """
+        Args:
+            latency: Seconds each call sleeps, to simulate the network
+            recording: Where generated responses are kept. Defaults to a new
+                       in-memory Recording, so repeated requests are reused.
+            token_latency: Extra seconds slept per completion token, to
+                           simulate generation time
+        """
+        super().__init__(
+            recording if recording is not None else Recording(),
+            latency=latency,
+            token_latency=token_latency,
+        )
+
+    def _fetch(self, request: dict) -> dict:
+        return fake_completion(request)
+
+
+class AsyncFakeClient(AsyncReplayClient):
+    """Async variant of FakeClient, for AsyncLLMClient."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        recording: Recording | None = None,
+        token_latency: float = 0.0,
+    ):
+        super().__init__(
+            recording if recording is not None else Recording(),
+            latency=latency,
+            token_latency=token_latency,
+        )
+
+    async def _fetch(self, request: dict) -> dict:
+        return fake_completion(request)
+
+
+def fake_completion(request: dict) -> dict:
+    """
+    Build a ChatCompletion dict answering a request without calling a model.
+
+    Args:
+        request: chat.completions.create keyword arguments
+
+    Returns:
+        ChatCompletion dict whose content satisfies the request's JSON
+        Schema ("{}" in plain JSON mode) and whose usage counts the prompt
+        and content tokens.
+    """
+    model = request.get("model", "")
+    messages = request.get("messages", [])
+    payload = _Payload(messages[-1]["content"] if messages else "")
+    response_format = request.get("response_format") or {}
+    schema = response_format.get("json_schema", {}).get("schema")
+    content = json.dumps(_fake_value(schema, "", payload)) if schema else "{}"
+
+    prompt_tokens = sum(count_tokens(m["content"], model) for m in messages)
+    completion_tokens = count_tokens(content, model)
+    return {
+        "id": "chatcmpl-fake-" + request_key(request)[:16],
+        "object": "chat.completion",
+        "created": 0,
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop",
+        }],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+class _Payload:
+    """Article IDs and story indices found in a request's user payload."""
+
+    def __init__(self, payload: str):
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            data = None
+
+        if isinstance(data, dict) and "group_a" in data:
+            self.article_ids = []
+            self.indices = [story["index"] for story in data["group_a"]]
+            self.group_b_size = len(data.get("group_b", []))
+            return
+
+        if isinstance(data, dict):
+            data = data.get("articles", [])
+        items = [item for item in data or [] if isinstance(item, dict)]
+        self.article_ids = [item["id"] for item in items if "id" in item]
+        self.indices = [item["index"] for item in items if "index" in item]
+        self.group_b_size = 0
+
+
+# Filler used for free-text fields
+_WORDS = (
+    "officials said the situation continued to develop as authorities "
+    "responded and residents awaited further information about the events"
+).split()
+
+
+def _text(words: int) -> str:
+    return " ".join(_WORDS[i % len(_WORDS)] for i in range(words)).capitalize() + "."
+
+
+def _fake_value(schema: dict, name: str, payload: _Payload):
+    """Fake a value for one schema node, special-casing known field names."""
+    properties = schema.get("properties", {})
+    items = schema.get("items", {})
+
+    if name == "noise_article_ids":
+        return []
+    if name == "subgroups":
+        ids = payload.article_ids
+        count = min(3, len(ids) // 5)
+        return [
+            {"theme": f"Development {i + 1}", "article_ids": ids[i::count]}
+            for i in range(count)
+        ]
+    if name == "quotes":
+        ids = payload.article_ids
+        return [
+            {**_fake_value(items, "", payload), "text": _text(12), "article_id": ids[i % len(ids)]}
+            for i in range(min(2, len(ids)))
+        ]
+    if name == "classifications":
+        return [
+            {**_fake_value(items, "", payload), "story_index": index}
+            for index in payload.indices
+        ]
+    if name == "links":
+        return [
+            {"group_a_index": index, "group_b_index": index}
+            for index in payload.indices[:payload.group_b_size]
+        ]
+    if name == "title":
+        return "Synthetic Event Under Way"
+    if name == "summary":
+        return _text(160)
+    if name == "key_points":
+        return [_text(15) for _ in range(4)]
+    if name == "country":
+        return "USA"
+
+    if "enum" in schema:
+        return schema["enum"][0]
+    kind = schema.get("type")
+    if isinstance(kind, list):
+        # Nullable scalars (e.g., unknown speaker details) are left null;
+        # nullable objects (e.g., location) are filled in
+        kind = "object" if "object" in kind else "null" if "null" in kind else kind[0]
+    if kind == "object":
+        return {key: _fake_value(value, key, payload) for key, value in properties.items()}
+    if kind == "array":
+        return [_fake_value(items, "", payload)]
+    if kind == "string":
+        return _text(3)
+    if kind == "integer":
+        return 0
+    if kind == "number":
+        return 0.0
+    if kind == "boolean":
+        return False
+    return None
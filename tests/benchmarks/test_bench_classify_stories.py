@@ -0,0 +1,19 @@
+"""
+Offline benchmarks for story classification.
+
+Usage:
+    poetry run pytest tests/benchmarks/test_bench_classify_stories.py
+"""
+
+import pytest
+
+from tests.benchmarks.synthetic import synthetic_stories
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("count", [10, 100, 1000])
+def test_classify_stories(benchmark, offline, count):
+    stories = synthetic_stories(count)
+    classified = offline.run(benchmark, offline.cronkite.classify_stories, stories)
+    assert all(story["topics"] for story in classified)
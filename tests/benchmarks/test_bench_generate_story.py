@@ -0,0 +1,72 @@
+"""
+Offline benchmarks for story generation.
+
+Usage:
+    poetry run pytest tests/benchmarks/test_bench_generate_story.py
+"""
+
+from dataclasses import replace
+
+import pytest
+
+from tests.benchmarks.conftest import STRUCTURED, Offline
+from tests.benchmarks.fake import FakeClient
+from tests.benchmarks.synthetic import load_cluster, synthetic_cluster
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("size", [10, 100, 1000])
+def test_generate_story(benchmark, offline, size):
+    articles = synthetic_cluster(size)
+    story = offline.run(benchmark, offline.cronkite.generate_story, articles)
+    assert story["title"]
+    assert len(story["article_ids"]) == size
+
+
+@pytest.mark.parametrize("size", [10, 100])
+def test_generate_story_stream(benchmark, offline, size):
+    articles = synthetic_cluster(size)
+    events = offline.run(benchmark, lambda a: list(offline.cronkite.generate_story_stream(a)), articles)
+    assert events[-1][0] == "story"
+
+
+@pytest.mark.parametrize("cluster_name", ["turkey_earthquake", "middle_east_conflict"])
+@pytest.mark.parametrize("prefilter", [False, True])
+def test_generate_story_prefilter(benchmark, offline, cluster_name, prefilter):
+    articles = load_cluster(cluster_name)
+    offline.cronkite.config = replace(STRUCTURED, prefilter_noise=prefilter)
+    story = offline.run(benchmark, offline.cronkite.generate_story, list(articles))
+    # The fake never marks noise, so all of it comes from the prefilter
+    assert bool(story["noise_article_ids"]) == prefilter
+    assert len(story["article_ids"]) + len(story["noise_article_ids"]) == len(articles)
+
+
+@pytest.mark.parametrize("size", [10, 100])
+@pytest.mark.parametrize("split", [False, True])
+def test_generate_story_execution(benchmark, size, split):
+    # Generation time dominates real calls, so the fake sleeps per
+    # completion token (scaled down 100x from ~50 tokens/s)
+    offline = Offline(FakeClient(latency=0.005, token_latency=0.0002))
+    offline.cronkite.config = replace(STRUCTURED, split_execution=split)
+    story = offline.run(benchmark, offline.cronkite.generate_story, synthetic_cluster(size))
+    assert story["title"]
+    assert len(story["article_ids"]) == size
+
+
+@pytest.mark.parametrize("routed", [False, True])
+def test_generate_story_routing(benchmark, routed):
+    offline = Offline(FakeClient(latency=0.005, token_latency=0.0002))
+    small = dict.fromkeys(["filter_noise", "extract_quotes", "resolve_location", "generate_substory"], "gpt-4o-mini")
+    offline.cronkite.config = replace(STRUCTURED, models=small if routed else {})
+    story = offline.run(benchmark, offline.cronkite.generate_story, synthetic_cluster(100))
+    assert story["title"]
+
+
+@pytest.mark.parametrize("resolve_location,gazetteer_location", [(True, False), (True, True), (False, True)])
+def test_generate_story_location(benchmark, offline, resolve_location, gazetteer_location):
+    offline.cronkite.config = replace(
+        STRUCTURED, resolve_location=resolve_location, gazetteer_location=gazetteer_location
+    )
+    story = offline.run(benchmark, offline.cronkite.generate_story, list(load_cluster("political_election")))
+    assert story["location"]["country"] == "USA"
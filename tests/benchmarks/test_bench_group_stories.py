@@ -0,0 +1,21 @@
+"""
+Offline benchmarks for story grouping.
+
+Usage:
+    poetry run pytest tests/benchmarks/test_bench_group_stories.py
+"""
+
+import pytest
+
+from tests.benchmarks.synthetic import synthetic_stories
+
+pytest.importorskip("pytest_benchmark")
+
+
+# 10 x 10 fits one call; larger groups go through TF-IDF shortlisting
+@pytest.mark.parametrize("count", [10, 100, 500])
+def test_group_stories(benchmark, offline, count):
+    group_a = synthetic_stories(count, seed=1)
+    group_b = synthetic_stories(count, seed=2)
+    links = offline.run(benchmark, offline.cronkite.group_stories, group_a, group_b)
+    assert all(0 <= link["group_a_index"] < count for link in links)
@@ -0,0 +1,85 @@
+"""
+Import-time benchmarks for cold starts.
+
+Each case runs in a fresh interpreter under `python -X importtime` and
+reports the cumulative import time of the cronkite package.
+
+Usage:
+    poetry run pytest tests/benchmarks/test_bench_import.py
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+SRC_DIR = Path(__file__).parent.parent.parent / "src"
+
+# Modules a bare import or construction must not load
+HEAVY_MODULES = ["openai", "dotenv", "httpx", "cronkite.llm", "cronkite.actions.generate_story"]
+
+# Modules only needed when the matching Cronkite option is used
+OPTIONAL_MODULES = ["cronkite.cache", "cronkite.cascade", "cronkite.metrics", "cronkite.scheduler"]
+
+
+def import_profile(code: str) -> dict:
+    """
+    Run code in a fresh interpreter with -X importtime.
+
+    Returns:
+        Dict with microseconds (cumulative import time of top-level cronkite
+        modules) and modules (loaded module names after code ran)
+    """
+    script = f"{code}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={"PYTHONPATH": str(SRC_DIR), "OPENAI_API_KEY": "sk-test"},
+    )
+    microseconds = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        # Only top-level entries, so nested imports aren't counted twice
+        if name.strip().startswith("cronkite") and not name.startswith("  "):
+            microseconds += int(cumulative)
+    return {"microseconds": microseconds, "modules": json.loads(result.stdout.splitlines()[-1])}
+
+
+def run(benchmark, code: str) -> dict:
+    profile = benchmark.pedantic(import_profile, args=(code,), rounds=5, iterations=1)
+    benchmark.extra_info["import_ms"] = profile["microseconds"] / 1000
+    return profile
+
+
+def test_import_cronkite(benchmark):
+    profile = run(benchmark, "import cronkite")
+    loaded = [name for name in HEAVY_MODULES if name in profile["modules"]]
+    assert loaded == []
+
+
+def test_import_cronkite_module(benchmark):
+    profile = run(benchmark, "import cronkite.cronkite")
+    loaded = [name for name in HEAVY_MODULES + OPTIONAL_MODULES if name in profile["modules"]]
+    assert loaded == []
+
+
+def test_construct_cronkite(benchmark):
+    profile = run(benchmark, "from cronkite import Cronkite\nCronkite()")
+    loaded = [name for name in HEAVY_MODULES if name in profile["modules"]]
+    assert loaded == []
+    # Every Cronkite gets a Scheduler; the other options stay unloaded
+    assert [name for name in OPTIONAL_MODULES if name in profile["modules"]] == ["cronkite.scheduler"]
+
+
+def test_import_classify_stories(benchmark):
+    profile = run(benchmark, "from cronkite.actions import classify_stories")
+    assert "cronkite.actions.generate_story" not in profile["modules"]
+    assert "dotenv" not in profile["modules"]
@@ -0,0 +1,40 @@
+"""
+Offline benchmarks for gazetteer lookups and local location resolution.
+
+Usage:
+    poetry run pytest tests/benchmarks/test_bench_locate.py
+"""
+
+import pytest
+
+from cronkite.gazetteer import DEFAULT_INDEX, Gazetteer, load_gazetteer
+from cronkite.locate import locate
+from tests.benchmarks.synthetic import load_cluster
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_gazetteer_open(benchmark):
+    gazetteer = benchmark(Gazetteer, DEFAULT_INDEX)
+    assert len(gazetteer) > 0
+
+
+@pytest.mark.parametrize("name,country", [("Kahramanmaraş", "TUR"), ("U.S.", "USA"), ("Côte d'Ivoire", "CIV")])
+def test_gazetteer_lookup(benchmark, name, country):
+    gazetteer = load_gazetteer()
+    places = benchmark(gazetteer.lookup, name)
+    assert places[0].country == country
+
+
+@pytest.mark.parametrize(
+    "cluster_name,expected",
+    [
+        ("turkey_earthquake", {"country": "TUR"}),
+        ("political_election", {"country": "USA", "region": "Pennsylvania"}),
+        ("tech_product_launch", {"country": "USA", "region": "California", "city": "Cupertino"}),
+    ],
+)
+def test_locate(benchmark, cluster_name, expected):
+    articles = list(load_cluster(cluster_name))
+    location = benchmark(locate, articles)
+    assert {field: location[field] for field in expected} == expected
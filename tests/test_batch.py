@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+"""
+Test script for Cronkite Batch API story generation.
+
+By default batches are run by a local batch endpoint that executes each
+request line through the regular chat completions API, so the batch
+plumbing can be exercised without waiting on the real Batch API.
+
+Usage:
+    python -m tests.test_batch <cluster_names...> [--model MODEL] [--remote]
+
+Examples:
+    python -m tests.test_batch middle_east_conflict tech_product_launch
+    python -m tests.test_batch --all --model gpt-4o-mini
+    python -m tests.test_batch --all --remote --poll-interval 60
+
+Available clusters:
+    Run with --list to see available clusters
+"""
+
+import argparse
+import itertools
+import json
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+from cronkite import Cronkite
+
+
+TEST_DATA_DIR = Path(__file__).parent / "test_data"
+TEST_OUTPUT_DIR = Path(__file__).parent / "test_output"
+
+
+class LocalBatchClient:
+    """
+    Batch endpoint that runs each request synchronously on a real client.
+
+    Implements the files.create/content and batches.create/retrieve calls
+    the batch backend makes; chat completions pass through to the client.
+    """
+
+    def __init__(self, client):
+        self.chat = client.chat
+        self._client = client
+        self._ids = itertools.count()
+        self._files: dict[str, str] = {}
+        self._batches: dict[str, SimpleNamespace] = {}
+        self.files = SimpleNamespace(create=self._create_file, content=self._file_content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._batches.get)
+
+    def _create_file(self, file, purpose):
+        file_id = f"file-{next(self._ids)}"
+        _, data = file
+        self._files[file_id] = data.read().decode("utf-8")
+        return SimpleNamespace(id=file_id)
+
+    def _file_content(self, file_id):
+        return SimpleNamespace(text=self._files[file_id])
+
+    def _create_batch(self, input_file_id, endpoint, completion_window):
+        output = []
+        for line in self._files[input_file_id].splitlines():
+            request = json.loads(line)
+            response = self._client.chat.completions.create(**request["body"])
+            output.append(json.dumps({
+                "custom_id": request["custom_id"],
+                "response": {"status_code": 200, "body": response.model_dump()},
+                "error": None,
+            }))
+
+        output_file_id = f"file-{next(self._ids)}"
+        self._files[output_file_id] = "\n".join(output)
+        batch = SimpleNamespace(
+            id=f"batch-{next(self._ids)}",
+            status="completed",
+            output_file_id=output_file_id,
+            error_file_id=None,
+        )
+        self._batches[batch.id] = batch
+        return batch
+
+
+def list_available_clusters() -> list[str]:
+    """List all available test clusters."""
+    return [f.stem for f in TEST_DATA_DIR.glob("*.json")]
+
+
+def load_cluster(cluster_name: str) -> list[dict]:
+    """Load articles from a test cluster file."""
+    cluster_path = TEST_DATA_DIR / f"{cluster_name}.json"
+    if not cluster_path.exists():
+        available = list_available_clusters()
+        raise FileNotFoundError(
+            f"Cluster '{cluster_name}' not found. "
+            f"Available clusters: {', '.join(available)}"
+        )
+
+    with open(cluster_path, "r") as f:
+        return json.load(f)
+
+
+def save_output(results: list[dict], model: str) -> Path:
+    """Save batch results to test output directory."""
+    TEST_OUTPUT_DIR.mkdir(exist_ok=True)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_filename = f"batch_api_{model}_{timestamp}.json"
+    output_path = TEST_OUTPUT_DIR / output_filename
+
+    output = {
+        "model": model,
+        "generated_at": datetime.now().isoformat(),
+        "results": results,
+    }
+
+    with open(output_path, "w") as f:
+        json.dump(output, f, indent=2)
+
+    return output_path
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate stories for several test article clusters through the Batch API"
+    )
+    parser.add_argument(
+        "clusters",
+        type=str,
+        nargs="*",
+        help="Names of clusters to process (without .json extension)",
+    )
+    parser.add_argument(
+        "--model",
+        type=str,
+        default="gpt-4o",
+        help="OpenAI model to use (default: gpt-4o)",
+    )
+    parser.add_argument(
+        "--remote",
+        action="store_true",
+        help="Submit to the real OpenAI Batch API instead of the local endpoint",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=30.0,
+        help="Seconds between batch status checks (default: 30)",
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List available clusters and exit",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Process all available clusters",
+    )
+
+    args = parser.parse_args()
+
+    if args.list:
+        clusters = list_available_clusters()
+        print("Available clusters:")
+        for cluster in clusters:
+            print(f"  - {cluster}")
+        return
+
+    cluster_names = args.clusters
+    if args.all:
+        cluster_names = list_available_clusters()
+
+    if not cluster_names:
+        parser.error("at least one cluster is required (use --list to see available, or --all)")
+
+    clusters = [load_cluster(name) for name in cluster_names]
+
+    print(f"Initializing Cronkite with model: {args.model}")
+    cronkite = Cronkite(model=args.model)
+    if not args.remote:
+        cronkite.llm.client = LocalBatchClient(cronkite.client)
+
+    endpoint = "OpenAI Batch API" if args.remote else "local batch endpoint"
+    print(f"Generating {len(clusters)} stories via {endpoint}...")
+    results = []
+    for result in cronkite.generate_stories_batch(clusters, poll_interval=args.poll_interval):
+        cluster_name = cluster_names[result.index]
+        if result.ok:
+            print(f"  [{cluster_name}] {result.story.get('title', 'No title')}")
+        else:
+            print(f"  [{cluster_name}] FAILED: {result.error}")
+        results.append({
+            "cluster_name": cluster_name,
+            "story": result.story,
+            "error": str(result.error) if result.error else None,
+        })
+    print(f"Stats: {cronkite.stats}")
+
+    output_path = save_output(results, args.model)
+    print(f"\nResults saved to: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,7 +19,7 @@ import json
 from datetime import datetime
 from pathlib import Path
 
-from cronkite import Cronkite
+from cronkite import Cronkite, load_env
 
 
 TEST_DATA_DIR = Path(__file__).parent / "test_data"
@@ -67,6 +67,7 @@ def save_output(cluster_names: list[str], classified_stories: list[dict], model:
 
 
 def main():
+    load_env()
     parser = argparse.ArgumentParser(
         description="Classify stories from test article clusters"
     )
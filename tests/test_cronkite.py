@@ -3,12 +3,13 @@
 Test script for Cronkite story generation.
 
 Usage:
-    python -m tests.test_cronkite <cluster_name> [--model MODEL]
+    python -m tests.test_cronkite <cluster_name> [--model MODEL] [--stream]
 
 Examples:
     python -m tests.test_cronkite middle_east_conflict
     python -m tests.test_cronkite tech_product_launch --model gpt-4o-mini
     python -m tests.test_cronkite political_election
+    python -m tests.test_cronkite political_election --stream
 
 Available clusters:
     - middle_east_conflict
@@ -18,10 +19,11 @@ Available clusters:
 
 import argparse
 import json
+import time
 from datetime import datetime
 from pathlib import Path
 
-from cronkite import Cronkite
+from cronkite import Cronkite, load_env
 
 
 TEST_DATA_DIR = Path(__file__).parent / "test_data"
@@ -69,6 +71,7 @@ def save_output(cluster_name: str, story: dict, model: str) -> Path:
 
 
 def main():
+    load_env()
     parser = argparse.ArgumentParser(
         description="Generate a story from a test article cluster"
     )
@@ -84,6 +87,11 @@ def main():
         default="gpt-4o",
         help="OpenAI model to use (default: gpt-4o)",
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream fields as they are produced and print their arrival times",
+    )
     parser.add_argument(
         "--list",
         action="store_true",
@@ -110,7 +118,18 @@ def main():
     cronkite = Cronkite(model=args.model)
 
     print("Generating story...")
-    story = cronkite.generate_story(articles)
+    if args.stream:
+        start = time.perf_counter()
+        for field, value in cronkite.generate_story_stream(articles):
+            elapsed = time.perf_counter() - start
+            if field == "story":
+                story = value
+            elif field == "sub_story":
+                print(f"  [{elapsed:.2f}s] sub_story: {value.get('title', '')}")
+            else:
+                print(f"  [{elapsed:.2f}s] {field}")
+    else:
+        story = cronkite.generate_story(articles)
 
     output_path = save_output(args.cluster, story, args.model)
     print(f"Story saved to: {output_path}\n")
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+"""
+Test script for Cronkite batch story generation.
+
+Usage:
+    python -m tests.test_generate_stories <cluster_names...> [--model MODEL] [--max-concurrency N]
+
+Examples:
+    python -m tests.test_generate_stories middle_east_conflict tech_product_launch
+    python -m tests.test_generate_stories --all --model gpt-4o-mini --max-concurrency 4
+
+Available clusters:
+    Run with --list to see available clusters
+"""
+
+import argparse
+import json
+from datetime import datetime
+from pathlib import Path
+
+from cronkite import Cronkite, load_env
+
+
+TEST_DATA_DIR = Path(__file__).parent / "test_data"
+TEST_OUTPUT_DIR = Path(__file__).parent / "test_output"
+
+
+def list_available_clusters() -> list[str]:
+    """List all available test clusters."""
+    return [f.stem for f in TEST_DATA_DIR.glob("*.json")]
+
+
+def load_cluster(cluster_name: str) -> list[dict]:
+    """Load articles from a test cluster file."""
+    cluster_path = TEST_DATA_DIR / f"{cluster_name}.json"
+    if not cluster_path.exists():
+        available = list_available_clusters()
+        raise FileNotFoundError(
+            f"Cluster '{cluster_name}' not found. "
+            f"Available clusters: {', '.join(available)}"
+        )
+
+    with open(cluster_path, "r") as f:
+        return json.load(f)
+
+
+def save_output(results: list[dict], model: str) -> Path:
+    """Save batch results to test output directory."""
+    TEST_OUTPUT_DIR.mkdir(exist_ok=True)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_filename = f"batch_{model}_{timestamp}.json"
+    output_path = TEST_OUTPUT_DIR / output_filename
+
+    output = {
+        "model": model,
+        "generated_at": datetime.now().isoformat(),
+        "results": results,
+    }
+
+    with open(output_path, "w") as f:
+        json.dump(output, f, indent=2)
+
+    return output_path
+
+
+def main():
+    load_env()
+    parser = argparse.ArgumentParser(
+        description="Generate stories for several test article clusters in parallel"
+    )
+    parser.add_argument(
+        "clusters",
+        type=str,
+        nargs="*",
+        help="Names of clusters to process (without .json extension)",
+    )
+    parser.add_argument(
+        "--model",
+        type=str,
+        default="gpt-4o",
+        help="OpenAI model to use (default: gpt-4o)",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=8,
+        help="Maximum number of clusters processed at once (default: 8)",
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List available clusters and exit",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Process all available clusters",
+    )
+
+    args = parser.parse_args()
+
+    if args.list:
+        clusters = list_available_clusters()
+        print("Available clusters:")
+        for cluster in clusters:
+            print(f"  - {cluster}")
+        return
+
+    cluster_names = args.clusters
+    if args.all:
+        cluster_names = list_available_clusters()
+
+    if not cluster_names:
+        parser.error("at least one cluster is required (use --list to see available, or --all)")
+
+    clusters = [load_cluster(name) for name in cluster_names]
+
+    print(f"Initializing Cronkite with model: {args.model}")
+    cronkite = Cronkite(model=args.model)
+
+    print(f"Generating {len(clusters)} stories (max concurrency {args.max_concurrency})...")
+    results = []
+    for result in cronkite.generate_stories(clusters, max_concurrency=args.max_concurrency):
+        cluster_name = cluster_names[result.index]
+        if result.ok:
+            print(f"  [{cluster_name}] {result.story.get('title', 'No title')} ({result.elapsed:.2f}s)")
+        else:
+            print(f"  [{cluster_name}] FAILED: {result.error} ({result.elapsed:.2f}s)")
+        results.append({
+            "cluster_name": cluster_name,
+            "elapsed": result.elapsed,
+            "story": result.story,
+            "error": str(result.error) if result.error else None,
+        })
+
+    output_path = save_output(results, args.model)
+    print(f"\nResults saved to: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
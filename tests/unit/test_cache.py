@@ -0,0 +1,103 @@
+"""
+Offline tests for the response caches.
+
+Usage:
+    poetry run pytest tests/unit/test_cache.py
+"""
+
+import pytest
+
+from cronkite import cache as cache_module
+from cronkite.cache import MemoryCache, ResponseCache, SQLiteCache, cache_key
+
+
+class Clock:
+    """Stand-in for time.time that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "time", clock)
+    return clock
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_cache(request, tmp_path):
+    def make(**options):
+        if request.param == "memory":
+            return MemoryCache(**options)
+        return SQLiteCache(tmp_path / "cache.db", **options)
+    return make
+
+
+def test_cache_key_stable():
+    # Keys address entries persisted by earlier runs, so they must never change
+    key = cache_key("gpt-4o", "Be terse.", "payload", {"type": "json_object"})
+    assert key == "6486c40d6ffc249985a13b1b2e2c11bba75d1ab2ddbb2a1a0719454edcb0b1ef"
+
+
+def test_cache_key_ignores_response_format_order():
+    schema = {"name": "story", "strict": True}
+    reordered = {"strict": True, "name": "story"}
+    assert cache_key("m", "i", "p", {"type": "json_schema", "json_schema": schema}) == cache_key(
+        "m", "i", "p", {"json_schema": reordered, "type": "json_schema"}
+    )
+    assert cache_key("m", "i", "p", {}) != cache_key("m", "i", "p2", {})
+
+
+def test_response_cache_is_abstract():
+    with pytest.raises(TypeError):
+        ResponseCache()
+
+
+def test_lru_eviction(make_cache, clock):
+    cache = make_cache(max_entries=2)
+    cache.set("a", "1")
+    clock.now += 1
+    cache.set("b", "2")
+    clock.now += 1
+    assert cache.get("a") == "1"
+    clock.now += 1
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+    assert len(cache) == 2
+
+
+def test_ttl_expiry(make_cache, clock):
+    cache = make_cache(ttl=60)
+    cache.set("a", "1")
+    clock.now += 59
+    assert cache.get("a") == "1"
+    clock.now += 2
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_stats(make_cache):
+    cache = make_cache()
+    cache.set("a", "1")
+    cache.get("a")
+    cache.get("b")
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+
+def test_sqlite_persists_across_connections(tmp_path):
+    path = tmp_path / "cache.db"
+    cache = SQLiteCache(path)
+    cache.set("a", '{"title": "Quake"}')
+    cache.close()
+
+    reopened = SQLiteCache(path)
+    assert reopened.get("a") == '{"title": "Quake"}'
+    reopened.clear()
+    assert len(reopened) == 0
+    reopened.close()
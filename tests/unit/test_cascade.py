@@ -0,0 +1,119 @@
+"""
+Offline tests for the model cascade's checks and escalation.
+
+Usage:
+    poetry run pytest tests/unit/test_cascade.py
+"""
+
+import json
+
+import pytest
+from openai.types.chat import ChatCompletion
+
+from cronkite import Cascade, CronkiteConfig
+from cronkite.actions.generate_story_cascade import generate_story_cascade
+from cronkite.cascade import check_story
+from cronkite.llm import LLMClient
+
+
+CONFIG = CronkiteConfig(generate_substories=False)
+
+ARTICLES = [
+    {"id": article_id, "title": "Flood", "summary": "", "text": "Rivers rose.", "source": "Wire", "published_at": None}
+    for article_id in "abcd"
+]
+
+GOOD = {
+    "title": "Floods swamp river towns",
+    "summary": "Rivers burst their banks after days of rain.",
+    "key_points": ["Rivers rose", "Towns flooded", "Residents left"],
+    "quotes": [{"text": "The water came fast.", "article_id": "a"}],
+    "location": None,
+    "sub_stories": [],
+    "article_ids": ["a", "b", "c", "d"],
+    "noise_article_ids": [],
+}
+
+
+@pytest.mark.parametrize(
+    "change,check",
+    [
+        ({"summary": ""}, "schema"),
+        ({"key_points": "Rivers rose"}, "schema"),
+        ({"quotes": [{"text": "The water came fast."}]}, "schema"),
+        ({"location": "Somewhere"}, "schema"),
+        ({"title": "Floods"}, "title_length"),
+        ({"title": "Floods swamp river towns across the whole of the north"}, "title_length"),
+        ({"key_points": ["Rivers rose"]}, "key_point_count"),
+        ({"quotes": [{"text": "The water came fast.", "article_id": "z"}]}, "quote_article_ids"),
+        ({"article_ids": ["a"], "noise_article_ids": ["b", "c", "d"]}, "noise_ratio"),
+    ],
+)
+def test_check_fails(change, check):
+    assert check_story({**GOOD, **change}, ARTICLES, CONFIG, Cascade()) == [check]
+
+
+def test_check_passes():
+    assert check_story(GOOD, ARTICLES, CONFIG, Cascade()) == []
+
+
+def test_check_accepts_story_without_kept_articles():
+    empty = {**GOOD, "title": "", "summary": "", "key_points": [], "quotes": [], "article_ids": []}
+    assert check_story(empty, [], CONFIG, Cascade()) == []
+    all_noise = {**empty, "noise_article_ids": ["a", "b", "c", "d"]}
+    assert check_story(all_noise, ARTICLES, CONFIG, Cascade()) == []
+
+
+class ModelClient:
+    """Answers with a fixed response per model and keeps the models called."""
+
+    def __init__(self, responses: dict[str, dict]):
+        self.responses = responses
+        self.chat = self
+        self.completions = self
+        self.models = []
+
+    def with_options(self, **options) -> "ModelClient":
+        return self
+
+    def create(self, **request):
+        self.models.append(request["model"])
+        content = json.dumps(self.responses[request["model"]])
+        return ChatCompletion.model_validate({
+            "id": "chatcmpl-scripted",
+            "object": "chat.completion",
+            "created": 0,
+            "model": request["model"],
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        })
+
+
+def _response(story: dict) -> dict:
+    return {key: story[key] for key in ("title", "summary", "key_points", "quotes", "location", "noise_article_ids")}
+
+
+@pytest.mark.parametrize(
+    "cheap,models,article_ids",
+    [
+        # A weak story is regenerated on the main model
+        ({**_response(GOOD), "title": "Floods"}, ["gpt-4o-mini", "gpt-4o"], GOOD["article_ids"]),
+        (_response(GOOD), ["gpt-4o-mini"], GOOD["article_ids"]),
+        # Everything is noise, so the main model has nothing to write about
+        ({"title": "", "summary": "", "noise_article_ids": ["a", "b", "c", "d"]}, ["gpt-4o-mini"], []),
+    ],
+)
+def test_escalation(cheap, models, article_ids):
+    client = ModelClient({"gpt-4o-mini": cheap, "gpt-4o": _response(GOOD)})
+    llm = LLMClient(client)
+    story = generate_story_cascade(llm, "gpt-4o", ARTICLES, CONFIG, Cascade())
+    assert client.models == models
+    assert llm.stats.get("cascade_escalations") == len(models) - 1
+    assert story["article_ids"] == article_ids
+
+
+def test_empty_cluster_not_escalated():
+    client = ModelClient({})
+    llm = LLMClient(client)
+    story = generate_story_cascade(llm, "gpt-4o", [], CONFIG, Cascade())
+    assert client.models == []
+    assert story["article_ids"] == [] and llm.stats.get("cascade_escalations") == 0
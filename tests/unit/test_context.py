@@ -0,0 +1,52 @@
+"""
+Offline tests that context (metric collectors, scheduling priority) reaches
+the worker threads actions fan out to.
+
+Usage:
+    poetry run pytest tests/unit/test_context.py
+"""
+
+from cronkite.actions.classify_stories import classify_stories
+from cronkite.actions.group_stories import group_stories
+from cronkite.llm import LLMClient
+from cronkite.metrics import collect_calls
+from cronkite.scheduler import Priority, current_priority, scheduling_priority
+from tests.benchmarks.fake import FakeClient
+from tests.benchmarks.synthetic import synthetic_stories
+
+
+class PriorityClient:
+    """FakeClient wrapper recording the scheduling priority of each call."""
+
+    def __init__(self):
+        self.client = FakeClient()
+        self.chat = self
+        self.completions = self
+        self.priorities = []
+
+    def with_options(self, **options) -> "PriorityClient":
+        return self
+
+    def create(self, **request):
+        self.priorities.append(current_priority())
+        return self.client.chat.completions.create(**request)
+
+
+def test_classify_chunks_keep_context():
+    client = PriorityClient()
+    llm = LLMClient(client)
+    with scheduling_priority(Priority.BATCH), collect_calls() as events:
+        classify_stories(llm, "gpt-4o-mini", synthetic_stories(120))
+    assert len(client.priorities) > 1
+    assert set(client.priorities) == {Priority.BATCH}
+    assert len(events) == len(client.priorities)
+
+
+def test_group_chunks_keep_context():
+    client = PriorityClient()
+    llm = LLMClient(client)
+    with scheduling_priority(Priority.BATCH), collect_calls() as events:
+        group_stories(llm, "gpt-4o-mini", synthetic_stories(50, seed=1), synthetic_stories(50, seed=2))
+    assert len(client.priorities) > 1
+    assert set(client.priorities) == {Priority.BATCH}
+    assert len(events) == len(client.priorities)
@@ -0,0 +1,68 @@
+"""
+Offline tests for near-duplicate collapsing.
+
+Usage:
+    poetry run pytest tests/unit/test_dedup.py
+"""
+
+from cronkite.dedup import collapse_duplicates, expand_story
+
+
+WIRE = (
+    "A magnitude 7.8 earthquake struck southern Turkey near the Syrian border early on Monday, "
+    "toppling apartment blocks in several cities and killing hundreds of people, officials said. "
+    "Rescue teams searched through the rubble in freezing temperatures as aftershocks shook the region "
+    "and hospitals struggled to treat the injured."
+)
+
+ARTICLES = [
+    {"id": "a1", "title": "Earthquake hits Turkey", "text": WIRE},
+    # Syndicated copy with a sentence added, so it is longer than the original
+    {"id": "a2", "title": "Earthquake hits Turkey", "text": WIRE + " More updates to follow."},
+    {
+        "id": "a3",
+        "title": "Central bank raises rates",
+        "text": (
+            "The central bank raised its benchmark interest rate by a quarter point on Wednesday, "
+            "citing persistent inflation in services and a tight labour market, and signalled that "
+            "further increases were possible if price pressures did not ease."
+        ),
+    },
+]
+
+
+def test_collapses_near_duplicates_only():
+    representatives, members = collapse_duplicates(ARTICLES)
+    assert [a["id"] for a in representatives] == ["a2", "a3"]
+    assert sorted(members["a2"]) == ["a1", "a2"]
+    assert members["a3"] == ["a3"]
+
+
+def test_distinct_articles_kept():
+    representatives, members = collapse_duplicates([ARTICLES[0], ARTICLES[2]])
+    assert [a["id"] for a in representatives] == ["a1", "a3"]
+    assert members == {"a1": ["a1"], "a3": ["a3"]}
+
+
+def test_empty_text_never_collapses():
+    articles = [{"id": "e1", "title": "", "text": ""}, {"id": "e2", "title": "", "text": ""}]
+    representatives, _ = collapse_duplicates(articles)
+    assert [a["id"] for a in representatives] == ["e1", "e2"]
+
+
+def test_expand_story_restores_members():
+    _, members = collapse_duplicates(ARTICLES)
+    story = {
+        "title": "Quake",
+        "article_ids": ["a2"],
+        "noise_article_ids": ["a3"],
+        "sub_stories": [{"theme": "Rescue", "article_ids": ["a2"]}],
+    }
+    expanded = expand_story(story, members)
+    assert sorted(expanded["article_ids"]) == ["a1", "a2"]
+    assert expanded["noise_article_ids"] == ["a3"]
+    assert sorted(expanded["sub_stories"][0]["article_ids"]) == ["a1", "a2"]
+    assert expanded["sub_stories"][0]["theme"] == "Rescue"
+    assert expanded["title"] == "Quake"
+    # The input story is left as it was
+    assert story["article_ids"] == ["a2"]
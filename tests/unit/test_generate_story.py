@@ -0,0 +1,45 @@
+"""
+Offline tests for story generation's call planning and response format.
+
+Usage:
+    poetry run pytest tests/unit/test_generate_story.py
+"""
+
+import asyncio
+
+import pytest
+
+from cronkite import AsyncCronkite, Cronkite, CronkiteConfig
+from cronkite.instruction_builder import JSON_OBJECT_FORMAT, build_response_format
+from tests.benchmarks.fake import AsyncFakeClient, FakeClient
+from tests.benchmarks.synthetic import synthetic_cluster
+
+
+COMPONENTS = [
+    "filter_noise", "group_articles", "generate_title", "generate_summary",
+    "generate_key_points", "extract_quotes", "resolve_location",
+]
+
+
+@pytest.mark.parametrize("split", [False, True])
+def test_no_components_enabled(split):
+    config = CronkiteConfig(split_execution=split, **dict.fromkeys(COMPONENTS, False))
+    articles = synthetic_cluster(5)
+    story = Cronkite(config=config, client=FakeClient()).generate_story(articles)
+    assert story["article_ids"] == [article["id"] for article in articles]
+    assert story["title"] == ""
+
+
+@pytest.mark.parametrize("split", [False, True])
+def test_no_components_enabled_async(split):
+    config = CronkiteConfig(split_execution=split, **dict.fromkeys(COMPONENTS, False))
+    articles = synthetic_cluster(5)
+    story = asyncio.run(AsyncCronkite(config=config, client=AsyncFakeClient()).generate_story(articles))
+    assert story["article_ids"] == [article["id"] for article in articles]
+
+
+def test_structured_outputs_opt_in():
+    assert build_response_format(CronkiteConfig()) == JSON_OBJECT_FORMAT
+    schema = build_response_format(CronkiteConfig(structured_outputs=True))["json_schema"]["schema"]
+    # Stories with no resolvable location need somewhere to go
+    assert "null" in schema["properties"]["location"]["type"]
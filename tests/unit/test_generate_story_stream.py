@@ -0,0 +1,101 @@
+"""
+Offline tests for streamed story generation.
+
+Usage:
+    poetry run pytest tests/unit/test_generate_story_stream.py
+"""
+
+import asyncio
+import json
+
+from openai.types.chat import ChatCompletion
+
+from cronkite import AsyncCronkite, Cronkite, CronkiteConfig
+from cronkite.replay import AsyncReplayClient, Recording, ReplayClient
+from tests.benchmarks.fake import AsyncFakeClient, FakeClient, fake_completion
+from tests.benchmarks.synthetic import load_cluster
+
+
+def _with_duplicates() -> list[dict]:
+    """A test cluster plus a syndicated copy of every article."""
+    articles = list(load_cluster("turkey_earthquake"))
+    return articles + [{**article, "id": article["id"] + "-wire"} for article in articles]
+
+
+def _check_sub_stories(events: list[tuple]) -> None:
+    streamed = [value for field, value in events if field == "sub_story"]
+    story = events[-1][1]
+    assert streamed
+    for sub_story in streamed:
+        assert any(article_id.endswith("-wire") for article_id in sub_story["article_ids"])
+    assert sorted(map(sorted, (s["article_ids"] for s in streamed))) == sorted(
+        map(sorted, (s["article_ids"] for s in story["sub_stories"]))
+    )
+
+
+def test_stream_expands_sub_stories():
+    cronkite = Cronkite(config=CronkiteConfig(collapse_duplicates=True, structured_outputs=True), client=FakeClient())
+    _check_sub_stories(list(cronkite.generate_story_stream(_with_duplicates())))
+
+
+def test_stream_async_expands_sub_stories():
+    cronkite = AsyncCronkite(config=CronkiteConfig(collapse_duplicates=True, structured_outputs=True), client=AsyncFakeClient())
+
+    async def collect():
+        return [event async for event in cronkite.generate_story_stream(_with_duplicates())]
+
+    _check_sub_stories(asyncio.run(collect()))
+
+
+class NoiseLastClient:
+    """Answers like FakeClient, but the story call marks one article noise after its subgroups."""
+
+    def __init__(self, noise_id: str):
+        self.noise_id = noise_id
+        self.chat = self
+        self.completions = self
+
+    def create(self, **request):
+        response = fake_completion(request)
+        message = response["choices"][0]["message"]
+        content = json.loads(message["content"])
+        if "subgroups" in content:
+            content.pop("noise_article_ids", None)
+            content["noise_article_ids"] = [self.noise_id]
+            message["content"] = json.dumps(content)
+        return ChatCompletion.model_validate(response)
+
+
+class AsyncNoiseLastClient(NoiseLastClient):
+    async def create(self, **request):
+        return super().create(**request)
+
+
+# Sub-stories must wait for noise IDs the model emits after subgroups
+NOISE_LAST_CONFIG = CronkiteConfig(structured_outputs=True)
+
+
+def _check_noise_excluded(events: list[tuple], noise_id: str) -> None:
+    streamed = [value for field, value in events if field == "sub_story"]
+    story = events[-1][1]
+    assert streamed and story["noise_article_ids"] == [noise_id]
+    for sub_story in streamed + story["sub_stories"]:
+        assert noise_id not in sub_story["article_ids"]
+
+
+def test_stream_waits_for_noise_after_subgroups():
+    articles = load_cluster("turkey_earthquake")
+    client = ReplayClient(Recording(), client=NoiseLastClient(articles[0]["id"]))
+    cronkite = Cronkite(config=NOISE_LAST_CONFIG, client=client)
+    _check_noise_excluded(list(cronkite.generate_story_stream(articles)), articles[0]["id"])
+
+
+def test_stream_async_waits_for_noise_after_subgroups():
+    articles = load_cluster("turkey_earthquake")
+    client = AsyncReplayClient(Recording(), client=AsyncNoiseLastClient(articles[0]["id"]))
+    cronkite = AsyncCronkite(config=NOISE_LAST_CONFIG, client=client)
+
+    async def collect():
+        return [event async for event in cronkite.generate_story_stream(articles)]
+
+    _check_noise_excluded(asyncio.run(collect()), articles[0]["id"])
@@ -0,0 +1,39 @@
+"""
+Offline tests for story grouping.
+
+Usage:
+    poetry run pytest tests/unit/test_group_stories.py
+"""
+
+import asyncio
+
+from cronkite.actions.group_stories import PREFILTER_MAX_PAIRS, group_stories, group_stories_async
+from cronkite.llm import AsyncLLMClient, LLMClient
+from tests.benchmarks.fake import AsyncFakeClient, FakeClient
+from tests.benchmarks.synthetic import synthetic_stories
+
+
+UNRELATED = {"title": "zzzz qqqq", "summary": "", "key_points": [], "article_ids": ["z"], "noise_article_ids": []}
+
+
+def _groups() -> tuple[list[dict], list[dict]]:
+    """New stories (one unrelated to anything) against existing ones, past the prefilter limit."""
+    group_a = synthetic_stories(25, seed=1) + [UNRELATED]
+    group_b = synthetic_stories(20, seed=2)
+    assert len(group_a) * len(group_b) > PREFILTER_MAX_PAIRS
+    return group_a, group_b
+
+
+def test_story_without_candidates():
+    group_a, group_b = _groups()
+    llm = LLMClient(FakeClient())
+    links = group_stories(llm, "gpt-4o-mini", group_a, group_b, structured_outputs=True)
+    assert links
+    assert all(link["group_a_index"] != len(group_a) - 1 for link in links)
+    assert llm.stats.get("group_pairs_shortlisted") < len(group_a) * len(group_b)
+
+
+def test_story_without_candidates_async():
+    group_a, group_b = _groups()
+    links = asyncio.run(group_stories_async(AsyncLLMClient(AsyncFakeClient()), "gpt-4o-mini", group_a, group_b, structured_outputs=True))
+    assert all(link["group_a_index"] != len(group_a) - 1 for link in links)
@@ -0,0 +1,73 @@
+"""
+Offline tests for LLMClient's response caching.
+
+Usage:
+    poetry run pytest tests/unit/test_llm.py
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from cronkite.cache import MemoryCache
+from cronkite.instruction_builder import JSON_OBJECT_FORMAT
+from cronkite.llm import AsyncLLMClient, LLMClient, build_messages
+from cronkite.replay import AsyncReplayClient, Recording, ReplayClient, request_key
+
+
+def _recording(content: str) -> Recording:
+    """A recording answering the test request with content."""
+    request = {"model": "gpt-4o", "messages": build_messages("Be terse.", "payload"), "response_format": JSON_OBJECT_FORMAT}
+    recording = Recording()
+    recording.add(request_key(request), request, {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4o",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+    })
+    return recording
+
+
+def test_complete_json_caches_valid_json():
+    cache = MemoryCache()
+    llm = LLMClient(ReplayClient(_recording('{"title": "Quake"}')), cache=cache)
+    assert llm.complete_json("gpt-4o", "Be terse.", "payload") == {"title": "Quake"}
+    assert len(cache) == 1
+
+
+def test_complete_json_does_not_cache_invalid_json():
+    cache = MemoryCache()
+    llm = LLMClient(ReplayClient(_recording('{"title": "Qua')), cache=cache)
+    with pytest.raises(json.JSONDecodeError):
+        llm.complete_json("gpt-4o", "Be terse.", "payload")
+    assert len(cache) == 0
+
+
+def test_stream_json_does_not_cache_invalid_json():
+    cache = MemoryCache()
+    llm = LLMClient(ReplayClient(_recording('{"title": "Quake", "summary": "trunc')), cache=cache)
+    fields = list(llm.stream_json("gpt-4o", "Be terse.", "payload"))
+    assert fields == [("title", "Quake")]
+    assert len(cache) == 0
+
+
+def test_async_complete_json_does_not_cache_invalid_json():
+    cache = MemoryCache()
+    llm = AsyncLLMClient(AsyncReplayClient(_recording("not json")), cache=cache)
+    with pytest.raises(json.JSONDecodeError):
+        asyncio.run(llm.complete_json("gpt-4o", "Be terse.", "payload"))
+    assert len(cache) == 0
+
+
+def test_async_stream_json_does_not_cache_invalid_json():
+    cache = MemoryCache()
+    llm = AsyncLLMClient(AsyncReplayClient(_recording('{"title": "Quake", "summary": "trunc')), cache=cache)
+
+    async def collect():
+        return [field async for field in llm.stream_json("gpt-4o", "Be terse.", "payload")]
+
+    assert asyncio.run(collect()) == [("title", "Quake")]
+    assert len(cache) == 0
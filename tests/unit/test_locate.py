@@ -0,0 +1,79 @@
+"""
+Offline tests for the gazetteer and local location resolution.
+
+Usage:
+    poetry run pytest tests/unit/test_locate.py
+"""
+
+import pytest
+
+from cronkite.gazetteer import DEFAULT_INDEX, DEFAULT_SOURCE, build_index, load_gazetteer, normalize, read_source
+from cronkite.locate import find_mentions, locate, validate_location
+
+
+@pytest.fixture(scope="module")
+def gazetteer():
+    return load_gazetteer()
+
+
+def test_gazetteer_index_current(tmp_path):
+    # The bundled index must be rebuilt (python -m cronkite.gazetteer)
+    # whenever the source changes
+    path = tmp_path / "gazetteer.idx"
+    build_index(read_source(DEFAULT_SOURCE), path)
+    assert path.read_bytes() == DEFAULT_INDEX.read_bytes()
+
+
+@pytest.mark.parametrize(
+    "name,key",
+    [("U.S.", "us"), ("US", "us"), ("Kahramanmaraş", "kahramanmaras"), ("Côte d'Ivoire", "cote divoire")],
+)
+def test_normalize(name, key):
+    assert normalize(name) == key
+
+
+def test_lookup_folds_accents(gazetteer):
+    assert [place.country for place in gazetteer.lookup("Kahramanmaras")] == ["TUR", "TUR"]
+    assert gazetteer.country("U.S.").country == "USA"
+    assert gazetteer.country("usa").name == "United States"
+
+
+def test_find_mentions_longest_match(gazetteer):
+    mentions = find_mentions("Crowds gathered in New York City and across New York State.", gazetteer)
+    assert [[place.name for place in candidates] for candidates in mentions] == [["New York City"], ["New York"]]
+    assert mentions[1][0].kind == "region"
+
+
+def test_find_mentions_skips_lowercase_and_codes(gazetteer):
+    # "TUR" is only a country code, and lowercase words are never names
+    assert find_mentions("the georgia peach and TUR statistics", gazetteer) == []
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("Storms hit Atlanta overnight. Georgia officials declared an emergency.", {"country": "USA", "region": "Georgia"}),
+        ("Protests filled Tbilisi. Georgia's parliament met late into the night.", {"country": "GEO", "region": None}),
+    ],
+)
+def test_georgia_disambiguated_by_country_support(gazetteer, text, expected):
+    location = locate([{"title": "", "summary": "", "text": text}], gazetteer)
+    assert {key: location[key] for key in expected} == expected
+
+
+def test_validate_location_normalizes(gazetteer):
+    location = validate_location({"country": "U.S.", "region": None, "city": "nyc"}, [], gazetteer)
+    assert location == {"country": "USA", "region": "New York", "city": "New York City"}
+
+
+def test_validate_location_keeps_unknown_names(gazetteer):
+    location = validate_location({"country": "Türkiye", "region": "hatay", "city": "Nurdağı"}, [], gazetteer)
+    assert location == {"country": "TUR", "region": "Hatay", "city": "Nurdağı"}
+
+
+@pytest.mark.parametrize("country", ["Narnia", "", None, "Atlanta"])
+def test_validate_location_falls_back_to_articles(gazetteer, country):
+    articles = [{"title": "Earthquake in Kahramanmaraş", "summary": "", "text": ""}]
+    location = validate_location({"country": country, "region": None, "city": None}, articles, gazetteer)
+    assert location == locate(articles, gazetteer)
+    assert location["country"] == "TUR"
@@ -0,0 +1,115 @@
+"""
+Offline tests for incremental story updates.
+
+Usage:
+    poetry run pytest tests/unit/test_update_story.py
+"""
+
+import json
+
+from openai.types.chat import ChatCompletion
+
+from cronkite import CronkiteConfig
+from cronkite.actions.update_story import update_story
+from cronkite.llm import LLMClient
+from tests.benchmarks.synthetic import load_cluster
+
+
+class ScriptedClient:
+    """Answers every call with the same response and keeps the payloads sent."""
+
+    def __init__(self, response: dict):
+        self.content = json.dumps(response)
+        self.chat = self
+        self.completions = self
+        self.payloads = []
+
+    def with_options(self, **options) -> "ScriptedClient":
+        return self
+
+    def create(self, **request):
+        self.payloads.append(json.loads(request["messages"][-1]["content"]))
+        return ChatCompletion.model_validate({
+            "id": "chatcmpl-scripted",
+            "object": "chat.completion",
+            "created": 0,
+            "model": request["model"],
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": self.content}, "finish_reason": "stop"}],
+        })
+
+
+def _article(article_id: str, text: str = "Rescuers searched collapsed buildings overnight.") -> dict:
+    return {
+        "id": article_id,
+        "title": f"Update {article_id}",
+        "summary": "Rescue work continued.",
+        "text": text,
+        "source": "Wire",
+        "published_at": "2023-02-07T12:00:00Z",
+    }
+
+
+STORY = {
+    "title": "Earthquake",
+    "summary": "A strong earthquake struck.",
+    "key_points": [],
+    "quotes": [],
+    "location": None,
+    "sub_stories": [],
+    "article_ids": ["a", "b", "c"],
+    "noise_article_ids": ["n"],
+    "_meta": {"calls": 1},
+}
+
+CONFIG = CronkiteConfig(generate_substories=False)
+
+
+def test_merges_noise_and_article_ids():
+    # b changed and is now noise, n was noise and now belongs, d is new;
+    # the model's verdict on a is ignored as a is not in the delta
+    client = ScriptedClient({"title": "Earthquake update", "noise_article_ids": ["b", "a"]})
+    updated = update_story(LLMClient(client), "gpt-4o", STORY, [_article("b"), _article("n"), _article("d")], CONFIG)
+    assert updated["article_ids"] == ["a", "c", "n", "d"]
+    assert updated["noise_article_ids"] == ["b"]
+    assert updated["title"] == "Earthquake update"
+    assert [a["id"] for a in client.payloads[0]["articles"]] == ["b", "n", "d"]
+
+
+def test_drops_previous_meta():
+    client = ScriptedClient({"noise_article_ids": []})
+    updated = update_story(LLMClient(client), "gpt-4o", STORY, [_article("d")], CONFIG)
+    assert "_meta" not in updated
+    assert "_meta" not in update_story(LLMClient(client), "gpt-4o", STORY, [], CONFIG)
+
+
+def test_applies_token_budget():
+    articles = [dict(article, id=f"d{i}") for i, article in enumerate(load_cluster("turkey_earthquake"))]
+    unbudgeted, budgeted = ScriptedClient({}), ScriptedClient({})
+    update_story(LLMClient(unbudgeted), "gpt-4o", STORY, articles, CONFIG)
+    llm = LLMClient(budgeted)
+    update_story(llm, "gpt-4o", STORY, articles, CronkiteConfig(generate_substories=False, article_token_budget=2000))
+    assert len(json.dumps(budgeted.payloads[0])) < len(json.dumps(unbudgeted.payloads[0]))
+    assert llm.stats.get("tokens_saved") > 0
+
+
+def test_collapses_duplicate_delta_articles():
+    wire = "A magnitude 7.8 earthquake struck southern Turkey early on Monday, toppling buildings across the region. " * 3
+    client = ScriptedClient({"noise_article_ids": ["d3", "d2"]})
+    config = CronkiteConfig(generate_substories=False, collapse_duplicates=True)
+    updated = update_story(
+        LLMClient(client), "gpt-4o", STORY, [_article("d1", wire), _article("d2", wire), _article("d3", wire + " More.")],
+        config,
+    )
+    # Only the longest copy is sent, and the model's noise verdict on it
+    # covers the copies it stands for
+    assert [a["id"] for a in client.payloads[0]["articles"]] == ["d3"]
+    assert updated["article_ids"] == ["a", "b", "c"]
+    assert updated["noise_article_ids"] == ["n", "d1", "d2", "d3"]
+
+
+def test_ignores_verdicts_on_collapsed_copies():
+    wire = "A magnitude 7.8 earthquake struck southern Turkey early on Monday, toppling buildings across the region. " * 3
+    client = ScriptedClient({"noise_article_ids": ["d1"]})
+    config = CronkiteConfig(generate_substories=False, collapse_duplicates=True)
+    updated = update_story(LLMClient(client), "gpt-4o", STORY, [_article("d1", wire), _article("d2", wire + " More.")], config)
+    assert updated["article_ids"] == ["a", "b", "c", "d1", "d2"]
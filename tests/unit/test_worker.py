@@ -0,0 +1,170 @@
+"""
+Offline tests for the job queue and worker.
+
+Usage:
+    poetry run pytest tests/unit/test_worker.py
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from cronkite.worker import JobQueue, QueueFull, ResultStore, SQLiteQueue, SQLiteResultStore, Worker
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = SQLiteQueue(tmp_path / "jobs.sqlite", max_pending=2)
+    yield queue
+    queue.close()
+
+
+def test_max_pending(queue):
+    queue.put("generate_story", {"articles": []}, "a")
+    queue.put("generate_story", {"articles": []}, "b")
+    with pytest.raises(QueueFull):
+        queue.put("generate_story", {"articles": []}, "c")
+    # Claimed jobs no longer count against the limit
+    queue.claim(1, lease=60)
+    queue.put("generate_story", {"articles": []}, "c")
+    assert queue.counts()["queued"] == 2
+
+
+def _reclaimed(queue) -> tuple:
+    """A job claimed by a worker that lost its lease, and the claim that replaced it."""
+    queue.put("generate_story", {"articles": []}, "a")
+    [stale] = queue.claim(1, lease=0.01)
+    time.sleep(0.02)
+    [current] = queue.claim(1, lease=60)
+    return stale, current
+
+
+def test_stale_complete_loses(queue):
+    stale, current = _reclaimed(queue)
+    assert not queue.complete(stale.id, stale.attempts)
+    assert not queue.fail(stale.id, stale.attempts, "RuntimeError: late", retry=True)
+    assert queue.counts()["running"] == 1
+    # The current owner's writes still apply, and only once
+    assert queue.complete(current.id, current.attempts)
+    assert not queue.complete(current.id, current.attempts)
+    assert queue.counts()["done"] == 1
+
+
+def test_put_existing_id_when_full(queue):
+    queue.put("generate_story", {"articles": []}, "a")
+    queue.put("generate_story", {"articles": []}, "b")
+    assert queue.put("generate_story", {"articles": []}, "a") == "a"
+    assert queue.counts()["queued"] == 2
+
+
+class StubCronkite:
+    """Stands in for Cronkite, recording calls and optionally failing or blocking."""
+
+    def __init__(self, error: Exception | None = None, gate: threading.Event | None = None):
+        self.error = error
+        self.gate = gate
+        self.started = threading.Event()
+        self.calls = []
+
+    def generate_story(self, articles: list[dict]) -> dict:
+        self.calls.append(articles)
+        self.started.set()
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.error is not None:
+            raise self.error
+        return {"title": "Story", "article_ids": [article["id"] for article in articles]}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteResultStore(tmp_path / "jobs.sqlite")
+    yield store
+    store.close()
+
+
+def _worker(cronkite, queue, store, **options) -> Worker:
+    return Worker(cronkite, queue, store, poll_interval=0.01, **options)
+
+
+def test_result_store_first_result_wins(store):
+    assert store.put("a", {"title": "First"})
+    assert not store.put("a", {"title": "Second"})
+    assert store.get("a") == {"title": "First"}
+    assert "a" in store and "b" not in store
+
+
+def test_resumes_job_after_lease_expires(queue, store):
+    queue.put("generate_story", {"articles": [{"id": "x"}]}, "a")
+    # A worker claims the job and dies without renewing its lease
+    assert [job.id for job in queue.claim(1, lease=0.01)] == ["a"]
+    assert queue.claim(1, lease=60) == []
+    time.sleep(0.02)
+
+    cronkite = StubCronkite()
+    worker = _worker(cronkite, queue, store)
+    worker.run(max_jobs=1)
+    assert store.get("a") == {"title": "Story", "article_ids": ["x"]}
+    assert queue.counts()["done"] == 1
+    assert worker.processed == 1
+
+
+def test_retries_then_fails(queue, store):
+    queue.put("generate_story", {"articles": []}, "a")
+    cronkite = StubCronkite(error=RuntimeError("model down"))
+    worker = _worker(cronkite, queue, store, max_attempts=2)
+    worker.run(max_jobs=1)
+    assert len(cronkite.calls) == 2
+    assert queue.counts()["failed"] == 1
+    assert worker.failed == 1 and worker.processed == 0
+    assert store.get("a") is None
+
+
+def test_skips_job_with_stored_result(queue, store):
+    # The job's previous worker stored its result, then died before completing it
+    queue.put("generate_story", {"articles": []}, "a")
+    store.put("a", {"title": "Earlier"})
+    cronkite = StubCronkite()
+    _worker(cronkite, queue, store).run(max_jobs=1)
+    assert cronkite.calls == []
+    assert store.get("a") == {"title": "Earlier"}
+    assert queue.counts()["done"] == 1
+
+
+def test_stop_finishes_in_flight_jobs(queue, store):
+    gate = threading.Event()
+    cronkite = StubCronkite(gate=gate)
+    worker = _worker(cronkite, queue, store, max_concurrency=1)
+    queue.put("generate_story", {"articles": []}, "a")
+    thread = threading.Thread(target=worker.run)
+    thread.start()
+    assert cronkite.started.wait(5)
+
+    worker.stop()
+    queue.put("generate_story", {"articles": []}, "b")
+    gate.set()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert store.get("a") is not None
+    assert queue.counts() == {"queued": 1, "running": 0, "done": 1, "failed": 0}
+
+
+def test_bases_are_abstract():
+    with pytest.raises(TypeError):
+        JobQueue()
+    with pytest.raises(TypeError):
+        ResultStore()
+
+
+def test_worker_counts_stale_finish(queue, store):
+    stale, current = _reclaimed(queue)
+    worker = _worker(StubCronkite(), queue, store)
+    future = Future()
+    future.set_result({"title": "Late"})
+    worker._finish(stale, future)
+    assert worker.stale == 1 and worker.processed == 0
+    assert queue.counts()["running"] == 1
+    # The late result is kept, as the first one stored
+    assert store.get("a") == {"title": "Late"}